@@ -0,0 +1,366 @@
+import base64
+import binascii
+import json
+from functools import wraps
+
+from django.contrib.auth import authenticate
+from django.db import transaction
+from django.forms import model_to_dict, modelform_factory
+from django.http import JsonResponse
+from django.middleware.csrf import CsrfViewMiddleware
+from django.views.decorators.csrf import csrf_exempt
+from users.models import CustomUser
+
+from .filters import BugFilter
+from .forms import BugFormDeveloper, BugFormManager
+from .models import Bug
+from .pagination import CursorPaginator, InvalidCursor
+from .search import get_backend
+
+API_FIELDS = (
+    "id",
+    "title",
+    "severity",
+    "status",
+    "description",
+    "bug_created",
+    "bug_creator",
+    "assignee",
+)
+RELATED_FIELDS = ("bug_creator", "assignee")
+ORDERINGS = ("id", "title", "severity", "bug_created")
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+MAX_BULK_SIZE = 5000
+
+
+class ApiError(Exception):
+    def __init__(self, message, status=400, **extra):
+        super().__init__(message)
+        self.status = status
+        self.extra = extra
+
+    def response(self):
+        return JsonResponse({"error": str(self), **self.extra}, status=self.status)
+
+
+def basic_auth_user(request):
+    header = request.META.get("HTTP_AUTHORIZATION", "")
+    scheme, _, credentials = header.partition(" ")
+
+    if scheme.lower() != "basic" or not credentials:
+        return None
+
+    try:
+        email, _, password = (
+            base64.b64decode(credentials, validate=True).decode().partition(":")
+        )
+    except (binascii.Error, UnicodeDecodeError):
+        return None
+
+    return authenticate(request, username=email, password=password)
+
+
+def api_view(methods):
+    """
+    Wrap a JSON API view, authenticating with HTTP basic auth or the session.
+
+    Basic auth requests don't carry ambient credentials so they skip the CSRF
+    check, session authenticated requests are still checked.
+    """
+
+    def decorator(view):
+        @csrf_exempt
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            user = basic_auth_user(request)
+
+            if user is not None:
+                request.user = user
+            elif not request.user.is_authenticated:
+                response = JsonResponse(
+                    {"error": "Authentication credentials were not provided"},
+                    status=401,
+                )
+                response["WWW-Authenticate"] = 'Basic realm="api"'
+                return response
+            elif CsrfViewMiddleware(lambda request: None).process_view(
+                request, None, (), {}
+            ):
+                return JsonResponse({"error": "CSRF verification failed"}, status=403)
+
+            if request.method not in methods:
+                return JsonResponse(
+                    {"error": "Method {} not allowed".format(request.method)},
+                    status=405,
+                )
+
+            try:
+                return view(request, *args, **kwargs)
+            except ApiError as e:
+                return e.response()
+
+        return wrapper
+
+    return decorator
+
+
+def form_class_for(user):
+    if user.is_manager:
+        return BugFormManager
+    else:
+        return BugFormDeveloper
+
+
+def parse_body(request):
+    try:
+        return json.loads(request.body)
+    except ValueError:
+        raise ApiError("Request body is not valid JSON")
+
+
+def parse_object(request):
+    data = parse_body(request)
+
+    if not isinstance(data, dict):
+        raise ApiError("Request body must be an object")
+
+    return data
+
+
+def parse_fields(request):
+    fields = request.GET.get("fields")
+
+    if not fields:
+        return API_FIELDS
+
+    fields = tuple(field.strip() for field in fields.split(",") if field.strip())
+    unknown = set(fields) - set(API_FIELDS)
+
+    if unknown:
+        raise ApiError("Unknown fields: {}".format(", ".join(sorted(unknown))))
+
+    return fields
+
+
+def serialize(bug, fields):
+    data = {}
+
+    for field in fields:
+        if field in RELATED_FIELDS:
+            data[field] = getattr(bug, field + "_id")
+        else:
+            data[field] = getattr(bug, field)
+
+    return data
+
+
+def get_bug(request, id, fields=API_FIELDS):
+    bug = Bug.objects.only(*fields).visible_to(request.user).filter(id=id).first()
+
+    if bug is None:
+        raise ApiError("Bug not found", status=404)
+
+    return bug
+
+
+def is_id(value):
+    # bool is a subclass of int but true isn't an id.
+    return value is None or (isinstance(value, int) and not isinstance(value, bool))
+
+
+def save_form(form, user):
+    if not form.is_valid():
+        raise ApiError("Invalid bug", errors=form.errors.get_json_data())
+
+    if form.instance.pk is None:
+        form.instance.bug_creator = user
+
+    return form.save()
+
+
+@api_view(["GET", "POST"])
+def bug_collection(request):
+    if request.method == "POST":
+        form = form_class_for(request.user)(data=parse_object(request))
+        bug = save_form(form, request.user)
+
+        return JsonResponse(serialize(bug, API_FIELDS), status=201)
+
+    fields = parse_fields(request)
+    ordering = request.GET.get("order_by", "id")
+
+    if ordering.lstrip("-") not in ORDERINGS:
+        raise ApiError("Unsupported ordering {}".format(ordering))
+
+    try:
+        page_size = min(int(request.GET.get("limit", DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+    except ValueError:
+        raise ApiError("limit must be an integer")
+
+    # Cursors need the ordering column even when it wasn't asked for.
+    columns = {*fields, "id", ordering.lstrip("-")}
+    queryset = Bug.objects.only(*columns).visible_to(request.user)
+    queryset = BugFilter(request.GET).apply(queryset)
+
+    paginator = CursorPaginator(queryset, max(page_size, 1), ordering=ordering)
+
+    try:
+        page = paginator.page(request.GET.get("cursor"))
+    except InvalidCursor as e:
+        raise ApiError(str(e))
+
+    return JsonResponse(
+        {
+            "results": [serialize(bug, fields) for bug in page],
+            "next": page.next_cursor,
+            "previous": page.previous_cursor,
+        }
+    )
+
+
+@api_view(["GET", "PATCH", "PUT"])
+def bug_item(request, id):
+    if request.method == "GET":
+        fields = parse_fields(request)
+
+        return JsonResponse(serialize(get_bug(request, id, {*fields, "id"}), fields))
+
+    bug = get_bug(request, id)
+    form_class = form_class_for(request.user)
+
+    data = model_to_dict(bug, fields=form_class.base_fields)
+    data.update(parse_object(request))
+
+    bug = save_form(form_class(data=data, instance=bug), request.user)
+
+    return JsonResponse(serialize(bug, API_FIELDS))
+
+
+@api_view(["POST"])
+def bug_close(request, id):
+    bug = get_bug(request, id)
+    bug.close()
+
+    return JsonResponse(serialize(bug, API_FIELDS))
+
+
+@api_view(["POST"])
+def bug_bulk(request):
+    """
+    Create and update many bugs in one transaction.
+
+    The body is a list of bug objects, objects with an ``id`` update that bug
+    and the rest, or those with a null ``id``, are created. Every object is
+    validated with the same form as the HTML views before anything is
+    written, assignees are resolved with a single query instead of one per
+    object.
+    """
+    items = parse_body(request)
+
+    if not isinstance(items, list) or not all(isinstance(i, dict) for i in items):
+        raise ApiError("Request body must be a list of objects")
+    if len(items) > MAX_BULK_SIZE:
+        raise ApiError("At most {} objects per request".format(MAX_BULK_SIZE))
+
+    role_form = form_class_for(request.user)
+    can_assign = "assignee" in role_form.base_fields
+    form_class = modelform_factory(
+        Bug, form=role_form, exclude=(*role_form._meta.exclude, "assignee")
+    )
+
+    # The ids are looked up in sets and dicts, reject anything unhashable or
+    # otherwise not an id, and repeated ids, before any query.
+    id_fields = ("id", "assignee") if can_assign else ("id",)
+    seen, errors = set(), {}
+
+    for index, item in enumerate(items):
+        invalid = {
+            field: [{"message": "Must be an integer or null", "code": "invalid"}]
+            for field in id_fields
+            if not is_id(item.get(field))
+        }
+
+        if "id" not in invalid and item.get("id") is not None:
+            if item["id"] in seen:
+                invalid["id"] = [{"message": "Repeated id", "code": "duplicate"}]
+
+            seen.add(item["id"])
+
+        if invalid:
+            errors[index] = invalid
+
+    if errors:
+        raise ApiError("Invalid bugs", errors=errors)
+
+    ids = [item["id"] for item in items if item.get("id") is not None]
+    existing = Bug.objects.visible_to(request.user).in_bulk(ids)
+
+    assignees = set()
+    if can_assign:
+        requested = {item.get("assignee") for item in items} - {None}
+        assignees = set(
+            CustomUser.objects.filter(id__in=requested).values_list("id", flat=True)
+        )
+
+    created, updated = [], []
+
+    for index, item in enumerate(items):
+        instance = None
+
+        if item.get("id") is not None:
+            instance = existing.get(item["id"])
+
+            if instance is None:
+                errors[index] = {"id": [{"message": "Bug not found", "code": "404"}]}
+                continue
+
+        data = (
+            model_to_dict(instance, fields=form_class.base_fields) if instance else {}
+        )
+        data.update(item)
+        form = form_class(data=data, instance=instance)
+
+        if not form.is_valid():
+            errors[index] = form.errors.get_json_data()
+            continue
+
+        bug = form.save(commit=False)
+
+        if can_assign and "assignee" in item:
+            if item["assignee"] is not None and item["assignee"] not in assignees:
+                errors[index] = {
+                    "assignee": [{"message": "User not found", "code": "invalid"}]
+                }
+                continue
+
+            bug.assignee_id = item["assignee"]
+
+        if instance is None:
+            bug.bug_creator = request.user
+            created.append(bug)
+        else:
+            updated.append(bug)
+
+    if errors:
+        raise ApiError("Invalid bugs", errors=errors)
+
+    update_fields = [*form_class.base_fields]
+    if can_assign:
+        update_fields.append("assignee")
+
+    with transaction.atomic():
+        Bug.objects.bulk_create(created, batch_size=500)
+        Bug.objects.bulk_update(updated, update_fields, batch_size=500)
+
+        # Bulk writes don't send post_save, index them here instead.
+        get_backend().index([*created, *updated])
+
+    return JsonResponse(
+        {
+            "created": [bug.id for bug in created],
+            "updated": [bug.id for bug in updated],
+        },
+        status=201 if created else 200,
+    )
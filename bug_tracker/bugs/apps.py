@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class BugsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "bugs"
+
+    def ready(self):
+        from . import signals  # noqa: F401
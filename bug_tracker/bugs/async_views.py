@@ -0,0 +1,191 @@
+"""
+Async versions of the bug list, detail and close views for serving
+bug_tracker.asgi, enabled with the ``ASYNC_VIEWS`` setting.
+
+Queries go through the async ORM and pages are rendered in the event loop, so
+a request only leaves it for the database and the session lookup.
+"""
+
+from calendar import timegm
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.contrib.auth.views import redirect_to_login
+from django.http import Http404, HttpRequest, HttpResponseNotAllowed
+from django.shortcuts import redirect, render
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date, quote_etag
+
+from .cache import bug_list_cache
+from .conditional import abug_detail_validators, abug_list_validators
+from .filters import BugFilter
+from .models import Bug
+from .views import BugDetailView, BugListView
+
+
+async def aget_user(request):
+    """
+    Load the session's user once, later ``request.user`` lookups reuse it.
+    """
+    if not hasattr(request, "_cached_user"):
+        request._cached_user = await sync_to_async(get_user)(request)
+
+    return request._cached_user
+
+
+async def aget_object_or_404(queryset, **kwargs):
+    try:
+        return await queryset.aget(**kwargs)
+    except queryset.model.DoesNotExist:
+        raise Http404("No {} matches the given query.".format(queryset.model.__name__))
+
+
+def async_login_required(view):
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        user = await aget_user(request)
+
+        if not user.is_authenticated:
+            return redirect_to_login(request.get_full_path(), settings.LOGIN_URL)
+
+        return await view(request, *args, **kwargs)
+
+    return wrapper
+
+
+class AsyncLoginRequiredMixin(LoginRequiredMixin):
+    def dispatch(self, request, *args, **kwargs):
+        return self.adispatch(request, *args, **kwargs)
+
+    async def adispatch(self, request, *args, **kwargs):
+        user = await aget_user(request)
+
+        if not user.is_authenticated:
+            return self.handle_no_permission()
+
+        # The user is loaded, the sync check in LoginRequiredMixin is free.
+        return await super().dispatch(request, *args, **kwargs)
+
+
+async def private_conditional_response(request, validators, respond):
+    """
+    What ``private_conditional_page`` and ``condition`` do for the sync views:
+    answer 304 while the client's copy is current, otherwise ``await
+    respond()`` and add the ETag and Last-Modified headers.
+    """
+    etag, last_modified = validators
+    etag = quote_etag(etag) if etag else None
+    timestamp = timegm(last_modified.utctimetuple()) if last_modified else None
+
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+
+    if response is None:
+        response = await respond()
+
+        if request.method in ("GET", "HEAD"):
+            if timestamp and not response.has_header("Last-Modified"):
+                response.headers["Last-Modified"] = http_date(timestamp)
+
+            if etag:
+                response.headers.setdefault("ETag", etag)
+
+    patch_vary_headers(response, ("Cookie",))
+    patch_cache_control(response, private=True, no_cache=True)
+
+    return response
+
+
+class AsyncBugListView(AsyncLoginRequiredMixin, BugListView):
+    async def get(self, request, *args, **kwargs):
+        return await private_conditional_response(
+            request, await abug_list_validators(request), self.respond
+        )
+
+    async def respond(self):
+        self.cache_key = None
+        entry = None
+
+        if bug_list_cache.enabled:
+            self.cache_key = bug_list_cache.key_for(self.request)
+            entry = bug_list_cache.get(self.cache_key)
+
+        if entry is not None:
+            self.object_list = entry["bugs"]
+            context = self.get_cached_context_data(entry)
+        else:
+            self.bug_filter = BugFilter(self.request.GET)
+            await self.bug_filter.aresolve()
+            self.object_list = self.get_queryset()
+            self.pagination = await self.apaginate_queryset(
+                self.object_list, self.get_paginate_by(self.object_list)
+            )
+            context = self.get_context_data()
+
+        return self.render_to_response(context).render()
+
+    async def apaginate_queryset(self, queryset, page_size):
+        if self.uses_cursor_pagination():
+            return await sync_to_async(super().paginate_queryset)(queryset, page_size)
+
+        self.count = await queryset.acount()
+        paginator, page, object_list, is_paginated = super().paginate_queryset(
+            queryset, page_size
+        )
+        page.object_list = [bug async for bug in object_list]
+
+        return paginator, page, page.object_list, is_paginated
+
+    def get_filter(self):
+        return self.bug_filter
+
+    def paginate_queryset(self, queryset, page_size):
+        return self.pagination
+
+    def get_paginator(self, *args, **kwargs):
+        paginator = super().get_paginator(*args, **kwargs)
+        paginator.count = self.count
+
+        return paginator
+
+
+class AsyncBugDetailView(AsyncLoginRequiredMixin, BugDetailView):
+    async def get(self, request, *args, **kwargs):
+        return await private_conditional_response(
+            request,
+            await abug_detail_validators(request, self.kwargs["id"]),
+            self.respond,
+        )
+
+    async def respond(self):
+        self.object = await aget_object_or_404(
+            Bug.objects.with_people(), id=self.kwargs["id"]
+        )
+
+        return self.render_to_response(
+            self.get_context_data(object=self.object)
+        ).render()
+
+
+@async_login_required
+async def async_close_bug_view(request: HttpRequest, id):
+    bug = await aget_object_or_404(Bug.objects.with_people(), id=id)
+
+    if request.user.id != bug.assignee_id and not request.user.is_manager:
+        return redirect("bugs:bug_list")
+
+    if request.method == "GET":
+        return render(request, "bugs/close.html", {"bug": bug})
+
+    if request.method == "POST":
+        await bug.aclose()
+
+        return redirect("bugs:bug_list")
+
+    return HttpResponseNotAllowed(["GET", "POST"])
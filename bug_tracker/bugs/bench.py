@@ -0,0 +1,318 @@
+import math
+import multiprocessing
+import random
+import statistics
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+
+from django.db import OperationalError, connections, transaction
+from django.db.models import Count
+from django.test import Client
+from django.urls import reverse
+from users.models import CustomUser
+
+from .models import Bug
+
+BENCH_EMAIL_DOMAIN = "bench.test"
+BENCH_PASSWORD = "bench"
+
+
+def percentile(values, percent):
+    """
+    Nearest-rank percentile of ``values``, which must be sorted.
+    """
+    rank = max(math.ceil(percent / 100 * len(values)), 1)
+
+    return values[rank - 1]
+
+
+@contextmanager
+def count_queries(using="default"):
+    queries = []
+
+    def wrapper(execute, sql, params, many, context):
+        queries.append(sql)
+        return execute(sql, params, many, context)
+
+    with connections[using].execute_wrapper(wrapper):
+        yield queries
+
+
+class Scenario:
+    """
+    A request made repeatedly as one user, ``path`` picks a new path for each
+    request so detail and close requests spread over many bugs.
+    """
+
+    def __init__(self, name, user, path, method="get", rollback=False):
+        self.name = name
+        self.user = user
+        self.path = path
+        self.method = method
+        self.rollback = rollback
+
+    def run(self, requests, warmup=0):
+        client = Client(HTTP_HOST="localhost")
+        client.force_login(self.user)
+
+        for i in range(warmup):
+            self.request(client, i)
+
+        timings = []
+        query_counts = []
+        started = time.perf_counter()
+
+        for i in range(requests):
+            with count_queries() as queries:
+                request_started = time.perf_counter()
+                self.request(client, warmup + i)
+                timings.append(time.perf_counter() - request_started)
+
+            query_counts.append(len(queries))
+
+        elapsed = time.perf_counter() - started
+        timings.sort()
+
+        return {
+            "requests": requests,
+            "p50_ms": round(percentile(timings, 50) * 1000, 3),
+            "p95_ms": round(percentile(timings, 95) * 1000, 3),
+            "p99_ms": round(percentile(timings, 99) * 1000, 3),
+            "mean_ms": round(statistics.mean(timings) * 1000, 3),
+            "queries_per_request": round(statistics.mean(query_counts), 2),
+            "throughput_rps": round(requests / elapsed, 1),
+        }
+
+    def request(self, client, i):
+        if not self.rollback:
+            return self.check(getattr(client, self.method)(self.path(i)))
+
+        # Writes are rolled back so every run starts from the same dataset.
+        with transaction.atomic():
+            self.check(getattr(client, self.method)(self.path(i)))
+            transaction.set_rollback(True)
+
+    def check(self, response):
+        if response.status_code >= 400:
+            raise RuntimeError("{} returned {}".format(self.name, response.status_code))
+
+
+def default_scenarios():
+    bench_users = CustomUser.objects.filter(email__endswith="@" + BENCH_EMAIL_DOMAIN)
+    manager = bench_users.filter(user_type=CustomUser.MANAGER).first()
+    # The developer with the most bugs is the worst case for their list.
+    developer = (
+        bench_users.filter(user_type=CustomUser.DEVELOPER)
+        .alias(bugs=Count("assignee"))
+        .order_by("-bugs")
+        .first()
+    )
+
+    if manager is None or developer is None:
+        raise RuntimeError("No benchmark users found, run seed_bench first")
+
+    bug_ids = list(Bug.objects.order_by("id").values_list("id", flat=True)[:1000])
+    open_ids = list(
+        Bug.objects.filter(status="Open", assignee=developer).values_list(
+            "id", flat=True
+        )[:1000]
+    )
+
+    def cycle(ids, url_name):
+        return lambda i: reverse(url_name, args=[ids[i % len(ids)]])
+
+    list_url = reverse("bugs:bug_list")
+
+    scenarios = [
+        Scenario("list_manager", manager, lambda i: list_url),
+        Scenario("list_manager_open", manager, lambda i: list_url + "?status=Open"),
+        Scenario(
+            "list_manager_by_title", manager, lambda i: list_url + "?order_by=title"
+        ),
+        Scenario("list_manager_last_page", manager, lambda i: list_url + "?page=last"),
+        Scenario("list_developer", developer, lambda i: list_url),
+        Scenario("detail", manager, cycle(bug_ids, "bugs:bug_detail")),
+    ]
+
+    if open_ids:
+        scenarios.append(
+            Scenario(
+                "close",
+                developer,
+                cycle(open_ids, "bugs:bug_close"),
+                method="post",
+                rollback=True,
+            )
+        )
+
+    return scenarios
+
+
+class ConcurrentRun:
+    """
+    ``workers`` processes logged in as ``user`` making requests for
+    ``duration`` seconds, each one a write with probability ``write_ratio``.
+    ``read`` and ``write`` make a request with the given client and a random
+    generator.
+
+    Workers are forked like the ones of a server, each with its own database
+    connection, so readers and writers contend for the database and not for
+    the interpreter lock.
+    """
+
+    def __init__(self, user, read, write, workers, duration, write_ratio, seed=0):
+        self.user = user
+        self.read = read
+        self.write = write
+        self.workers = workers
+        self.duration = duration
+        self.write_ratio = write_ratio
+        self.seed = seed
+
+    def run(self):
+        context = multiprocessing.get_context("fork")
+        barrier = context.Barrier(self.workers)
+        queue = context.SimpleQueue()
+        # Forked workers must not share the parent's connections.
+        connections.close_all()
+
+        processes = [
+            context.Process(target=self.worker, args=(i, barrier, queue))
+            for i in range(self.workers)
+        ]
+
+        for process in processes:
+            process.start()
+
+        # Read the results before joining, a worker blocks in put() until a
+        # large result has been read from the pipe.
+        results = [queue.get() for _ in processes]
+
+        for process in processes:
+            process.join()
+
+        if None in results or any(process.exitcode for process in processes):
+            raise RuntimeError("A benchmark worker failed")
+
+        return {
+            kind: self.summarize([result[kind] for result in results])
+            for kind in ("reads", "writes")
+        }
+
+    def worker(self, number, barrier, queue):
+        rng = random.Random(self.seed + number)
+        timings = {"reads": [], "writes": []}
+        errors = {"reads": 0, "writes": 0}
+
+        try:
+            client = Client(HTTP_HOST="localhost")
+            client.force_login(self.user)
+            barrier.wait()
+
+            deadline = time.perf_counter() + self.duration
+
+            while time.perf_counter() < deadline:
+                if rng.random() < self.write_ratio:
+                    kind, request = "writes", self.write
+                else:
+                    kind, request = "reads", self.read
+
+                started = time.perf_counter()
+
+                try:
+                    response = request(client, rng)
+                except OperationalError:
+                    # "database is locked" once busy_timeout runs out.
+                    errors[kind] += 1
+                    continue
+
+                if response.status_code >= 400:
+                    errors[kind] += 1
+                else:
+                    timings[kind].append(time.perf_counter() - started)
+        except BaseException:
+            # Don't leave the other workers or the parent waiting for this one.
+            barrier.abort()
+            queue.put(None)
+            raise
+        finally:
+            connections.close_all()
+
+        queue.put({kind: (timings[kind], errors[kind]) for kind in ("reads", "writes")})
+
+    def summarize(self, results):
+        timings = sorted(t for worker_timings, _ in results for t in worker_timings)
+        errors = sum(worker_errors for _, worker_errors in results)
+
+        if not timings:
+            return {"requests": 0, "errors": errors}
+
+        return {
+            "requests": len(timings),
+            "errors": errors,
+            "p50_ms": round(percentile(timings, 50) * 1000, 3),
+            "p95_ms": round(percentile(timings, 95) * 1000, 3),
+            "p99_ms": round(percentile(timings, 99) * 1000, 3),
+            "throughput_rps": round(len(timings) / self.duration, 1),
+        }
+
+
+def http_load(urls, cookie, concurrency, duration):
+    """
+    Request ``urls`` in turn from ``concurrency`` threads for ``duration``
+    seconds over real HTTP, each thread waiting for its response before the
+    next request like a browser tab would.
+    """
+    timings = []
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def worker(offset):
+        i = offset
+
+        while time.perf_counter() < deadline:
+            url = urls[i % len(urls)]
+            request = urllib.request.Request(url, headers={"Cookie": cookie})
+            started = time.perf_counter()
+
+            try:
+                with urllib.request.urlopen(request, timeout=30) as response:
+                    response.read()
+                    # A redirect to the login page means the session was lost.
+                    redirected = response.url != url
+            except OSError:
+                redirected = True
+
+            if redirected:
+                with lock:
+                    errors[0] += 1
+            else:
+                with lock:
+                    timings.append(time.perf_counter() - started)
+
+            i += 1
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    timings.sort()
+
+    if not timings:
+        return {"requests": 0, "errors": errors[0]}
+
+    return {
+        "requests": len(timings),
+        "errors": errors[0],
+        "p50_ms": round(percentile(timings, 50) * 1000, 3),
+        "p95_ms": round(percentile(timings, 95) * 1000, 3),
+        "p99_ms": round(percentile(timings, 99) * 1000, 3),
+        "throughput_rps": round(len(timings) / duration, 1),
+    }
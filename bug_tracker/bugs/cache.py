@@ -0,0 +1,100 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+
+GENERATION_KEY = "bugs:list:generation"
+HITS_KEY = "bugs:list:hits"
+MISSES_KEY = "bugs:list:misses"
+
+
+class BugListCache:
+    """
+    Cache of rendered bug list pages keyed by role, filters, order and page.
+
+    Every key embeds a generation counter that is bumped whenever a bug or
+    user changes, so stale pages are never read again and simply expire.
+    Caching is disabled while ``BUG_LIST_CACHE_TIMEOUT`` is 0.
+    """
+
+    def __init__(self, alias=None):
+        self._alias = alias
+
+    @property
+    def alias(self):
+        return self._alias or settings.BUG_LIST_CACHE_ALIAS
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    @property
+    def enabled(self):
+        return settings.BUG_LIST_CACHE_TIMEOUT > 0
+
+    def generation(self):
+        generation = self.cache.get(GENERATION_KEY)
+
+        if generation is None:
+            self.cache.add(GENERATION_KEY, 1, timeout=None)
+            generation = self.cache.get(GENERATION_KEY, 1)
+
+        return generation
+
+    def bump_generation(self):
+        try:
+            self.cache.incr(GENERATION_KEY)
+        except ValueError:
+            self.cache.add(GENERATION_KEY, 1, timeout=None)
+
+    def key_for(self, request):
+        user = request.user
+
+        # Managers all see the same list, developers only their own bugs.
+        audience = "manager" if user.is_manager else "developer:{}".format(user.id)
+        params = sorted(
+            (key, value) for key in request.GET for value in request.GET.getlist(key)
+        )
+        digest = hashlib.md5(repr(params).encode(), usedforsecurity=False)
+
+        return "bugs:list:{}:{}:{}".format(
+            self.generation(), audience, digest.hexdigest()
+        )
+
+    def get(self, key):
+        if not self.enabled:
+            return None
+
+        entry = self.cache.get(key)
+        self.count(HITS_KEY if entry is not None else MISSES_KEY)
+
+        return entry
+
+    def set(self, key, entry):
+        if self.enabled:
+            self.cache.set(key, entry, timeout=settings.BUG_LIST_CACHE_TIMEOUT)
+
+    def count(self, key):
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            if not self.cache.add(key, 1, timeout=None):
+                self.cache.incr(key)
+
+    def stats(self):
+        counts = self.cache.get_many([HITS_KEY, MISSES_KEY])
+        hits = counts.get(HITS_KEY, 0)
+        misses = counts.get(MISSES_KEY, 0)
+        total = hits + misses
+
+        return {
+            "backend": settings.CACHES[self.alias]["BACKEND"],
+            "enabled": self.enabled,
+            "generation": self.generation(),
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / total if total else 0.0,
+        }
+
+
+bug_list_cache = BugListCache()
@@ -0,0 +1,99 @@
+import hashlib
+
+from django.contrib import messages
+
+from .models import Bug
+
+
+def _etag(request, *parts):
+    # Pages embed the user's name and a CSRF token that is rotated on login,
+    # so another user or session must never be handed a 304 for an old copy.
+    parts = (
+        request.user.id,
+        request.user.user_type,
+        request.session.session_key,
+        request.get_full_path(),
+        *parts,
+    )
+
+    return hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+
+
+def _has_messages(request):
+    return len(messages.get_messages(request)) > 0
+
+
+def _list_version(request):
+    # Renaming a user doesn't change it, a revalidated page can show an old
+    # name until a bug changes.
+    if not hasattr(request, "_bug_list_version"):
+        request._bug_list_version = Bug.objects.last_modified()
+
+    return request._bug_list_version
+
+
+def _detail_version(request, id):
+    if not hasattr(request, "_bug_detail_version"):
+        request._bug_detail_version = (
+            Bug.objects.filter(id=id).values_list("modified_at", flat=True).first()
+        )
+
+    return request._bug_detail_version
+
+
+def bug_list_etag(request, *args, **kwargs):
+    if _has_messages(request):
+        return None
+
+    modified = _list_version(request)
+
+    if modified is None:
+        return None
+
+    return _etag(request, modified)
+
+
+def bug_list_last_modified(request, *args, **kwargs):
+    if _has_messages(request):
+        return None
+
+    return _list_version(request)
+
+
+def bug_detail_etag(request, id, *args, **kwargs):
+    modified_at = _detail_version(request, id)
+
+    if modified_at is None:
+        return None
+
+    return _etag(request, id, modified_at)
+
+
+def bug_detail_last_modified(request, id, *args, **kwargs):
+    return _detail_version(request, id)
+
+
+async def abug_list_validators(request):
+    """
+    The ETag and Last-Modified of the bug list for async views.
+    """
+    if _has_messages(request):
+        return None, None
+
+    modified = await Bug.objects.alast_modified()
+
+    if modified is None:
+        return None, None
+
+    return _etag(request, modified), modified
+
+
+async def abug_detail_validators(request, id):
+    modified_at = (
+        await Bug.objects.filter(id=id).values_list("modified_at", flat=True).afirst()
+    )
+
+    if modified_at is None:
+        return None, None
+
+    return _etag(request, id, modified_at), modified_at
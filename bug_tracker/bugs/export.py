@@ -0,0 +1,88 @@
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+EXPORT_FIELDS = (
+    "id",
+    "title",
+    "severity",
+    "status",
+    "description",
+    "bug_created",
+    "modified_at",
+    "bug_creator",
+    "bug_creator__first_name",
+    "bug_creator__last_name",
+    "assignee",
+    "assignee__first_name",
+    "assignee__last_name",
+)
+COLUMNS = (
+    "id",
+    "title",
+    "severity",
+    "status",
+    "description",
+    "created_at",
+    "modified_at",
+    "creator",
+    "assignee",
+)
+CHUNK_SIZE = 2000
+
+
+class Echo:
+    """
+    File-like object whose write() returns the value, lets csv.writer produce
+    one line at a time without buffering the whole file.
+    """
+
+    def write(self, value):
+        return value
+
+
+def person(user):
+    return str(user) if user is not None else ""
+
+
+def bug_rows(queryset):
+    # iterator() streams from a server-side cursor where the database supports
+    # one, so memory use doesn't depend on the number of bugs exported.
+    for bug in queryset.only(*EXPORT_FIELDS).iterator(chunk_size=CHUNK_SIZE):
+        yield (
+            bug.id,
+            bug.title,
+            bug.severity,
+            bug.status,
+            bug.description,
+            bug.bug_created,
+            bug.modified_at,
+            person(bug.bug_creator),
+            person(bug.assignee),
+        )
+
+
+def export_csv(queryset):
+    writer = csv.writer(Echo())
+
+    yield writer.writerow(COLUMNS)
+
+    for row in bug_rows(queryset):
+        yield writer.writerow(
+            [
+                value.isoformat() if hasattr(value, "isoformat") else value
+                for value in row
+            ]
+        )
+
+
+def export_ndjson(queryset):
+    for row in bug_rows(queryset):
+        yield json.dumps(dict(zip(COLUMNS, row)), cls=DjangoJSONEncoder) + "\n"
+
+
+FORMATS = {
+    "csv": (export_csv, "text/csv"),
+    "ndjson": (export_ndjson, "application/x-ndjson"),
+}
@@ -0,0 +1,63 @@
+from users.models import CustomUser
+
+from .models import Bug
+from .search import get_backend
+
+
+class BugFilter:
+    """
+    Filters the bug list from request parameters using only indexable lookups.
+
+    Status is matched exactly against the status choices, and an assignee
+    search is resolved to user ids with a prefix range over the normalized
+    ``CustomUser.search_name`` column before bugs are filtered on
+    ``assignee_id``. A ``q`` search goes through the full text search backend
+    and annotates each bug with its ``rank``.
+    """
+
+    def __init__(self, params):
+        self.status = params.get("status", "")
+        self.assignee = params.get("assignee", "")
+        self.query = params.get("q", "").strip()
+
+    def assignee_queryset(self):
+        prefix = CustomUser.normalize_name(self.assignee)
+
+        return CustomUser.objects.filter(
+            search_name__gte=prefix, search_name__lt=prefix + "\U0010ffff"
+        ).values_list("id", flat=True)
+
+    def assignee_ids(self):
+        if not hasattr(self, "_assignee_ids"):
+            self._assignee_ids = list(self.assignee_queryset())
+
+        return self._assignee_ids
+
+    async def aresolve(self):
+        """
+        Look up the assignee search ahead of ``apply()``, for async views.
+        """
+        if self.assignee.strip():
+            self._assignee_ids = [id async for id in self.assignee_queryset()]
+
+    def apply(self, queryset):
+        # An empty result still goes through the search below, which adds the
+        # rank the views order by.
+        if self.status:
+            if self.status not in Bug.status_type.values:
+                queryset = queryset.none()
+            else:
+                queryset = queryset.filter(status=self.status)
+
+        if self.assignee.strip():
+            ids = self.assignee_ids()
+
+            if not ids:
+                queryset = queryset.none()
+            else:
+                queryset = queryset.filter(assignee_id__in=ids)
+
+        if self.query:
+            queryset = get_backend(queryset.db).search(queryset, self.query)
+
+        return queryset
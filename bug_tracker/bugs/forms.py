@@ -1,18 +1,124 @@
 from django import forms
+from users.models import CustomUser
 
 from .models import Bug
 
 
-class BugFormManager(forms.ModelForm):
+class BugForm(forms.ModelForm):
+    def save(self, commit=True):
+        """
+        Create new bugs as usual but only write the changed columns of existing
+        ones, an unchanged form doesn't touch the database at all.
+        """
+        if not commit or self.instance._state.adding:
+            return super().save(commit)
+
+        bug = super().save(commit=False)
+
+        if self.has_changed():
+            bug.save(update_fields=[*self.changed_data, "modified_at"])
+
+        return bug
+
+
+class BugFormManager(BugForm):
     class Meta:
         model = Bug
         exclude = ("bug_creator",)
 
 
-class BugFormDeveloper(forms.ModelForm):
+class BugFormDeveloper(BugForm):
     class Meta:
         model = Bug
         exclude = (
             "bug_creator",
             "assignee",
         )
+
+
+class BugIdsField(forms.Field):
+    widget = forms.MultipleHiddenInput
+
+    def to_python(self, value):
+        try:
+            return [int(id) for id in value or []]
+        except (TypeError, ValueError):
+            raise forms.ValidationError("Invalid bug id", code="invalid")
+
+    def validate(self, value):
+        super().validate(value)
+
+        if not value:
+            raise forms.ValidationError("Select at least one bug", code="required")
+
+
+class BugBulkActionForm(forms.Form):
+    CLOSE = "close"
+    ASSIGN = "assign"
+    SEVERITY = "severity"
+
+    ACTIONS = [(CLOSE, "Close"), (ASSIGN, "Reassign"), (SEVERITY, "Change severity")]
+
+    ids = BugIdsField()
+    action = forms.ChoiceField(
+        choices=ACTIONS, widget=forms.Select(attrs={"class": "form-control"})
+    )
+    # A select would render every user into the list page, look the email up
+    # on submit instead.
+    assignee = forms.EmailField(
+        required=False,
+        widget=forms.EmailInput(
+            attrs={"class": "form-control", "placeholder": "Assignee email"}
+        ),
+        help_text="Leave blank to unassign.",
+    )
+    severity = forms.ChoiceField(
+        choices=Bug.severity_type.choices,
+        required=False,
+        widget=forms.Select(attrs={"class": "form-control"}),
+    )
+
+    def __init__(self, *args, user, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.user = user
+
+        # Developers may only close the bugs assigned to them.
+        if not user.is_manager:
+            self.fields["action"].choices = [(self.CLOSE, "Close")]
+            del self.fields["assignee"]
+            del self.fields["severity"]
+
+    def clean(self):
+        cleaned_data = super().clean()
+
+        if cleaned_data.get("action") == self.SEVERITY and not cleaned_data.get(
+            "severity"
+        ):
+            self.add_error("severity", "Select a severity")
+
+        if cleaned_data.get("action") == self.ASSIGN and cleaned_data.get("assignee"):
+            email = CustomUser.objects.normalize_email(cleaned_data["assignee"])
+            assignee = CustomUser.objects.only("id").filter(email=email).first()
+
+            if assignee is None:
+                self.add_error("assignee", "No user with this email")
+            else:
+                cleaned_data["assignee"] = assignee
+
+        return cleaned_data
+
+    def save(self):
+        """
+        Apply the action to the selected bugs the user may change with a single
+        UPDATE and return the number of bugs changed.
+        """
+        bugs = Bug.objects.visible_to(self.user).filter(id__in=self.cleaned_data["ids"])
+        action = self.cleaned_data["action"]
+
+        if action == self.CLOSE:
+            return bugs.close()
+        elif action == self.ASSIGN:
+            return bugs.update(assignee=self.cleaned_data["assignee"] or None)
+        else:
+            return bugs.update(severity=self.cleaned_data["severity"])
@@ -0,0 +1,124 @@
+import json
+import subprocess
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+from users.models import CustomUser
+
+from ...bench import default_scenarios
+from ...models import Bug
+
+REPORTED_METRICS = ("p50_ms", "p95_ms", "p99_ms", "queries_per_request")
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the bug list, detail and close views through the test client "
+        "against the data made by seed_bench and write a JSON report with "
+        "latency percentiles, queries per request and throughput."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--requests", type=int, default=200, help="Requests per scenario."
+        )
+        parser.add_argument(
+            "--warmup", type=int, default=20, help="Untimed requests per scenario."
+        )
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            help="Only run the named scenario, may be repeated.",
+        )
+        parser.add_argument("--output", help="Write the JSON report to this file.")
+        parser.add_argument(
+            "--compare", help="Print the change against an earlier JSON report."
+        )
+
+    def handle(self, *args, **options):
+        if options["requests"] < 1:
+            raise CommandError("--requests must be at least 1")
+
+        try:
+            scenarios = default_scenarios()
+        except RuntimeError as e:
+            raise CommandError(str(e))
+
+        if options["scenario"]:
+            unknown = set(options["scenario"]) - {s.name for s in scenarios}
+
+            if unknown:
+                raise CommandError("Unknown scenario {}".format(sorted(unknown)[0]))
+
+            scenarios = [s for s in scenarios if s.name in options["scenario"]]
+
+        report = {
+            "commit": git_commit(),
+            "created": timezone.now().isoformat(),
+            "database": connection.vendor,
+            "settings": {
+                "bug_list_pagination": settings.BUG_LIST_PAGINATION,
+                "bug_list_cache_timeout": settings.BUG_LIST_CACHE_TIMEOUT,
+            },
+            "dataset": {
+                "bugs": Bug.objects.count(),
+                "users": CustomUser.objects.count(),
+            },
+            "scenarios": {},
+        }
+
+        for scenario in scenarios:
+            result = scenario.run(options["requests"], options["warmup"])
+            report["scenarios"][scenario.name] = result
+
+            self.stdout.write(
+                "{:<24} p50 {p50_ms:>8.2f}ms  p95 {p95_ms:>8.2f}ms  "
+                "p99 {p99_ms:>8.2f}ms  {queries_per_request:>5} queries  "
+                "{throughput_rps:>7.1f} req/s".format(scenario.name, **result)
+            )
+
+        if options["compare"]:
+            self.compare(report, options["compare"])
+
+        if options["output"]:
+            with open(options["output"], "w") as file:
+                json.dump(report, file, indent=2)
+
+            self.stdout.write(
+                self.style.SUCCESS("Report written to {}".format(options["output"]))
+            )
+
+    def compare(self, report, path):
+        with open(path) as file:
+            baseline = json.load(file)
+
+        self.stdout.write("\nCompared to {}:".format(baseline.get("commit") or path))
+
+        for name, result in report["scenarios"].items():
+            before = baseline["scenarios"].get(name)
+
+            if before is None:
+                continue
+
+            changes = []
+
+            for metric in REPORTED_METRICS:
+                if before[metric]:
+                    change = (result[metric] - before[metric]) / before[metric] * 100
+                    changes.append("{} {:+.1f}%".format(metric, change))
+
+            self.stdout.write("{:<24} {}".format(name, "  ".join(changes)))
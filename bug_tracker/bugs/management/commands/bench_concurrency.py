@@ -0,0 +1,120 @@
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from users.models import CustomUser
+
+from ...bench import BENCH_EMAIL_DOMAIN, ConcurrentRun
+from ...models import Bug
+from ...sqlite import DEFAULT_PRAGMAS, configure
+from .bench import git_commit
+
+SEVERITIES = Bug.severity_type.values
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark concurrent bug list reads and bug updates on SQLite, first "
+        "with SQLite's defaults and then with SQLITE_PRAGMAS and BEGIN IMMEDIATE. "
+        "Updates are committed, they change the severity of seed_bench bugs."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=8)
+        parser.add_argument(
+            "--duration", type=float, default=10, help="Seconds per profile."
+        )
+        parser.add_argument(
+            "--write-ratio",
+            type=float,
+            default=0.2,
+            help="Share of requests that update a bug.",
+        )
+        parser.add_argument("--output", help="Write the JSON report to this file.")
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite" or connection.is_in_memory_db():
+            raise CommandError("bench_concurrency needs a SQLite database file")
+
+        if options["workers"] < 1:
+            raise CommandError("--workers must be at least 1")
+
+        manager = CustomUser.objects.filter(
+            email__endswith="@" + BENCH_EMAIL_DOMAIN, user_type=CustomUser.MANAGER
+        ).first()
+
+        if manager is None:
+            raise CommandError("No benchmark users found, run seed_bench first")
+
+        bugs = list(
+            Bug.objects.order_by("id").values(
+                "id", "title", "status", "description", "assignee"
+            )[:1000]
+        )
+        list_url = reverse("bugs:bug_list")
+
+        def read(client, rng):
+            return client.get(list_url)
+
+        def write(client, rng):
+            bug = rng.choice(bugs)
+            data = {**bug, "assignee": bug["assignee"] or ""}
+            data["severity"] = rng.choice(SEVERITIES)
+
+            return client.post(reverse("bugs:bug_update", args=[bug["id"]]), data)
+
+        report = {
+            "commit": git_commit(),
+            "created": timezone.now().isoformat(),
+            "workers": options["workers"],
+            "duration": options["duration"],
+            "write_ratio": options["write_ratio"],
+            "profiles": {},
+        }
+
+        for profile, tuned in (("default", False), ("tuned", True)):
+            run = ConcurrentRun(
+                manager,
+                read,
+                write,
+                workers=options["workers"],
+                duration=options["duration"],
+                write_ratio=options["write_ratio"],
+            )
+
+            with override_settings(SQLITE_TUNING=tuned):
+                self.reset(tuned)
+                report["profiles"][profile] = result = run.run()
+
+            for kind in ("reads", "writes"):
+                self.stdout.write(
+                    "{:<8} {:<7} {:>7.1f} req/s  p95 {:>8.2f}ms  {:>5} errors".format(
+                        profile,
+                        kind,
+                        result[kind].get("throughput_rps", 0),
+                        result[kind].get("p95_ms", 0),
+                        result[kind]["errors"],
+                    )
+                )
+
+        self.reset(settings.SQLITE_TUNING)
+
+        if options["output"]:
+            with open(options["output"], "w") as file:
+                json.dump(report, file, indent=2)
+
+            self.stdout.write(
+                self.style.SUCCESS("Report written to {}".format(options["output"]))
+            )
+
+    def reset(self, tuned):
+        # New connections pick up SQLITE_TUNING, the journal mode is kept in the
+        # database file and has to be set back explicitly.
+        connections.close_all()
+
+        if not tuned:
+            configure(connection, DEFAULT_PRAGMAS, immediate=False)
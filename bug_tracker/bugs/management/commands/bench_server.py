@@ -0,0 +1,195 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+from users.models import CustomUser
+
+from ...bench import BENCH_EMAIL_DOMAIN, http_load
+from ...models import Bug
+from .bench import git_commit
+
+SERVERS = ("runserver", "gunicorn", "uvicorn", "uvicorn-async")
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def server_command(server, address, workers):
+    """
+    The command starting ``server`` on ``address``, and its environment.
+    """
+    env = dict(os.environ)
+
+    if server == "runserver":
+        return [
+            sys.executable,
+            str(settings.BASE_DIR / "manage.py"),
+            "runserver",
+            "--noreload",
+            address,
+        ], env
+
+    if server.startswith("uvicorn"):
+        # The same views served by bug_tracker.asgi, each in a thread of its
+        # own, and the async views of bugs.async_views.
+        env["DJANGO_ASYNC_VIEWS"] = str(server == "uvicorn-async")
+        host, port = address.rsplit(":", 1)
+
+        return [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "bug_tracker.asgi:application",
+            "--host",
+            host,
+            "--port",
+            port,
+            "--workers",
+            str(workers or os.cpu_count()),
+            "--no-access-log",
+        ], env
+
+    command = [
+        sys.executable,
+        "-m",
+        "gunicorn",
+        "bug_tracker.wsgi",
+        "--config",
+        str(settings.BASE_DIR / "gunicorn.conf.py"),
+        "--bind",
+        address,
+        "--access-logfile",
+        os.devnull,
+    ]
+
+    if workers:
+        command += ["--workers", str(workers)]
+
+    return command, env
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare requests per second of the development server, gunicorn with "
+        "gunicorn.conf.py and uvicorn serving the sync or the async views, on "
+        "the bug list and detail pages of the seed_bench data over HTTP to "
+        "concurrent clients."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--server",
+            action="append",
+            choices=SERVERS,
+            help="Only benchmark the named server, may be repeated.",
+        )
+        parser.add_argument("--concurrency", type=int, default=16)
+        parser.add_argument(
+            "--duration", type=float, default=15, help="Seconds per server."
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="gunicorn and uvicorn workers, sized to the CPU count by default.",
+        )
+        parser.add_argument("--output", help="Write the JSON report to this file.")
+
+    def handle(self, *args, **options):
+        manager = CustomUser.objects.filter(
+            email__endswith="@" + BENCH_EMAIL_DOMAIN, user_type=CustomUser.MANAGER
+        ).first()
+
+        if manager is None:
+            raise CommandError("No benchmark users found, run seed_bench first")
+
+        client = Client()
+        client.force_login(manager)
+        session = client.cookies[settings.SESSION_COOKIE_NAME].value
+        cookie = "{}={}".format(settings.SESSION_COOKIE_NAME, session)
+
+        paths = [reverse("bugs:bug_list")] + [
+            reverse("bugs:bug_detail", args=[id])
+            for id in Bug.objects.order_by("id").values_list("id", flat=True)[:100]
+        ]
+
+        report = {
+            "commit": git_commit(),
+            "created": timezone.now().isoformat(),
+            "concurrency": options["concurrency"],
+            "duration": options["duration"],
+            "servers": {},
+        }
+
+        for server in options["server"] or SERVERS:
+            address = "127.0.0.1:{}".format(free_port())
+            urls = ["http://{}{}".format(address, path) for path in paths]
+            command, env = server_command(server, address, options["workers"])
+            process = subprocess.Popen(
+                command,
+                cwd=settings.BASE_DIR,
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+
+            try:
+                self.wait_until_ready(process, urls[0])
+                result = http_load(
+                    urls, cookie, options["concurrency"], options["duration"]
+                )
+            finally:
+                process.terminate()
+                process.wait()
+
+            report["servers"][server] = result
+
+            self.stdout.write(
+                "{:<14} {:>7.1f} req/s  p50 {:>8.2f}ms  p95 {:>8.2f}ms  "
+                "{:>5} errors".format(
+                    server,
+                    result.get("throughput_rps", 0),
+                    result.get("p50_ms", 0),
+                    result.get("p95_ms", 0),
+                    result["errors"],
+                )
+            )
+
+        if options["output"]:
+            with open(options["output"], "w") as file:
+                json.dump(report, file, indent=2)
+
+            self.stdout.write(
+                self.style.SUCCESS("Report written to {}".format(options["output"]))
+            )
+
+    def wait_until_ready(self, process, url, timeout=30):
+        deadline = time.monotonic() + timeout
+
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise CommandError(
+                    "The server exited with {}".format(process.returncode)
+                )
+
+            try:
+                urllib.request.urlopen(url, timeout=1).close()
+                return
+            except urllib.error.HTTPError:
+                return
+            except OSError:
+                time.sleep(0.2)
+
+        raise CommandError("The server did not start within {}s".format(timeout))
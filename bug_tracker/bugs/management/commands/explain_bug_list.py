@@ -0,0 +1,90 @@
+import itertools
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import RequestFactory
+from users.models import CustomUser
+
+from ...views import BugListView
+
+# Plan lines meaning the bug table is read without an index.
+FULL_SCAN_MARKERS = {
+    "sqlite": "SCAN bugs_bug",
+    "postgresql": "Seq Scan on bugs_bug",
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Run EXPLAIN on the bug list query for every supported filter and sort "
+        "combination and report plans that scan or sort the whole bug table."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--verbose-plans",
+            action="store_true",
+            help="Print the full plan for every combination.",
+        )
+        parser.add_argument(
+            "--fail-on-scan",
+            action="store_true",
+            help="Exit with an error if any combination scans the bug table.",
+        )
+
+    def handle(self, *args, **options):
+        marker = FULL_SCAN_MARKERS.get(connection.vendor)
+        factory = RequestFactory()
+        flagged = []
+
+        roles = ((CustomUser.MANAGER, "manager"), (CustomUser.DEVELOPER, "developer"))
+        statuses = ("", "Open", "Closed")
+
+        for (user_type, role), status, order_by in itertools.product(
+            roles, statuses, BugListView.orderings
+        ):
+            request = factory.get("/", {"status": status, "order_by": order_by})
+            request.user = CustomUser(id=1, user_type=user_type)
+
+            view = BugListView()
+            view.setup(request)
+            queryset = view.get_queryset()[: view.paginate_by]
+
+            plan = queryset.explain()
+            scans = [
+                line
+                for line in plan.splitlines()
+                if is_scan(line, marker, filtered=bool(status))
+            ]
+
+            # Walking the table in primary key order is how an unfiltered list
+            # sorted on id is meant to be served, the LIMIT stops it early.
+            if not status and order_by == "id" and user_type == CustomUser.MANAGER:
+                scans = []
+
+            label = "{:<9} status={:<6} order_by={:<11}".format(
+                role, status or "*", order_by
+            )
+
+            if scans:
+                flagged.append(label)
+                self.stdout.write(self.style.WARNING("{} SCAN".format(label)))
+            else:
+                self.stdout.write(self.style.SUCCESS("{} OK".format(label)))
+
+            if options["verbose_plans"] or scans:
+                for line in plan.splitlines():
+                    self.stdout.write("    " + line)
+
+        if flagged and options["fail_on_scan"]:
+            raise CommandError(
+                "{} combination(s) scan the bug table".format(len(flagged))
+            )
+
+
+def is_scan(line, marker, filtered):
+    if marker is None or marker not in line:
+        return False
+
+    # Walking a sort index is fine unless there is a filter it can't apply.
+    return filtered or "INDEX" not in line.upper()
@@ -0,0 +1,245 @@
+import csv
+import itertools
+import json
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, transaction
+from users.models import CustomUser
+
+from ...models import Bug
+from ...search import get_backend
+
+REQUIRED_FIELDS = ("title", "severity", "status", "description")
+USER_FIELDS = ("creator", "assignee")
+SEVERITIES = set(Bug.severity_type.values)
+STATUSES = set(Bug.status_type.values)
+TITLE_MAX_LENGTH = Bug._meta.get_field("title").max_length
+
+
+class InvalidRecord(Exception):
+    pass
+
+
+def read_csv(file):
+    yield from csv.DictReader(file)
+
+
+def read_ndjson(file):
+    for line in file:
+        if line.strip():
+            try:
+                yield json.loads(line)
+            except ValueError:
+                yield None
+
+
+READERS = {"csv": read_csv, "ndjson": read_ndjson}
+
+
+class Command(BaseCommand):
+    help = (
+        "Import bugs from a CSV or NDJSON file in batches. Records have title, "
+        "severity, status and description plus optional creator and assignee "
+        "emails. Each batch is committed on its own, use --offset to resume "
+        "after a failure."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to import, - reads standard input.")
+        parser.add_argument(
+            "--format",
+            choices=sorted(READERS),
+            help="Input format, guessed from the file extension by default.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Bugs inserted per INSERT and transaction.",
+        )
+        parser.add_argument(
+            "--offset",
+            type=int,
+            default=0,
+            help="Number of records to skip, to resume an interrupted import.",
+        )
+        parser.add_argument(
+            "--create-users",
+            action="store_true",
+            help="Create users without a password for unknown emails.",
+        )
+        parser.add_argument(
+            "--database",
+            default="default",
+            help="Database to import into.",
+        )
+
+    def handle(self, *args, **options):
+        format = options["format"] or options["path"].rpartition(".")[2]
+
+        if format not in READERS:
+            raise CommandError("Unknown format {}, use --format".format(format))
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1")
+
+        self.database = options["database"]
+        self.create_users = options["create_users"]
+        self.users = {}
+
+        if options["path"] == "-":
+            self.run(READERS[format](sys.stdin), options)
+        else:
+            with open(options["path"], newline="", encoding="utf-8") as file:
+                self.run(READERS[format](file), options)
+
+    def run(self, records, options):
+        offset = options["offset"]
+        records = itertools.islice(records, offset, None)
+        imported = 0
+        started = time.perf_counter()
+
+        while True:
+            batch = list(itertools.islice(records, options["batch_size"]))
+
+            if not batch:
+                break
+
+            # Earlier batches are committed, only this one is rolled back.
+            try:
+                self.import_batch(batch, offset + imported)
+            except InvalidRecord as e:
+                raise CommandError(
+                    "{}. Resume with --offset {}".format(e, offset + imported)
+                )
+            except DatabaseError as e:
+                raise CommandError(
+                    "Batch from record {}: {}. Resume with --offset {}".format(
+                        offset + imported, e, offset + imported
+                    )
+                ) from e
+
+            imported += len(batch)
+
+            if options["verbosity"] >= 2:
+                self.stdout.write(
+                    "{} bugs imported ({:.0f} rows/s)".format(
+                        imported, imported / (time.perf_counter() - started)
+                    )
+                )
+
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Imported {} bugs in {:.1f}s ({:.0f} rows/s)".format(
+                    imported, elapsed, imported / elapsed if elapsed else 0
+                )
+            )
+        )
+
+    def import_batch(self, batch, start):
+        bugs = []
+
+        for number, record in enumerate(batch, start):
+            try:
+                bugs.append(self.build_bug(record))
+            except InvalidRecord as e:
+                raise InvalidRecord("Record {}: {}".format(number, e))
+
+        with transaction.atomic(using=self.database):
+            self.resolve_users(batch, bugs)
+
+            Bug.objects.using(self.database).bulk_create(bugs)
+            # bulk_create() skips post_save, index the batch here instead.
+            get_backend(self.database).index(bugs)
+
+    def build_bug(self, record):
+        if not isinstance(record, dict):
+            raise InvalidRecord("not a valid object")
+
+        for field in REQUIRED_FIELDS:
+            if not record.get(field):
+                raise InvalidRecord("missing {}".format(field))
+            if not isinstance(record[field], str):
+                raise InvalidRecord("{} is not a string".format(field))
+
+        # NDJSON values can be of any type, CSV ones are always strings.
+        for field in USER_FIELDS:
+            if record.get(field) is not None and not isinstance(record[field], str):
+                raise InvalidRecord("{} is not an email".format(field))
+
+        if len(record["title"]) > TITLE_MAX_LENGTH:
+            raise InvalidRecord("title is longer than {}".format(TITLE_MAX_LENGTH))
+        if record["severity"] not in SEVERITIES:
+            raise InvalidRecord("unknown severity {}".format(record["severity"]))
+        if record["status"] not in STATUSES:
+            raise InvalidRecord("unknown status {}".format(record["status"]))
+
+        return Bug(
+            title=record["title"],
+            severity=record["severity"],
+            status=record["status"],
+            description=record["description"],
+        )
+
+    def resolve_users(self, batch, bugs):
+        """
+        Set creator and assignee ids from the records' emails, looking up the
+        emails not seen in earlier batches with one query.
+        """
+        emails = {
+            CustomUser.objects.normalize_email(record[field])
+            for record in batch
+            for field in USER_FIELDS
+            if record.get(field)
+        }
+        missing = emails - self.users.keys()
+
+        if missing:
+            self.users.update(
+                CustomUser.objects.using(self.database)
+                .filter(email__in=missing)
+                .values_list("email", "id")
+            )
+            missing -= self.users.keys()
+
+        if missing and not self.create_users:
+            raise InvalidRecord(
+                "Unknown user {}, use --create-users".format(sorted(missing)[0])
+            )
+        elif missing:
+            self.add_users(missing)
+
+        for record, bug in zip(batch, bugs):
+            bug.bug_creator_id = self.user_id(record.get("creator"))
+            bug.assignee_id = self.user_id(record.get("assignee"))
+
+    def add_users(self, emails):
+        users = []
+
+        for email in sorted(emails):
+            first_name, _, last_name = email.partition("@")[0].partition(".")
+            user = CustomUser(
+                email=email,
+                first_name=first_name.capitalize(),
+                last_name=last_name.capitalize() or "-",
+            )
+            # bulk_create() skips save(), which keeps search_name up to date.
+            user.search_name = CustomUser.normalize_name(
+                "{} {}".format(user.first_name, user.last_name)
+            )
+            # Imported users reset their password, no need to hash one here.
+            user.set_unusable_password()
+            users.append(user)
+
+        CustomUser.objects.using(self.database).bulk_create(users)
+
+        self.users.update((user.email, user.id) for user in users)
+
+    def user_id(self, email):
+        if not email:
+            return None
+
+        return self.users[CustomUser.objects.normalize_email(email)]
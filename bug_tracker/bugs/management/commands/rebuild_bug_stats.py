@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from ... import stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the dashboard's bug counts from the bug table, in case they "
+        "drifted from changes made behind the ORM's back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            default="default",
+            help="Database to rebuild the counts on.",
+        )
+
+    def handle(self, *args, **options):
+        buckets = stats.rebuild(options["database"])
+
+        self.stdout.write(
+            self.style.SUCCESS("Bug stats rebuilt, {} buckets".format(len(buckets)))
+        )
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from ...search import get_backend
+
+
+class Command(BaseCommand):
+    help = "Rebuild the bug full text search index from the bug table."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            default="default",
+            help="Database to rebuild the index on.",
+        )
+
+    def handle(self, *args, **options):
+        get_backend(options["database"]).rebuild()
+
+        self.stdout.write(self.style.SUCCESS("Search index rebuilt"))
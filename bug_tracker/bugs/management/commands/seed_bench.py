@@ -0,0 +1,203 @@
+import itertools
+import random
+import time
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import DateTimeField, DurationField, ExpressionWrapper, F, Value
+from django.utils import timezone
+from users.models import CustomUser
+
+from ...bench import BENCH_EMAIL_DOMAIN, BENCH_PASSWORD
+from ...models import Bug
+from ...search import get_backend
+
+FIRST_NAMES = (
+    "Ada Alan Barbara Brian Carol Dennis Donald Edsger Frances Grace Guido Ken "
+    "Linus Margaret Niklaus Radia Rob Sophie Tim Yukihiro"
+).split()
+LAST_NAMES = (
+    "Allen Backus Cerf Dijkstra Hamilton Hopper Kernighan Knuth Lamport Liskov "
+    "Lovelace Matsumoto Perlman Pike Ritchie Rossum Thompson Torvalds Turing Wirth"
+).split()
+COMPONENTS = (
+    "login page, search, bug list, export, dashboard, API, settings page, "
+    "notifications, user profile, file upload, password reset, pagination"
+).split(", ")
+PROBLEMS = (
+    "crashes when, is slow when, shows the wrong data when, times out when, "
+    "breaks layout when, returns a 500 when, ignores input when"
+).split(", ")
+TRIGGERS = (
+    "the list is empty, a filter is applied, the user is a manager, the title has "
+    "unicode, many bugs are selected, the session expires, JavaScript is disabled"
+).split(", ")
+
+SEVERITY_WEIGHTS = {
+    "Blocker": 2,
+    "Critical": 8,
+    "Major": 30,
+    "Minor": 45,
+    "Trivial": 15,
+}
+# Most bugs in a mature tracker are closed.
+STATUS_WEIGHTS = {"Open": 30, "Closed": 70}
+UNASSIGNED_RATIO = 0.1
+# Bugs are spread over this period, oldest first, so date sorts and filters
+# don't all hit one timestamp.
+HISTORY = timedelta(days=365)
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate benchmark users and bugs. Assignees follow a Zipf distribution "
+        "so a few developers own most bugs, like in real trackers. Every user "
+        "has the password '{}'.".format(BENCH_PASSWORD)
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--bugs", type=int, default=100000)
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument(
+            "--managers",
+            type=float,
+            default=0.05,
+            help="Share of users that are managers.",
+        )
+        parser.add_argument(
+            "--skew",
+            type=float,
+            default=1.1,
+            help="Zipf exponent of the assignee distribution, 0 is uniform.",
+        )
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument(
+            "--seed", type=int, default=0, help="Random seed, for repeatable data."
+        )
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="Delete earlier benchmark users and their bugs first.",
+        )
+
+    def handle(self, *args, **options):
+        if options["users"] < 2:
+            raise CommandError("--users must be at least 2")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1")
+
+        self.random = random.Random(options["seed"])
+        started = time.perf_counter()
+
+        if options["clear"]:
+            self.clear()
+
+        users = self.create_users(options)
+        self.create_bugs(users, options)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Seeded {} users and {} bugs in {:.1f}s".format(
+                    len(users), options["bugs"], time.perf_counter() - started
+                )
+            )
+        )
+
+    def clear(self):
+        users = CustomUser.objects.filter(email__endswith="@" + BENCH_EMAIL_DOMAIN)
+
+        Bug.objects.filter(bug_creator__in=users).delete()
+        users.delete()
+
+    def create_users(self, options):
+        # Hashing is slow on purpose, every user shares one hash.
+        password = make_password(BENCH_PASSWORD)
+        managers = max(int(options["users"] * options["managers"]), 1)
+        users = []
+
+        for i in range(options["users"]):
+            user = CustomUser(
+                email="user{}@{}".format(i, BENCH_EMAIL_DOMAIN),
+                first_name=self.random.choice(FIRST_NAMES),
+                last_name=self.random.choice(LAST_NAMES),
+                user_type=CustomUser.MANAGER if i < managers else CustomUser.DEVELOPER,
+                password=password,
+            )
+            # bulk_create() skips save(), which keeps search_name up to date.
+            user.search_name = CustomUser.normalize_name(
+                "{} {}".format(user.first_name, user.last_name)
+            )
+            users.append(user)
+
+        return CustomUser.objects.bulk_create(users, batch_size=options["batch_size"])
+
+    def create_bugs(self, users, options):
+        developers = [user.id for user in users if not user.is_manager]
+        managers = [user.id for user in users if user.is_manager]
+        # Rank r is picked with a probability proportional to 1 / r ** skew.
+        weights = list(
+            itertools.accumulate(
+                1 / rank ** options["skew"] for rank in range(1, len(developers) + 1)
+            )
+        )
+        remaining = options["bugs"]
+        step = HISTORY / max(options["bugs"], 1)
+        oldest = timezone.now() - HISTORY
+
+        while remaining > 0:
+            size = min(remaining, options["batch_size"])
+            assignees = self.random.choices(developers, cum_weights=weights, k=size)
+            bugs = [self.bug(managers, developers, assignee) for assignee in assignees]
+
+            with transaction.atomic():
+                Bug.objects.bulk_create(bugs)
+                get_backend().index(bugs)
+
+                # bulk_create() stamps the whole batch with the current time
+                # through auto_now_add, spread it out by id in one UPDATE.
+                # bulk_update() builds a CASE per row, which doubles the run.
+                created = ExpressionWrapper(
+                    Value(oldest + step * (options["bugs"] - remaining))
+                    + ExpressionWrapper(
+                        (F("id") - bugs[0].id) * Value(step),
+                        output_field=DurationField(),
+                    ),
+                    output_field=DateTimeField(),
+                )
+                Bug.objects.filter(id__gte=bugs[0].id, id__lte=bugs[-1].id).update(
+                    bug_created=created, modified_at=created
+                )
+
+            remaining -= size
+
+            if options["verbosity"] >= 2:
+                self.stdout.write("{} bugs created".format(options["bugs"] - remaining))
+
+    def bug(self, managers, developers, assignee):
+        component = self.random.choice(COMPONENTS)
+        problem = self.random.choice(PROBLEMS)
+        trigger = self.random.choice(TRIGGERS)
+
+        return Bug(
+            title="The {} {} {}".format(component, problem, trigger),
+            severity=self.random.choices(
+                list(SEVERITY_WEIGHTS), weights=SEVERITY_WEIGHTS.values()
+            )[0],
+            status=self.random.choices(
+                list(STATUS_WEIGHTS), weights=STATUS_WEIGHTS.values()
+            )[0],
+            description=" ".join(
+                "Steps: open the {}, {} and check the {}.".format(
+                    self.random.choice(COMPONENTS),
+                    self.random.choice(TRIGGERS),
+                    self.random.choice(COMPONENTS),
+                )
+                for _ in range(self.random.randint(1, 4))
+            ),
+            bug_creator_id=self.random.choice(
+                managers if self.random.random() < 0.5 else developers
+            ),
+            assignee_id=(None if self.random.random() < UNASSIGNED_RATIO else assignee),
+        )
@@ -0,0 +1,103 @@
+import json
+import os
+import statistics
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+SORT_KEYS = ("total", "count", "mean", "max")
+
+
+def read_entries(path):
+    """
+    Read the log and its rotated backups, oldest first.
+    """
+    paths = []
+    backup = 1
+
+    while os.path.exists("{}.{}".format(path, backup)):
+        paths.insert(0, "{}.{}".format(path, backup))
+        backup += 1
+
+    if os.path.exists(path):
+        paths.append(path)
+
+    for log_path in paths:
+        with open(log_path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+
+class Command(BaseCommand):
+    help = (
+        "Summarize the slow query log, grouping queries with the same shape and "
+        "ranking them by total time."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--file",
+            default=settings.SLOW_QUERY_LOG_FILE,
+            help="Slow query log to read, rotated backups are read too.",
+        )
+        parser.add_argument("--limit", type=int, default=10)
+        parser.add_argument("--sort", choices=SORT_KEYS, default="total")
+        parser.add_argument("--view", help="Only include queries run by this view.")
+        parser.add_argument(
+            "--explain",
+            action="store_true",
+            help="Print the latest captured plan of every query.",
+        )
+
+    def handle(self, *args, **options):
+        groups = defaultdict(list)
+
+        for entry in read_entries(options["file"]):
+            if options["view"] and entry.get("view") != options["view"]:
+                continue
+
+            groups[entry["fingerprint"]].append(entry)
+
+        if not groups:
+            self.stdout.write("No slow queries logged in {}".format(options["file"]))
+            return
+
+        summaries = [self.summarize(entries) for entries in groups.values()]
+        summaries.sort(key=lambda summary: summary[options["sort"]], reverse=True)
+
+        for summary in summaries[: options["limit"]]:
+            self.stdout.write(
+                self.style.WARNING(
+                    "{fingerprint}  {count} queries  total {total:.1f}ms  "
+                    "mean {mean:.1f}ms  max {max:.1f}ms  "
+                    "{parameter_sets} parameter sets".format(**summary)
+                )
+            )
+            self.stdout.write("  views: {}".format(", ".join(summary["views"])))
+            self.stdout.write("  sql: {}".format(summary["sql"]))
+
+            if options["explain"] and summary["explain"]:
+                self.stdout.write("  plan:")
+
+                for line in summary["explain"].splitlines():
+                    self.stdout.write("    {}".format(line))
+
+    def summarize(self, entries):
+        durations = [entry["duration_ms"] for entry in entries]
+        latest = entries[-1]
+
+        return {
+            "fingerprint": latest["fingerprint"],
+            "count": len(entries),
+            "total": sum(durations),
+            "mean": statistics.mean(durations),
+            "max": max(durations),
+            "parameter_sets": len({entry["params_fingerprint"] for entry in entries}),
+            "views": sorted({entry["view"] or "-" for entry in entries}),
+            "sql": latest["sql"],
+            "explain": latest["explain"],
+        }
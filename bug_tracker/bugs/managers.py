@@ -0,0 +1,141 @@
+from collections import Counter
+
+from django.apps import apps
+from django.db import models, transaction
+from django.db.models import Max, Subquery
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from . import stats
+from .signals import bugs_changed
+
+# Columns rendered by the bug list, everything else is left in the database.
+LIST_FIELDS = (
+    "id",
+    "title",
+    "status",
+    "severity",
+    "bug_created",
+    "bug_creator",
+    "bug_creator__first_name",
+    "bug_creator__last_name",
+    "assignee",
+    "assignee__first_name",
+    "assignee__last_name",
+)
+
+
+class BugQuerySet(models.QuerySet):
+    def with_people(self):
+        return self.select_related("bug_creator", "assignee")
+
+    def for_list(self):
+        return self.with_people().only(*LIST_FIELDS)
+
+    def visible_to(self, user):
+        if user.is_manager:
+            return self.all()
+
+        return self.filter(assignee_id=user.id)
+
+    def close(self):
+        return self.filter(status="Open").update(status="Closed")
+
+    async def aclose(self):
+        return await self.filter(status="Open").aupdate(status="Closed")
+
+    def last_modified(self):
+        """
+        Return when a bug was last created, changed or deleted.
+        """
+        return self.aggregate(modified=self.last_modified_expression())["modified"]
+
+    async def alast_modified(self):
+        return (await self.aaggregate(modified=self.last_modified_expression()))[
+            "modified"
+        ]
+
+    def last_modified_expression(self):
+        # Both are a seek on an index. Saves and updates stamp the bugs, and
+        # creating and deleting bugs stamps their BugStats rows.
+        BugStats = apps.get_model("bugs", "BugStats")
+        stats_modified = BugStats.objects.order_by("-modified_at").values(
+            "modified_at"
+        )[:1]
+
+        return Greatest(Max("modified_at"), Subquery(stats_modified))
+
+    # bulk_update() goes through update() so it is covered as well.
+    def update(self, **kwargs):
+        # update() skips auto_now, stamp modified_at like save() would.
+        kwargs.setdefault("modified_at", timezone.now())
+        self._for_write = True
+
+        if {"assignee", *stats.BUCKET_FIELDS} & kwargs.keys():
+            with transaction.atomic(using=self.db, savepoint=False):
+                rows = self.update_with_stats(kwargs)
+        else:
+            rows = super().update(**kwargs)
+
+        bugs_changed.send(sender=self.model, using=self.db)
+
+        return rows
+
+    def update_with_stats(self, kwargs):
+        """
+        Update the bugs and move them to their new ``BugStats`` buckets.
+        """
+        values = {
+            "assignee_id" if field == "assignee" else field: getattr(value, "pk", value)
+            for field, value in kwargs.items()
+        }
+        bugs = list(
+            self.select_for_update(of=("self",)).values_list("id", *stats.BUCKET_FIELDS)
+        )
+        before = stats.count_buckets(bug[1:] for bug in bugs)
+
+        rows = super().update(**kwargs)
+
+        if any(hasattr(value, "resolve_expression") for value in values.values()):
+            # Such as the CASE of bulk_update(), read the new buckets back.
+            after = stats.count_buckets(
+                self.model.objects.using(self.db)
+                .filter(id__in=[bug[0] for bug in bugs])
+                .values_list(*stats.BUCKET_FIELDS)
+            )
+        else:
+            after = Counter()
+
+            for bucket, count in before.items():
+                bucket = tuple(
+                    values.get(field, value)
+                    for field, value in zip(stats.BUCKET_FIELDS, bucket)
+                )
+                after[bucket] += count
+
+        after.subtract(before)
+        stats.record(after, self.db)
+
+        return rows
+
+    def bulk_create(self, objs, *args, **kwargs):
+        self._for_write = True
+
+        with transaction.atomic(using=self.db, savepoint=False):
+            objs = super().bulk_create(objs, *args, **kwargs)
+            stats.record(stats.count_buckets(map(stats.bucket_of, objs)), self.db)
+
+        bugs_changed.send(sender=self.model, using=self.db)
+
+        return objs
+
+    def delete(self):
+        self._for_write = True
+
+        # Collect the stats change of every deleted bug into one UPDATE.
+        with transaction.atomic(using=self.db, savepoint=False), stats.batch():
+            return super().delete()
+
+
+class BugManager(models.Manager.from_queryset(BugQuerySet)):  # type: ignore
+    pass
@@ -0,0 +1,71 @@
+# Generated by Django 4.2.11 on 2026-10-18 20:18
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("bugs", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="bug",
+            name="bug_created",
+            field=models.DateTimeField(auto_now_add=True, verbose_name="created at"),
+        ),
+        migrations.AlterField(
+            model_name="bug",
+            name="bug_creator",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="bug_creator",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="creator",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="bug",
+            index=models.Index(
+                fields=["assignee", "status", "bug_created"],
+                name="bug_assignee_status_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="bug",
+            index=models.Index(fields=["status", "id"], name="bug_status_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="bug",
+            index=models.Index(fields=["status", "title"], name="bug_status_title_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="bug",
+            index=models.Index(
+                fields=["status", "severity"], name="bug_status_severity_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="bug",
+            index=models.Index(
+                fields=["status", "bug_created"], name="bug_status_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="bug",
+            index=models.Index(fields=["title"], name="bug_title_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="bug",
+            index=models.Index(fields=["severity"], name="bug_severity_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="bug",
+            index=models.Index(fields=["bug_created"], name="bug_created_idx"),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 4.2.11 on 2026-10-18 21:02
+
+from django.db import migrations
+
+SQLITE_FORWARDS = [
+    "CREATE VIRTUAL TABLE bugs_bug_fts USING fts5("
+    "title, description, tokenize = 'porter unicode61')",
+    "INSERT INTO bugs_bug_fts (rowid, title, description) "
+    "SELECT id, title, description FROM bugs_bug",
+]
+
+SQLITE_BACKWARDS = [
+    "DROP TABLE IF EXISTS bugs_bug_fts",
+]
+
+POSTGRESQL_FORWARDS = [
+    "CREATE TABLE bugs_bug_search ("
+    "bug_id bigint PRIMARY KEY REFERENCES bugs_bug (id) ON DELETE CASCADE, "
+    "document tsvector NOT NULL)",
+    "CREATE INDEX bugs_bug_search_document_idx "
+    "ON bugs_bug_search USING GIN (document)",
+    "INSERT INTO bugs_bug_search (bug_id, document) "
+    "SELECT id, setweight(to_tsvector('english', title), 'A') || "
+    "setweight(to_tsvector('english', description), 'B') FROM bugs_bug",
+]
+
+POSTGRESQL_BACKWARDS = [
+    "DROP TABLE IF EXISTS bugs_bug_search",
+]
+
+
+def run(statements):
+    def operation(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+
+    return operation
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bugs", "0002_bug_list_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run({"sqlite": SQLITE_FORWARDS, "postgresql": POSTGRESQL_FORWARDS}),
+            run({"sqlite": SQLITE_BACKWARDS, "postgresql": POSTGRESQL_BACKWARDS}),
+        ),
+    ]
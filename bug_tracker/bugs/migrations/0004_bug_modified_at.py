@@ -0,0 +1,32 @@
+# Generated by Django 4.2.11 on 2026-10-18 22:10
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def copy_bug_created(apps, schema_editor):
+    Bug = apps.get_model("bugs", "Bug")
+
+    Bug.objects.update(modified_at=models.F("bug_created"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bugs", "0003_bug_search_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bug",
+            name="modified_at",
+            field=models.DateTimeField(
+                auto_now=True,
+                db_index=True,
+                default=django.utils.timezone.now,
+                verbose_name="modified at",
+            ),
+            preserve_default=False,
+        ),
+        migrations.RunPython(copy_bug_created, migrations.RunPython.noop),
+    ]
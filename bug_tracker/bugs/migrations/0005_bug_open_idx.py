@@ -0,0 +1,21 @@
+# Generated by Django 4.2.11 on 2026-10-18 20:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bugs", "0004_bug_modified_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="bug",
+            index=models.Index(
+                condition=models.Q(("status", "Open")),
+                fields=["id"],
+                name="bug_open_idx",
+            ),
+        ),
+    ]
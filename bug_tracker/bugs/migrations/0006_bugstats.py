@@ -0,0 +1,91 @@
+# Generated by Django 4.2.11 on 2026-10-18 21:41
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def count_bugs(apps, schema_editor):
+    Bug = apps.get_model("bugs", "Bug")
+    BugStats = apps.get_model("bugs", "BugStats")
+
+    BugStats.objects.bulk_create(
+        BugStats(**bucket)
+        for bucket in Bug.objects.values("severity", "status", "assignee_id")
+        .annotate(count=models.Count("id"))
+        .order_by()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("bugs", "0005_bug_open_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BugStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "severity",
+                    models.CharField(
+                        choices=[
+                            ("Blocker", "Blocker"),
+                            ("Critical", "Critical"),
+                            ("Major", "Major"),
+                            ("Minor", "Minor"),
+                            ("Trivial", "Trivial"),
+                        ],
+                        max_length=8,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("Open", "Open"), ("Closed", "Closed")], max_length=6
+                    ),
+                ),
+                ("count", models.IntegerField(default=0)),
+                (
+                    "assignee",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "bug stats",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="bugstats",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("assignee__isnull", False)),
+                fields=("severity", "status", "assignee"),
+                name="bugstats_bucket_unique",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="bugstats",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("assignee__isnull", True)),
+                fields=("severity", "status"),
+                name="bugstats_unassigned_bucket_unique",
+            ),
+        ),
+        migrations.RunPython(count_bugs, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.11 on 2026-10-18 23:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bugs", "0006_bugstats"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bugstats",
+            name="modified_at",
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+    ]
@@ -1,6 +1,8 @@
 from django.conf import settings
 from django.db import models
 
+from .managers import BugManager
+
 
 class Bug(models.Model):
     title = models.CharField(max_length=255, blank=False)
@@ -14,6 +16,9 @@ class Bug(models.Model):
     status = models.CharField(max_length=6, choices=status_type.choices, blank=False)
     description = models.TextField(blank=False)
     bug_created = models.DateTimeField(verbose_name="created at", auto_now_add=True)
+    modified_at = models.DateTimeField(
+        verbose_name="modified at", auto_now=True, db_index=True
+    )
     bug_creator = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         verbose_name="creator",
@@ -28,5 +33,90 @@ class Bug(models.Model):
         null=True,
     )
 
+    objects = BugManager()
+
+    class Meta:
+        # Match the bug list's access paths, developers always filter on their
+        # own assignee id and managers optionally on status, both sort on one
+        # of the list's sortable columns.
+        indexes = [
+            models.Index(
+                fields=["assignee", "status", "bug_created"],
+                name="bug_assignee_status_idx",
+            ),
+            models.Index(fields=["status", "id"], name="bug_status_idx"),
+            models.Index(fields=["status", "title"], name="bug_status_title_idx"),
+            models.Index(fields=["status", "severity"], name="bug_status_severity_idx"),
+            models.Index(
+                fields=["status", "bug_created"], name="bug_status_created_idx"
+            ),
+            models.Index(fields=["title"], name="bug_title_idx"),
+            models.Index(fields=["severity"], name="bug_severity_idx"),
+            models.Index(fields=["bug_created"], name="bug_created_idx"),
+            # Open bugs are a small share of the table, counting and walking
+            # them through this index reads far fewer pages than the status
+            # indexes above.
+            models.Index(
+                fields=["id"], condition=models.Q(status="Open"), name="bug_open_idx"
+            ),
+        ]
+
     def __str__(self):
         return self.title
+
+    def close(self):
+        """
+        Close the bug with a conditional UPDATE of status and modified_at only,
+        return whether this call closed it.
+        """
+        closed = Bug.objects.filter(id=self.id).close() > 0
+        self.status = "Closed"
+
+        return closed
+
+    async def aclose(self):
+        closed = await Bug.objects.filter(id=self.id).aclose() > 0
+        self.status = "Closed"
+
+        return closed
+
+
+class BugStats(models.Model):
+    """
+    Number of bugs of each severity, status and assignee, kept up to date by
+    bugs.stats as bugs change so the dashboard doesn't count the bugs.
+    """
+
+    severity = models.CharField(max_length=8, choices=Bug.severity_type.choices)
+    status = models.CharField(max_length=6, choices=Bug.status_type.choices)
+    assignee = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="+",
+        null=True,
+    )
+    count = models.IntegerField(default=0)
+    # Stamped whenever the count changes, deleted bugs leave no modified_at
+    # of their own for the bug list's conditional GETs.
+    modified_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        verbose_name_plural = "bug stats"
+        # Unassigned buckets need their own constraint, NULLs are distinct.
+        constraints = [
+            models.UniqueConstraint(
+                fields=["severity", "status", "assignee"],
+                condition=models.Q(assignee__isnull=False),
+                name="bugstats_bucket_unique",
+            ),
+            models.UniqueConstraint(
+                fields=["severity", "status"],
+                condition=models.Q(assignee__isnull=True),
+                name="bugstats_unassigned_bucket_unique",
+            ),
+        ]
+
+    def __str__(self):
+        return "{} {} {}: {}".format(
+            self.severity, self.status, self.assignee_id, self.count
+        )
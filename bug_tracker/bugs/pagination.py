@@ -0,0 +1,152 @@
+import json
+
+from django.core import signing
+from django.db import connections
+from django.db.models import Q
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+def approximate_count(queryset, cap=1000):
+    """
+    Return a ``(count, is_estimate)`` pair for ``queryset`` without a full
+    ``COUNT(*)``. PostgreSQL answers from the planner's row estimate, other
+    backends count at most ``cap`` rows.
+    """
+    if connections[queryset.db].vendor == "postgresql":
+        plan = queryset.order_by().explain(format="json")
+        rows = json.loads(plan)[0]["Plan"]["Plan Rows"]
+
+        return int(rows), True
+
+    count = queryset.order_by().values("pk")[: cap + 1].count()
+
+    return min(count, cap), count > cap
+
+
+class CursorPage:
+    def __init__(self, object_list, next_cursor, previous_cursor, count=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self.count = count
+
+    @property
+    def count_display(self):
+        if self.count is None:
+            return ""
+
+        count, is_estimate = self.count
+
+        return "~{}".format(count) if is_estimate else str(count)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginator:
+    """
+    Keyset paginator ordering on a single column with ``id`` as tie breaker.
+
+    Pages are addressed by opaque signed cursors rather than page numbers, so
+    fetching a page is an index range scan no matter how deep it is.
+    """
+
+    cursor_based = True
+    salt = "bugs.pagination.cursor"
+
+    def __init__(self, queryset, per_page, ordering="id", with_count=False):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = ordering
+        self.field_name = ordering.lstrip("-")
+        self.descending = ordering.startswith("-")
+        self.field = queryset.model._meta.get_field(self.field_name)
+        self.with_count = with_count
+
+    def encode_cursor(self, obj, direction):
+        value = self.field.value_to_string(obj)
+
+        return signing.dumps(
+            {"o": self.ordering, "v": value, "pk": obj.pk, "d": direction},
+            salt=self.salt,
+        )
+
+    def decode_cursor(self, cursor):
+        try:
+            data = signing.loads(cursor, salt=self.salt)
+        except signing.BadSignature:
+            raise InvalidCursor("Cursor is not valid")
+
+        if data.get("o") != self.ordering or data.get("d") not in ("n", "p"):
+            raise InvalidCursor("Cursor does not match the current ordering")
+
+        return self.field.to_python(data["v"]), data["pk"], data["d"]
+
+    def _filter_after(self, value, pk, backwards):
+        # Moving backwards through an ascending list is the same as moving
+        # forwards through a descending one.
+        lookup = "lt" if self.descending != backwards else "gt"
+
+        if self.field_name == "id":
+            return Q(**{"id__" + lookup: pk})
+
+        return Q(**{self.field_name + "__" + lookup: value}) | Q(
+            **{self.field_name: value, "id__" + lookup: pk}
+        )
+
+    def _order(self, backwards):
+        descending = self.descending != backwards
+        prefix = "-" if descending else ""
+
+        if self.field_name == "id":
+            return (prefix + "id",)
+
+        return (prefix + self.field_name, prefix + "id")
+
+    def page(self, cursor=None):
+        backwards = False
+        queryset = self.queryset
+
+        if cursor:
+            value, pk, direction = self.decode_cursor(cursor)
+            backwards = direction == "p"
+            queryset = queryset.filter(self._filter_after(value, pk, backwards))
+
+        rows = list(queryset.order_by(*self._order(backwards))[: self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+
+        if backwards:
+            rows.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, bool(cursor)
+
+        next_cursor = None
+        previous_cursor = None
+
+        if rows and has_next:
+            next_cursor = self.encode_cursor(rows[-1], "n")
+        if rows and has_previous:
+            previous_cursor = self.encode_cursor(rows[0], "p")
+
+        count = None
+        if self.with_count:
+            count = approximate_count(self.queryset)
+
+        return CursorPage(rows, next_cursor, previous_cursor, count)
@@ -0,0 +1,245 @@
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.template.backends.django import DjangoTemplates, Template
+
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERIES_BUCKETS = (1, 2, 5, 10, 20, 50, 100)
+
+current_profile = ContextVar("current_profile", default=None)
+
+
+class RequestProfile:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.sql_count = 0
+        self.sql_time = 0.0
+        self.template_time = 0.0
+        self.template_depth = 0
+
+    def server_timing(self, total):
+        return ", ".join(
+            [
+                'sql;dur={:.1f};desc="{} queries"'.format(
+                    self.sql_time * 1000, self.sql_count
+                ),
+                "tpl;dur={:.1f}".format(self.template_time * 1000),
+                "total;dur={:.1f}".format(total * 1000),
+            ]
+        )
+
+
+def profile_queries(execute, sql, params, many, context):
+    profile = current_profile.get()
+
+    if profile is None:
+        return execute(sql, params, many, context)
+
+    started = time.perf_counter()
+
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        profile.sql_count += 1
+        profile.sql_time += time.perf_counter() - started
+
+
+def install(connection):
+    # Installed on every connection, async views query from other threads
+    # than the one running the middleware.
+    if profile_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.append(profile_queries)
+
+
+class Histogram:
+    def __init__(self, name, description, buckets):
+        self.name = name
+        self.description = description
+        self.buckets = buckets
+        self.series = {}
+
+    def observe(self, view, value):
+        if view not in self.series:
+            self.series[view] = [[0] * (len(self.buckets) + 1), 0.0]
+
+        counts, _ = series = self.series[view]
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def render(self):
+        lines = [
+            "# HELP {} {}".format(self.name, self.description),
+            "# TYPE {} histogram".format(self.name),
+        ]
+
+        for view, (counts, total) in sorted(self.series.items()):
+            label = 'view="{}"'.format(escape_label(view))
+            cumulative = 0
+
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                lines.append(
+                    '{}_bucket{{{},le="{}"}} {}'.format(
+                        self.name, label, bound, cumulative
+                    )
+                )
+
+            lines.append("{}_sum{{{}}} {}".format(self.name, label, total))
+            lines.append("{}_count{{{}}} {}".format(self.name, label, cumulative))
+
+        return lines
+
+
+def escape_label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class RequestMetrics:
+    """
+    Per view histograms of request, SQL and template time kept in the memory
+    of each process, every worker is scraped on its own.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.duration = Histogram(
+            "bug_tracker_request_duration_seconds",
+            "Time spent handling requests.",
+            SECONDS_BUCKETS,
+        )
+        self.sql_duration = Histogram(
+            "bug_tracker_request_sql_duration_seconds",
+            "Time spent in SQL queries per request.",
+            SECONDS_BUCKETS,
+        )
+        self.sql_queries = Histogram(
+            "bug_tracker_request_sql_queries",
+            "Number of SQL queries per request.",
+            QUERIES_BUCKETS,
+        )
+        self.template_duration = Histogram(
+            "bug_tracker_request_template_duration_seconds",
+            "Time spent rendering templates per request.",
+            SECONDS_BUCKETS,
+        )
+
+    def record(self, view, profile, total):
+        with self.lock:
+            self.duration.observe(view, total)
+            self.sql_duration.observe(view, profile.sql_time)
+            self.sql_queries.observe(view, profile.sql_count)
+            self.template_duration.observe(view, profile.template_time)
+
+    def render(self):
+        histograms = (
+            self.duration,
+            self.sql_duration,
+            self.sql_queries,
+            self.template_duration,
+        )
+
+        with self.lock:
+            lines = [line for histogram in histograms for line in histogram.render()]
+
+        return "\n".join(lines) + "\n"
+
+
+request_metrics = RequestMetrics()
+
+
+class ProfiledTemplate(Template):
+    def render(self, context=None, request=None):
+        profile = current_profile.get()
+
+        if profile is None:
+            return super().render(context, request)
+
+        # Templates rendered while rendering another one are already counted.
+        profile.template_depth += 1
+        started = time.perf_counter()
+
+        try:
+            return super().render(context, request)
+        finally:
+            profile.template_depth -= 1
+
+            if profile.template_depth == 0:
+                profile.template_time += time.perf_counter() - started
+
+
+class ProfilingDjangoTemplates(DjangoTemplates):
+    """
+    The Django template backend, timing renders for ``ProfilingMiddleware``.
+    """
+
+    def from_string(self, template_code):
+        return ProfiledTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        template = super().get_template(template_name)
+
+        return ProfiledTemplate(template.template, self)
+
+
+class ProfilingMiddleware:
+    """
+    Record SQL, template and total time of every request per view, add them
+    to the response as a Server-Timing header and to ``request_metrics``.
+
+    Enabled with the ``REQUEST_PROFILING`` setting.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_PROFILING:
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        profile = RequestProfile()
+        token = current_profile.set(profile)
+
+        try:
+            response = self.get_response(request)
+        finally:
+            current_profile.reset(token)
+
+        return self.record(request, profile, response)
+
+    async def __acall__(self, request):
+        profile = RequestProfile()
+        token = current_profile.set(profile)
+
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_profile.reset(token)
+
+        return self.record(request, profile, response)
+
+    def record(self, request, profile, response):
+        total = time.perf_counter() - profile.started
+        match = request.resolver_match
+        view = match.view_name if match is not None else "unresolved"
+
+        request_metrics.record(view, profile, total)
+        response["Server-Timing"] = profile.server_timing(total)
+
+        return response
@@ -0,0 +1,118 @@
+import random
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+# Views whose GET requests can read from a replica, a few seconds of lag is
+# fine for them.
+REPLICA_VIEWS = {
+    "bugs:bug_list",
+    "bugs:bug_detail",
+    "bugs:bug_search",
+    "bugs:bug_export",
+    "bugs:bug_dashboard",
+    "bugs:api_bug_list",
+    "bugs:api_bug_detail",
+}
+PIN_COOKIE = "pin_primary"
+
+current_request = ContextVar("current_request", default=None)
+
+
+def replica_for(request):
+    if (
+        request.method in ("GET", "HEAD")
+        and request.resolver_match.view_name in REPLICA_VIEWS
+        and PIN_COOKIE not in request.COOKIES
+    ):
+        return random.choice(settings.DATABASE_REPLICAS)
+
+    return None
+
+
+class ReplicaRouter:
+    """
+    Send reads of a request ``ReplicaMiddleware`` lets use a replica to one of
+    them and everything else to the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        request = current_request.get()
+
+        # Until its URL is resolved the view isn't known, read from the primary.
+        # The session and user are loaded lazily when the view first uses them,
+        # so on replica views they come from the replica as well.
+        if request is None or request.resolver_match is None:
+            return None
+
+        if not hasattr(request, "_replica"):
+            request._replica = replica_for(request)
+
+        return request._replica
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary.
+        return True
+
+    def allow_migrate(self, db, app_label, **hints):
+        return db not in settings.DATABASE_REPLICAS
+
+
+class ReplicaMiddleware:
+    """
+    Read from a random replica on GET requests to ``REPLICA_VIEWS``. After a
+    user writes their reads stay on the primary for ``REPLICA_PIN_SECONDS``,
+    so they see their own changes before the replicas catch up.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.DATABASE_REPLICAS:
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        token = current_request.set(request)
+
+        try:
+            response = self.get_response(request)
+        finally:
+            current_request.reset(token)
+
+        return self.pin_after_write(request, response)
+
+    async def __acall__(self, request):
+        token = current_request.set(request)
+
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_request.reset(token)
+
+        return self.pin_after_write(request, response)
+
+    def pin_after_write(self, request, response):
+        if request.method not in ("GET", "HEAD", "OPTIONS"):
+            response.set_cookie(
+                PIN_COOKIE,
+                "1",
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+
+        return response
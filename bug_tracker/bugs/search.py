@@ -0,0 +1,165 @@
+import re
+
+from django.db import connections
+from django.db.models import FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+
+class SearchBackend:
+    """
+    Fallback search over the bug table for databases without a full text
+    index. Subclasses keep an inverted index of bug titles and descriptions
+    and rank matches from it.
+    """
+
+    def __init__(self, using="default"):
+        self.using = using
+
+    def index(self, bugs):
+        pass
+
+    def remove(self, ids):
+        pass
+
+    def rebuild(self):
+        pass
+
+    def search(self, queryset, query):
+        return queryset.filter(
+            Q(title__icontains=query) | Q(description__icontains=query)
+        ).annotate(rank=Value(0.0, output_field=FloatField()))
+
+
+class SQLiteSearchBackend(SearchBackend):
+    """Search backed by the ``bugs_bug_fts`` FTS5 table."""
+
+    table = "bugs_bug_fts"
+
+    def index(self, bugs):
+        rows = [(bug.id, bug.title, bug.description) for bug in bugs]
+
+        with connections[self.using].cursor() as cursor:
+            cursor.executemany(
+                "DELETE FROM {} WHERE rowid = %s".format(self.table),
+                [(row[0],) for row in rows],
+            )
+            cursor.executemany(
+                "INSERT INTO {} (rowid, title, description) VALUES (%s, %s, %s)".format(
+                    self.table
+                ),
+                rows,
+            )
+
+    def remove(self, ids):
+        with connections[self.using].cursor() as cursor:
+            cursor.executemany(
+                "DELETE FROM {} WHERE rowid = %s".format(self.table),
+                [(id,) for id in ids],
+            )
+
+    def rebuild(self):
+        with connections[self.using].cursor() as cursor:
+            cursor.execute("DELETE FROM {}".format(self.table))
+            cursor.execute(
+                "INSERT INTO {} (rowid, title, description) "
+                "SELECT id, title, description FROM bugs_bug".format(self.table)
+            )
+
+    @staticmethod
+    def match_expression(query):
+        # Quote every term so user input can't use FTS5 query syntax, the last
+        # term is matched as a prefix to support search as you type.
+        terms = ['"{}"'.format(term) for term in re.findall(r"\w+", query)]
+
+        if terms:
+            terms[-1] += "*"
+
+        return " ".join(terms)
+
+    def search(self, queryset, query):
+        match = self.match_expression(query)
+
+        # Callers order by rank, annotate it even when nothing can match.
+        if not match:
+            return queryset.annotate(rank=Value(0.0, output_field=FloatField())).none()
+
+        # bm25() is lower for better matches, negate it so rank sorts the same
+        # way as PostgreSQL's ts_rank().
+        return queryset.filter(
+            id__in=RawSQL(
+                "SELECT rowid FROM {0} WHERE {0} MATCH %s".format(self.table),
+                (match,),
+            )
+        ).annotate(
+            rank=RawSQL(
+                "SELECT -bm25({0}) FROM {0} WHERE {0} MATCH %s "
+                'AND rowid = "bugs_bug"."id"'.format(self.table),
+                (match,),
+                output_field=FloatField(),
+            )
+        )
+
+
+class PostgreSQLSearchBackend(SearchBackend):
+    """Search backed by the ``bugs_bug_search`` tsvector table and GIN index."""
+
+    table = "bugs_bug_search"
+    document = (
+        "setweight(to_tsvector('english', %s), 'A') || "
+        "setweight(to_tsvector('english', %s), 'B')"
+    )
+
+    def index(self, bugs):
+        with connections[self.using].cursor() as cursor:
+            cursor.executemany(
+                "INSERT INTO {} (bug_id, document) VALUES (%s, {}) "
+                "ON CONFLICT (bug_id) DO UPDATE SET document = EXCLUDED.document".format(
+                    self.table, self.document
+                ),
+                [(bug.id, bug.title, bug.description) for bug in bugs],
+            )
+
+    def remove(self, ids):
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(
+                "DELETE FROM {} WHERE bug_id = ANY(%s)".format(self.table), (list(ids),)
+            )
+
+    def rebuild(self):
+        with connections[self.using].cursor() as cursor:
+            cursor.execute("DELETE FROM {}".format(self.table))
+            cursor.execute(
+                "INSERT INTO {} (bug_id, document) SELECT id, {} FROM bugs_bug".format(
+                    self.table, self.document % ("title", "description")
+                )
+            )
+
+    def search(self, queryset, query):
+        return queryset.filter(
+            id__in=RawSQL(
+                "SELECT bug_id FROM {} "
+                "WHERE document @@ websearch_to_tsquery('english', %s)".format(
+                    self.table
+                ),
+                (query,),
+            )
+        ).annotate(
+            rank=RawSQL(
+                "SELECT ts_rank(document, websearch_to_tsquery('english', %s)) "
+                'FROM {} WHERE bug_id = "bugs_bug"."id"'.format(self.table),
+                (query,),
+                output_field=FloatField(),
+            )
+        )
+
+
+BACKENDS = {
+    "sqlite": SQLiteSearchBackend,
+    "postgresql": PostgreSQLSearchBackend,
+}
+
+
+def get_backend(using="default"):
+    vendor = connections[using].vendor
+
+    return BACKENDS.get(vendor, SearchBackend)(using)
@@ -0,0 +1,100 @@
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import Signal, receiver
+from users.signals import users_changed
+
+from . import profiling, slow_queries, sqlite, stats
+from .cache import bug_list_cache
+from .search import get_backend
+
+SEARCH_FIELDS = {"title", "description"}
+STATS_FIELDS = {"severity", "status", "assignee", "assignee_id"}
+
+# Sent after queryset updates and bulk writes, which don't send post_save.
+bugs_changed = Signal()
+
+
+@receiver(post_save, sender="bugs.Bug")
+def index_bug(sender, instance, using, update_fields=None, **kwargs):
+    if update_fields is not None and not SEARCH_FIELDS & set(update_fields):
+        return
+
+    get_backend(using).index([instance])
+
+
+@receiver(post_delete, sender="bugs.Bug")
+def remove_bug_from_index(sender, instance, using, **kwargs):
+    get_backend(using).remove([instance.id])
+
+
+@receiver(pre_save, sender="bugs.Bug")
+def remember_stats_bucket(sender, instance, using, update_fields=None, **kwargs):
+    if instance._state.adding:
+        return
+    if update_fields is not None and not STATS_FIELDS & set(update_fields):
+        return
+
+    instance._stats_bucket = (
+        sender.objects.using(using)
+        .filter(id=instance.id)
+        .values_list(*stats.BUCKET_FIELDS)
+        .first()
+    )
+
+
+@receiver(post_save, sender="bugs.Bug")
+def update_stats(sender, instance, created, using, **kwargs):
+    bucket = stats.bucket_of(instance)
+
+    if created:
+        stats.record({bucket: 1}, using)
+        return
+
+    previous = instance.__dict__.pop("_stats_bucket", None)
+
+    if previous is not None and previous != bucket:
+        stats.record({previous: -1, bucket: 1}, using)
+
+
+@receiver(post_delete, sender="bugs.Bug")
+def remove_bug_from_stats(sender, instance, using, **kwargs):
+    stats.record({stats.bucket_of(instance): -1}, using)
+
+
+@receiver(pre_delete, sender=settings.AUTH_USER_MODEL)
+def unassign_stats(sender, instance, using, **kwargs):
+    stats.unassign(instance.pk, using)
+
+
+@receiver(post_save, sender="bugs.Bug")
+@receiver(post_delete, sender="bugs.Bug")
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+@receiver(bugs_changed)
+def invalidate_bug_list(sender, **kwargs):
+    bug_list_cache.bump_generation()
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(users_changed)
+def invalidate_bug_list_on_user_save(sender, update_fields=None, **kwargs):
+    # Logging in only touches last_login, which the bug list never shows.
+    if update_fields is not None and set(update_fields) <= {"last_login"}:
+        return
+
+    bug_list_cache.bump_generation()
+
+
+@receiver(connection_created)
+def install_request_profiling(sender, connection, **kwargs):
+    profiling.install(connection)
+
+
+@receiver(connection_created)
+def install_slow_query_log(sender, connection, **kwargs):
+    slow_queries.install(connection)
+
+
+@receiver(connection_created)
+def tune_sqlite(sender, connection, **kwargs):
+    sqlite.install(connection)
@@ -0,0 +1,177 @@
+import hashlib
+import json
+import logging
+import re
+import time
+from contextvars import ContextVar
+from functools import cached_property
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+
+logger = logging.getLogger("bugs.slow_queries")
+
+EXPLAIN_PREFIXES = {
+    "sqlite": "EXPLAIN QUERY PLAN ",
+    "postgresql": "EXPLAIN ",
+}
+EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE")
+INSTRUMENTED_APPS = ("bugs", "users")
+
+IN_LISTS = re.compile(r"\bIN \(%s(?:\s*,\s*%s)*\)", re.IGNORECASE)
+PLACEHOLDER_LISTS = re.compile(r"%s(?:\s*,\s*%s)+")
+STRING_LITERALS = re.compile(r"'(?:[^']|'')*'")
+NUMBER_LITERALS = re.compile(r"\b\d+(?:\.\d+)?\b")
+WHITESPACE = re.compile(r"\s+")
+
+current_request = ContextVar("current_request", default=None)
+
+
+def normalize_sql(sql):
+    """
+    Reduce a query to its shape, so the same query with other values or a
+    different number of ``IN`` items is grouped together.
+    """
+    sql = STRING_LITERALS.sub("?", sql)
+    sql = NUMBER_LITERALS.sub("?", sql)
+    sql = IN_LISTS.sub("IN (...)", sql)
+    sql = PLACEHOLDER_LISTS.sub("%s, ...", sql)
+
+    return WHITESPACE.sub(" ", sql).strip()
+
+
+def current_view():
+    request = current_request.get()
+    match = getattr(request, "resolver_match", None)
+
+    return match.view_name if match is not None else None
+
+
+def fingerprint(value):
+    return hashlib.md5(repr(value).encode(), usedforsecurity=False).hexdigest()[:12]
+
+
+class SlowQueryLogger:
+    """
+    Execute wrapper logging queries on bugs and users tables that take longer
+    than ``SLOW_QUERY_THRESHOLD_MS``, with the plan the database chose.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.explaining = False
+
+    @cached_property
+    def tables(self):
+        return tuple(
+            model._meta.db_table
+            for label in INSTRUMENTED_APPS
+            for model in apps.get_app_config(label).get_models()
+        )
+
+    def __call__(self, execute, sql, params, many, context):
+        if self.explaining:
+            return execute(sql, params, many, context)
+
+        started = time.perf_counter()
+        result = execute(sql, params, many, context)
+        duration_ms = (time.perf_counter() - started) * 1000
+
+        if duration_ms >= settings.SLOW_QUERY_THRESHOLD_MS and any(
+            table in sql for table in self.tables
+        ):
+            self.log(sql, params, many, duration_ms)
+
+        return result
+
+    def log(self, sql, params, many, duration_ms):
+        normalized = normalize_sql(sql)
+
+        entry = {
+            "time": timezone.now().isoformat(),
+            "database": self.connection.alias,
+            "duration_ms": round(duration_ms, 3),
+            "fingerprint": fingerprint(normalized),
+            "params_fingerprint": fingerprint(params),
+            "view": current_view(),
+            "sql": normalized,
+            "explain": None if many else self.explain(sql, params),
+        }
+
+        logger.warning(json.dumps(entry))
+
+    def explain(self, sql, params):
+        prefix = EXPLAIN_PREFIXES.get(self.connection.vendor)
+
+        if prefix is None or not sql.lstrip().upper().startswith(EXPLAINABLE):
+            return None
+
+        self.explaining = True
+
+        try:
+            # A savepoint keeps a failed EXPLAIN from breaking the transaction.
+            with transaction.atomic(using=self.connection.alias):
+                with self.connection.cursor() as cursor:
+                    cursor.execute(prefix + sql, params)
+                    rows = cursor.fetchall()
+        except DatabaseError as e:
+            return "EXPLAIN failed: {}".format(e)
+        finally:
+            self.explaining = False
+
+        # The plan is the last column on SQLite and the only one on PostgreSQL.
+        return "\n".join(str(row[-1]) for row in rows)
+
+
+def install(connection):
+    # connection_created is sent again each time a closed connection reopens.
+    connection.execute_wrappers[:] = [
+        wrapper
+        for wrapper in connection.execute_wrappers
+        if not isinstance(wrapper, SlowQueryLogger)
+    ]
+
+    if settings.SLOW_QUERY_THRESHOLD_MS > 0:
+        connection.execute_wrappers.append(SlowQueryLogger(connection))
+
+
+class SlowQueryViewMiddleware:
+    """
+    Remember the request being handled, so slow queries can be traced back to
+    its view.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if settings.SLOW_QUERY_THRESHOLD_MS <= 0:
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        token = current_request.set(request)
+
+        try:
+            return self.get_response(request)
+        finally:
+            current_request.reset(token)
+
+    async def __acall__(self, request):
+        token = current_request.set(request)
+
+        try:
+            return await self.get_response(request)
+        finally:
+            current_request.reset(token)
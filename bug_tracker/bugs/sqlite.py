@@ -0,0 +1,33 @@
+from django.conf import settings
+
+# SQLite's own defaults, bench_concurrency sets them for its untuned runs.
+# journal_mode is stored in the database file, so turning SQLITE_TUNING off
+# doesn't take a file out of WAL mode, setting these does.
+DEFAULT_PRAGMAS = {"journal_mode": "delete", "synchronous": "full"}
+
+
+def begin_immediate(execute, sql, params, many, context):
+    # A deferred transaction that reads before it writes can't wait for the
+    # write lock and fails at once with "database is locked", taking the lock
+    # up front lets busy_timeout queue writers instead.
+    if sql == "BEGIN":
+        sql = "BEGIN IMMEDIATE"
+
+    return execute(sql, params, many, context)
+
+
+def configure(connection, pragmas, immediate):
+    with connection.cursor() as cursor:
+        for name, value in pragmas.items():
+            cursor.execute("PRAGMA {} = {}".format(name, value))
+
+    if begin_immediate in connection.execute_wrappers:
+        connection.execute_wrappers.remove(begin_immediate)
+
+    if immediate:
+        connection.execute_wrappers.append(begin_immediate)
+
+
+def install(connection):
+    if connection.vendor == "sqlite" and settings.SQLITE_TUNING:
+        configure(connection, settings.SQLITE_PRAGMAS, immediate=True)
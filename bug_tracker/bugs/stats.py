@@ -0,0 +1,194 @@
+import itertools
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import reduce
+from operator import or_
+
+from django.apps import apps
+from django.db import IntegrityError, transaction
+from django.db.models import Case, Count, F, Q, Value, When
+from django.utils import timezone
+
+# A bug counts towards the BugStats row of its bucket.
+BUCKET_FIELDS = ("severity", "status", "assignee_id")
+# Buckets per UPDATE, the WHERE ORs one condition per bucket and SQLite allows
+# expressions 1000 terms deep.
+CHUNK_SIZE = 250
+
+pending_changes = ContextVar("pending_changes", default=None)
+
+
+def bucket_of(bug):
+    return tuple(getattr(bug, field) for field in BUCKET_FIELDS)
+
+
+def count_buckets(buckets):
+    return Counter(tuple(bucket) for bucket in buckets)
+
+
+def bucket_query(bucket):
+    return Q(**dict(zip(BUCKET_FIELDS, bucket)))
+
+
+def record(changes, using):
+    """
+    Add ``changes``, a mapping of buckets to the change of their bug count,
+    to the ``BugStats`` rows. Inside ``batch()`` they are added when it ends.
+    """
+    pending = pending_changes.get()
+
+    if pending is not None:
+        pending[using].update(changes)
+    else:
+        apply(changes, using)
+
+
+@contextmanager
+def batch():
+    """
+    Collect the changes recorded inside the block, such as one per deleted
+    bug, and write them together at its end.
+    """
+    if pending_changes.get() is not None:
+        yield
+        return
+
+    pending = defaultdict(Counter)
+    token = pending_changes.set(pending)
+
+    try:
+        yield
+    finally:
+        pending_changes.reset(token)
+
+    for using, changes in pending.items():
+        apply(changes, using)
+
+
+def apply(changes, using):
+    """
+    Add ``changes`` to the ``BugStats`` rows with one UPDATE per ``CHUNK_SIZE``
+    buckets, creating the rows of new buckets.
+    """
+    changes = ((bucket, delta) for bucket, delta in changes.items() if delta)
+
+    while True:
+        chunk = dict(itertools.islice(changes, CHUNK_SIZE))
+
+        if not chunk:
+            break
+
+        apply_chunk(chunk, using)
+
+
+def apply_chunk(changes, using):
+    BugStats = apps.get_model("bugs", "BugStats")
+
+    buckets = BugStats.objects.using(using).filter(
+        reduce(or_, (bucket_query(bucket) for bucket in changes))
+    )
+    delta = Case(
+        *(
+            When(bucket_query(bucket), then=Value(delta))
+            for bucket, delta in changes.items()
+        ),
+        default=Value(0),
+    )
+
+    if buckets.update(count=F("count") + delta, modified_at=timezone.now()) == len(
+        changes
+    ):
+        return
+
+    existing = set(buckets.values_list(*BUCKET_FIELDS))
+    missing = {bucket: changes[bucket] for bucket in changes.keys() - existing}
+
+    try:
+        with transaction.atomic(using=using):
+            BugStats.objects.using(using).bulk_create(
+                BugStats(**dict(zip(BUCKET_FIELDS, bucket)), count=delta)
+                for bucket, delta in missing.items()
+            )
+    except IntegrityError:
+        # Another transaction created some of them first.
+        apply(missing, using)
+
+
+def unassign(user_id, using):
+    """
+    Move the counts of a user's buckets to the unassigned ones, deleting the
+    user sets the assignee of their bugs to null without sending signals.
+    """
+    BugStats = apps.get_model("bugs", "BugStats")
+    changes = Counter()
+
+    for severity, status, count in (
+        BugStats.objects.using(using)
+        .filter(assignee_id=user_id)
+        .values_list("severity", "status", "count")
+    ):
+        changes[severity, status, user_id] -= count
+        changes[severity, status, None] += count
+
+    record(changes, using)
+
+
+def rebuild(using="default"):
+    """
+    Recompute every ``BugStats`` row from the bugs.
+    """
+    Bug = apps.get_model("bugs", "Bug")
+    BugStats = apps.get_model("bugs", "BugStats")
+
+    with transaction.atomic(using=using):
+        BugStats.objects.using(using).all().delete()
+
+        return BugStats.objects.using(using).bulk_create(
+            BugStats(**bucket)
+            for bucket in Bug.objects.using(using)
+            .values(*BUCKET_FIELDS)
+            .annotate(count=Count("id"))
+            .order_by()
+        )
+
+
+def dashboard():
+    """
+    Open and closed bug counts in total, per severity and per assignee, read
+    from the ``BugStats`` rows alone.
+    """
+    Bug = apps.get_model("bugs", "Bug")
+    BugStats = apps.get_model("bugs", "BugStats")
+
+    totals = Counter()
+    severities = {severity: Counter() for severity in Bug.severity_type.values}
+    assignees = {}
+
+    rows = BugStats.objects.filter(count__gt=0).values_list(
+        "severity",
+        "status",
+        "assignee_id",
+        "assignee__first_name",
+        "assignee__last_name",
+        "count",
+    )
+
+    for severity, status, assignee_id, first_name, last_name, count in rows:
+        totals[status] += count
+        severities.setdefault(severity, Counter())[status] += count
+
+        if assignee_id is None:
+            name = "Unassigned"
+        else:
+            name = "{} {}".format(first_name, last_name)
+
+        assignees.setdefault(assignee_id, (name, Counter()))[1][status] += count
+
+    return {
+        "totals": totals,
+        "severities": list(severities.items()),
+        "assignees": sorted(
+            assignees.values(), key=lambda item: (-item[1]["Open"], item[0])
+        ),
+    }
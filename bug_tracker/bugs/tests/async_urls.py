@@ -0,0 +1,24 @@
+from django.urls import include, path
+
+from .. import async_views, urls
+
+# The bug URLs with the async views, whatever ASYNC_VIEWS is set to.
+ASYNC_VIEWS = {
+    "bug_list": async_views.AsyncBugListView.as_view(),
+    "bug_detail": async_views.AsyncBugDetailView.as_view(),
+    "bug_close": async_views.async_close_bug_view,
+}
+
+bug_patterns = [
+    path(
+        str(pattern.pattern),
+        ASYNC_VIEWS.get(pattern.name, pattern.callback),
+        name=pattern.name,
+    )
+    for pattern in urls.urlpatterns
+]
+
+urlpatterns = [
+    path("", include("users.urls")),
+    path("", include((bug_patterns, "bugs"))),
+]
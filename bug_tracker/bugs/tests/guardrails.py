@@ -0,0 +1,161 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+from users.models import CustomUser
+
+from ..models import Bug
+
+BASELINE_PATH = Path(__file__).with_name("performance_baseline.json")
+
+# Wall time depends on the machine and its load, so the latency budgets are only
+# checked with GUARDRAIL_LATENCY=True. Query counts are always checked.
+LATENCY_BUDGETS = os.getenv("GUARDRAIL_LATENCY") == "True"
+
+# Slow or shared CI machines can stretch every budget, e.g. GUARDRAIL_BUDGET_SCALE=3.
+BUDGET_SCALE = float(os.getenv("GUARDRAIL_BUDGET_SCALE", "1"))
+
+
+def load_baseline():
+    with open(BASELINE_PATH) as file:
+        return json.load(file)
+
+
+class Measurement:
+    def __init__(self, context):
+        self.context = context
+        self.elapsed_ms = None
+
+    @property
+    def queries(self):
+        return [query["sql"] for query in self.context.captured_queries]
+
+    def __len__(self):
+        return len(self.context)
+
+
+@contextmanager
+def measure(using="default"):
+    """
+    Capture the queries run and the wall time spent inside the block.
+    """
+    context = CaptureQueriesContext(connections[using])
+    measurement = Measurement(context)
+
+    with context:
+        started = time.perf_counter()
+        yield measurement
+        measurement.elapsed_ms = (time.perf_counter() - started) * 1000
+
+
+def make_bugs(count, **fields):
+    """
+    Bulk create ``count`` bugs, each created by and assigned to a new user so a
+    per-row query on either relation shows up in the query count.
+    """
+    start = CustomUser.objects.count()
+    users = CustomUser.objects.bulk_create(
+        CustomUser(
+            email="guardrail{}@test.com".format(i),
+            first_name="Guard",
+            last_name="Rail {}".format(i),
+            search_name="guard rail {}".format(i),
+        )
+        for i in range(start, start + count)
+    )
+
+    return Bug.objects.bulk_create(
+        Bug(
+            **{
+                "title": "Guardrail bug {}".format(user.id),
+                "severity": "Minor",
+                "status": "Open",
+                "description": "Created for a guardrail test",
+                "bug_creator": user,
+                "assignee": user,
+                **fields,
+            }
+        )
+        for user in users
+    )
+
+
+class GuardrailMixin:
+    """
+    Assertions that a view does a fixed number of queries whatever the number
+    of rows and, with ``GUARDRAIL_LATENCY=True``, answers within the budget
+    checked in to ``performance_baseline.json``.
+    """
+
+    sizes = (1, 10, 50)
+    repeats = 3
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.baseline = load_baseline()
+
+    def assertScales(self, name, request, grow=make_bugs):
+        """
+        Grow the dataset through ``sizes`` with ``grow(count)`` and make
+        ``request(client)`` at every size. ``name`` is the view's entry in the
+        baseline file.
+        """
+        budget_ms = self.baseline["views"][name]["budget_ms"] * BUDGET_SCALE
+        counts = {}
+        total = 0
+
+        # Sessions, content types and other lazily loaded state settle here.
+        request(self.client)
+
+        for size in self.sizes:
+            grow(size - total)
+            total = size
+
+            with measure() as measurement:
+                response = request(self.client)
+
+            self.assertLess(
+                response.status_code, 400, "{} failed with {} rows".format(name, size)
+            )
+
+            counts[size] = measurement
+
+            if not LATENCY_BUDGETS:
+                continue
+
+            timings = [measurement.elapsed_ms]
+
+            for _ in range(self.repeats - 1):
+                with measure() as repeat:
+                    request(self.client)
+
+                timings.append(repeat.elapsed_ms)
+
+            self.assertLessEqual(
+                min(timings),
+                budget_ms,
+                "{} took {:.1f}ms with {} rows, budget is {:.1f}ms".format(
+                    name, min(timings), size, budget_ms
+                ),
+            )
+
+        first, *rest = counts.values()
+
+        for size, measurement in zip(self.sizes[1:], rest):
+            self.assertEqual(
+                len(measurement),
+                len(first),
+                "{} ran {} queries with {} rows and {} with {} rows:\n{}".format(
+                    name,
+                    len(first),
+                    self.sizes[0],
+                    len(measurement),
+                    size,
+                    "\n".join(measurement.queries),
+                ),
+            )
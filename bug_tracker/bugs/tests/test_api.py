@@ -0,0 +1,316 @@
+import base64
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import Client, TestCase
+from django.urls import reverse
+from users.models import CustomUser
+
+from ..models import Bug
+
+
+def basic_auth(email, password="test"):
+    credentials = base64.b64encode("{}:{}".format(email, password).encode())
+
+    return {"HTTP_AUTHORIZATION": "Basic " + credentials.decode()}
+
+
+class BugApiTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+
+        cls.user = User.objects.create_user(
+            email="normal@test.com", first_name="John", last_name="Doe", password="test"
+        )
+
+        cls.manager: CustomUser = User.objects.create_user(
+            email="manager@test.com",
+            first_name="Jane",
+            last_name="Doe",
+            password="test",
+        )
+
+        cls.manager.user_type = CustomUser.MANAGER
+        cls.manager.save()
+
+        for i in range(5):
+            Bug.objects.create(
+                title="Title {}".format(i),
+                severity="Minor",
+                status="Open",
+                description="This is a description",
+                bug_creator=cls.manager,
+                assignee=cls.user if i < 2 else cls.manager,
+            )
+
+    def post_json(self, url, data, email="manager@test.com", method="post"):
+        return getattr(self.client, method)(
+            url,
+            json.dumps(data),
+            content_type="application/json",
+            **basic_auth(email),
+        )
+
+    def test_api_not_authenticated(self):
+        response = self.client.get(reverse("bugs:api_bug_list"))
+
+        self.assertEqual(response.status_code, 401)
+        self.assertIn("Basic", response["WWW-Authenticate"])
+
+    def test_api_wrong_password(self):
+        response = self.client.get(
+            reverse("bugs:api_bug_list"), **basic_auth("manager@test.com", "wrong")
+        )
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_api_list_as_manager(self):
+        response = self.client.get(
+            reverse("bugs:api_bug_list"), **basic_auth("manager@test.com")
+        )
+
+        self.assertEqual(len(response.json()["results"]), 5)
+
+    def test_api_list_as_developer(self):
+        response = self.client.get(
+            reverse("bugs:api_bug_list"), **basic_auth("normal@test.com")
+        )
+
+        self.assertEqual([bug["id"] for bug in response.json()["results"]], [1, 2])
+
+    def test_api_list_sparse_fields(self):
+        response = self.client.get(
+            reverse("bugs:api_bug_list"),
+            {"fields": "id,title"},
+            **basic_auth("manager@test.com"),
+        )
+
+        self.assertEqual(response.json()["results"][0], {"id": 1, "title": "Title 0"})
+
+    def test_api_list_unknown_field(self):
+        response = self.client.get(
+            reverse("bugs:api_bug_list"),
+            {"fields": "id,password"},
+            **basic_auth("manager@test.com"),
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_api_list_cursor_pagination(self):
+        response = self.client.get(
+            reverse("bugs:api_bug_list"),
+            {"limit": 3, "fields": "id"},
+            **basic_auth("manager@test.com"),
+        )
+        data = response.json()
+
+        self.assertEqual(data["results"], [{"id": 1}, {"id": 2}, {"id": 3}])
+
+        response = self.client.get(
+            reverse("bugs:api_bug_list"),
+            {"limit": 3, "fields": "id", "cursor": data["next"]},
+            **basic_auth("manager@test.com"),
+        )
+        data = response.json()
+
+        self.assertEqual(data["results"], [{"id": 4}, {"id": 5}])
+        self.assertIsNone(data["next"])
+
+    def test_api_detail(self):
+        response = self.client.get(
+            reverse("bugs:api_bug_detail", args=[1]),
+            {"fields": "status,assignee"},
+            **basic_auth("normal@test.com"),
+        )
+
+        self.assertEqual(response.json(), {"status": "Open", "assignee": 1})
+
+    def test_api_detail_not_visible_to_developer(self):
+        response = self.client.get(
+            reverse("bugs:api_bug_detail", args=[3]), **basic_auth("normal@test.com")
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_api_create(self):
+        response = self.post_json(
+            reverse("bugs:api_bug_list"),
+            {
+                "title": "New",
+                "severity": "Major",
+                "status": "Open",
+                "description": "A description",
+                "assignee": self.user.id,
+            },
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["bug_creator"], self.manager.id)
+        self.assertEqual(response.json()["assignee"], self.user.id)
+
+    def test_api_create_developer_cannot_assign(self):
+        response = self.post_json(
+            reverse("bugs:api_bug_list"),
+            {
+                "title": "New",
+                "severity": "Major",
+                "status": "Open",
+                "description": "A description",
+                "assignee": self.manager.id,
+            },
+            email="normal@test.com",
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertIsNone(response.json()["assignee"])
+
+    def test_api_create_invalid(self):
+        response = self.post_json(reverse("bugs:api_bug_list"), {"title": "New"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("severity", response.json()["errors"])
+
+    def test_api_update(self):
+        response = self.post_json(
+            reverse("bugs:api_bug_detail", args=[1]),
+            {"severity": "Blocker"},
+            method="patch",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Bug.objects.get(id=1).severity, "Blocker")
+        self.assertEqual(Bug.objects.get(id=1).title, "Title 0")
+
+    def test_api_close(self):
+        response = self.post_json(
+            reverse("bugs:api_bug_close", args=[1]), {}, email="normal@test.com"
+        )
+
+        self.assertEqual(response.json()["status"], "Closed")
+
+    def test_api_close_not_assigned(self):
+        response = self.post_json(
+            reverse("bugs:api_bug_close", args=[3]), {}, email="normal@test.com"
+        )
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(Bug.objects.get(id=3).status, "Open")
+
+    def test_api_method_not_allowed(self):
+        response = self.post_json(
+            reverse("bugs:api_bug_detail", args=[1]), {}, method="delete"
+        )
+
+        self.assertEqual(response.status_code, 405)
+
+    def test_api_session_requires_csrf(self):
+        client = Client(enforce_csrf_checks=True)
+        client.login(username="manager@test.com", password="test")
+
+        response = client.post(
+            reverse("bugs:api_bug_close", args=[1]),
+            "{}",
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_api_bulk(self):
+        # Eight of them for the bug stats: an UPDATE for the created bug, the
+        # updated bugs' buckets read before and after plus their UPDATE, and
+        # creating the bucket of closed bugs assigned to the user.
+        with self.assertNumQueries(17):
+            response = self.post_json(
+                reverse("bugs:api_bug_bulk"),
+                [
+                    {"id": 1, "status": "Closed"},
+                    {"id": 2, "assignee": self.manager.id},
+                    {
+                        "title": "Imported",
+                        "severity": "Minor",
+                        "status": "Open",
+                        "description": "From CI",
+                        "assignee": self.user.id,
+                    },
+                ],
+            )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json(), {"created": [6], "updated": [1, 2]})
+        self.assertEqual(Bug.objects.get(id=1).status, "Closed")
+        self.assertEqual(Bug.objects.get(id=2).assignee, self.manager)
+        self.assertEqual(Bug.objects.get(id=6).bug_creator, self.manager)
+
+    def test_api_bulk_is_atomic(self):
+        response = self.post_json(
+            reverse("bugs:api_bug_bulk"),
+            [
+                {"id": 1, "status": "Closed"},
+                {"id": 2, "assignee": 999},
+                {"title": "Imported"},
+            ],
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.json()["errors"]), {"1", "2"})
+        self.assertEqual(Bug.objects.get(id=1).status, "Open")
+
+    def test_api_bulk_invalid_ids(self):
+        response = self.post_json(
+            reverse("bugs:api_bug_bulk"),
+            [
+                {"id": [1], "status": "Closed"},
+                {"id": 2, "assignee": [1]},
+                {"id": True, "status": "Closed"},
+                {"id": 3, "assignee": None},
+            ],
+        )
+
+        errors = response.json()["errors"]
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(errors), {"0", "1", "2"})
+        self.assertEqual(errors["0"]["id"][0]["code"], "invalid")
+        self.assertEqual(errors["1"]["assignee"][0]["code"], "invalid")
+
+    def test_api_bulk_repeated_id(self):
+        # Only the basic auth user lookup.
+        with self.assertNumQueries(1):
+            response = self.post_json(
+                reverse("bugs:api_bug_bulk"),
+                [{"id": 1, "status": "Closed"}, {"id": 1, "title": "Again"}],
+            )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json()["errors"],
+            {"1": {"id": [{"message": "Repeated id", "code": "duplicate"}]}},
+        )
+
+    def test_api_bulk_null_id_creates(self):
+        response = self.post_json(
+            reverse("bugs:api_bug_bulk"),
+            [
+                {
+                    "id": None,
+                    "title": "Imported",
+                    "severity": "Minor",
+                    "status": "Open",
+                    "description": "From CI",
+                }
+            ],
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json(), {"created": [6], "updated": []})
+
+    def test_api_bulk_developer_only_updates_own_bugs(self):
+        response = self.post_json(
+            reverse("bugs:api_bug_bulk"),
+            [{"id": 3, "status": "Closed"}],
+            email="normal@test.com",
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Bug.objects.get(id=3).status, "Open")
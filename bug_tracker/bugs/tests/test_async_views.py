@@ -0,0 +1,148 @@
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import resolve, reverse
+from users.models import CustomUser
+
+from ..models import Bug
+
+
+@override_settings(ROOT_URLCONF="bugs.tests.async_urls")
+class AsyncBugViewTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+
+        cls.user = User.objects.create_user(
+            email="normal@test.com", first_name="John", last_name="Doe", password="test"
+        )
+
+        cls.manager: CustomUser = User.objects.create_user(
+            email="manager@test.com",
+            first_name="Jane",
+            last_name="Doe",
+            password="test",
+        )
+
+        cls.manager.user_type = CustomUser.MANAGER
+        cls.manager.save()
+
+        cls.bug = Bug.objects.create(
+            title="A Title",
+            severity="Minor",
+            status="Open",
+            description="This is a description",
+            bug_creator=cls.manager,
+            assignee=cls.user,
+        )
+
+        Bug.objects.create(
+            title="Nobody On It",
+            severity="Major",
+            status="Open",
+            description="This is a description",
+            bug_creator=cls.manager,
+        )
+
+    async def login(self, user):
+        await sync_to_async(self.async_client.force_login)(user)
+
+    def test_views_are_async(self):
+        for url in (
+            reverse("bugs:bug_list"),
+            reverse("bugs:bug_detail", args=[self.bug.id]),
+            reverse("bugs:bug_close", args=[self.bug.id]),
+        ):
+            self.assertTrue(iscoroutinefunction(resolve(url).func))
+
+    async def test_list_not_logged_in(self):
+        response = await self.async_client.get(reverse("bugs:bug_list"))
+
+        self.assertRedirects(response, "/login/?next=/", fetch_redirect_response=False)
+
+    def test_list_queries(self):
+        self.client.force_login(self.manager)
+
+        with self.assertNumQueries(5):
+            self.client.get(reverse("bugs:bug_list"))
+
+    async def test_list(self):
+        await self.login(self.manager)
+
+        response = await self.async_client.get(reverse("bugs:bug_list"))
+
+        self.assertContains(response, "A Title")
+        self.assertContains(response, "Nobody On It")
+        self.assertContains(response, 'type="email" name="assignee"')
+        self.assertEqual(response.context["paginator"].count, 2)
+        self.assertIn("private", response["Cache-Control"])
+
+        response = await self.async_client.get(
+            reverse("bugs:bug_list"), headers={"If-None-Match": response["ETag"]}
+        )
+
+        self.assertEqual(response.status_code, 304)
+
+    async def test_list_filters_by_assignee(self):
+        await self.login(self.manager)
+
+        response = await self.async_client.get(
+            reverse("bugs:bug_list"), {"assignee": "john"}
+        )
+
+        self.assertContains(response, "A Title")
+        self.assertNotContains(response, "Nobody On It")
+
+    async def test_list_developer_sees_own_bugs(self):
+        await self.login(self.user)
+
+        response = await self.async_client.get(reverse("bugs:bug_list"))
+
+        self.assertEqual(list(response.context["bugs"]), [self.bug])
+
+    async def test_detail(self):
+        await self.login(self.manager)
+        url = reverse("bugs:bug_detail", args=[self.bug.id])
+
+        response = await self.async_client.get(url)
+
+        self.assertContains(response, "Assignee - John Doe")
+
+        response = await self.async_client.get(
+            url, headers={"If-None-Match": response["ETag"]}
+        )
+
+        self.assertEqual(response.status_code, 304)
+
+    async def test_detail_not_found(self):
+        await self.login(self.manager)
+
+        response = await self.async_client.get(
+            reverse("bugs:bug_detail", args=[self.bug.id + 100])
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    async def test_close(self):
+        await self.login(self.user)
+        url = reverse("bugs:bug_close", args=[self.bug.id])
+
+        response = await self.async_client.get(url)
+
+        self.assertContains(response, "Close A Title")
+
+        response = await self.async_client.post(url)
+
+        self.assertRedirects(response, "/", fetch_redirect_response=False)
+        self.assertEqual((await Bug.objects.aget(id=self.bug.id)).status, "Closed")
+
+    async def test_close_other_developers_bug(self):
+        other = await Bug.objects.exclude(id=self.bug.id).aget()
+        await self.login(self.user)
+
+        response = await self.async_client.post(
+            reverse("bugs:bug_close", args=[other.id])
+        )
+
+        self.assertRedirects(response, "/", fetch_redirect_response=False)
+        self.assertEqual((await Bug.objects.aget(id=other.id)).status, "Open")
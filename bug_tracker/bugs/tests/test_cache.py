@@ -0,0 +1,133 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from users.models import CustomUser
+
+from ..cache import bug_list_cache
+from ..models import Bug
+
+
+@override_settings(BUG_LIST_CACHE_TIMEOUT=60)
+class BugListCacheTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+
+        user = User.objects.create_user(
+            email="normal@test.com", first_name="John", last_name="Doe", password="test"
+        )
+
+        manager: CustomUser = User.objects.create_user(
+            email="manager@test.com",
+            first_name="Jane",
+            last_name="Doe",
+            password="test",
+        )
+
+        manager.user_type = CustomUser.MANAGER
+        manager.is_staff = True
+        manager.save()
+
+        Bug.objects.create(
+            title="A Title",
+            severity="Minor",
+            status="Open",
+            description="This is a description",
+            bug_creator=manager,
+            assignee=user,
+        )
+
+    def setUp(self):
+        caches["bug_list"].clear()
+
+    def test_second_request_is_served_from_cache(self):
+        self.client.login(username="manager@test.com", password="test")
+        self.client.get(reverse("bugs:bug_list"))
+
+        # Only the session, user and conditional GET version lookups are left.
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse("bugs:bug_list"))
+
+        self.assertContains(response, "A Title")
+        self.assertContains(response, "csrfmiddlewaretoken")
+
+    def test_bug_save_invalidates_cache(self):
+        self.client.login(username="manager@test.com", password="test")
+        self.client.get(reverse("bugs:bug_list"))
+
+        bug = Bug.objects.get(id=1)
+        bug.title = "Changed"
+        bug.save()
+
+        response = self.client.get(reverse("bugs:bug_list"))
+
+        self.assertContains(response, "Changed")
+
+    def test_queryset_update_invalidates_cache(self):
+        self.client.login(username="manager@test.com", password="test")
+        self.client.get(reverse("bugs:bug_list"))
+
+        Bug.objects.filter(id=1).close()
+
+        response = self.client.get(reverse("bugs:bug_list"), {"status": "Open"})
+        self.assertNotContains(response, "A Title")
+
+        response = self.client.get(reverse("bugs:bug_list"))
+        self.assertContains(response, "Closed")
+
+    def test_user_rename_invalidates_cache(self):
+        self.client.login(username="manager@test.com", password="test")
+        self.client.get(reverse("bugs:bug_list"))
+
+        user = CustomUser.objects.get(email="normal@test.com")
+        user.first_name = "Johnny"
+        user.save()
+
+        response = self.client.get(reverse("bugs:bug_list"))
+
+        self.assertContains(response, "Johnny Doe")
+
+    def test_login_does_not_invalidate_cache(self):
+        generation = bug_list_cache.generation()
+
+        self.client.login(username="normal@test.com", password="test")
+
+        self.assertEqual(bug_list_cache.generation(), generation)
+
+    def test_developers_do_not_share_cache(self):
+        self.client.login(username="normal@test.com", password="test")
+        self.client.get(reverse("bugs:bug_list"))
+
+        CustomUser.objects.create_user(
+            email="other@test.com", first_name="Jim", last_name="Doe", password="test"
+        )
+        self.client.login(username="other@test.com", password="test")
+        response = self.client.get(reverse("bugs:bug_list"))
+
+        self.assertNotContains(response, "A Title")
+
+    def test_stats(self):
+        self.client.login(username="manager@test.com", password="test")
+        self.client.get(reverse("bugs:bug_list"))
+        self.client.get(reverse("bugs:bug_list"))
+
+        response = self.client.get(reverse("bugs:bug_list_cache_stats"))
+        stats = response.json()
+
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_ratio"], 0.5)
+
+    def test_stats_staff_only(self):
+        self.client.login(username="normal@test.com", password="test")
+        response = self.client.get(reverse("bugs:bug_list_cache_stats"))
+
+        self.assertEqual(response.status_code, 302)
+
+    @override_settings(BUG_LIST_CACHE_TIMEOUT=0)
+    def test_disabled_cache(self):
+        self.client.login(username="manager@test.com", password="test")
+        self.client.get(reverse("bugs:bug_list"))
+
+        with self.assertNumQueries(5):
+            self.client.get(reverse("bugs:bug_list"))
@@ -0,0 +1,272 @@
+import json
+import os
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.db import DatabaseError
+from django.test import TestCase
+from users.models import CustomUser
+
+from ..models import Bug
+from ..search import get_backend
+
+
+class ExplainBugListCommandTest(TestCase):
+    def test_command_explains_every_combination(self):
+        out = StringIO()
+        call_command("explain_bug_list", stdout=out)
+
+        self.assertEqual(out.getvalue().count("order_by="), 24)
+
+    def test_command_reports_no_scans(self):
+        out = StringIO()
+        call_command("explain_bug_list", "--fail-on-scan", stdout=out)
+
+        self.assertNotIn("SCAN", out.getvalue())
+
+
+class RebuildSearchIndexCommandTest(TestCase):
+    def test_command_indexes_bugs_saved_without_signals(self):
+        user = CustomUser.objects.create_user(
+            email="normal@test.com", first_name="John", last_name="Doe", password="test"
+        )
+
+        Bug.objects.bulk_create(
+            [
+                Bug(
+                    title="Imported bug",
+                    severity="Minor",
+                    status="Open",
+                    description="Loaded in bulk",
+                    bug_creator=user,
+                )
+            ]
+        )
+
+        self.assertFalse(get_backend().search(Bug.objects.all(), "imported").exists())
+
+        call_command("rebuild_search_index", stdout=StringIO())
+
+        results = get_backend().search(Bug.objects.all(), "imported")
+
+        self.assertEqual([bug.title for bug in results], ["Imported bug"])
+
+
+class ImportBugsCommandTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(
+            email="normal@test.com", first_name="John", last_name="Doe", password="test"
+        )
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def write(self, name, content):
+        path = os.path.join(self.directory, name)
+
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+
+        return path
+
+    def write_ndjson(self, records):
+        return self.write(
+            "bugs.ndjson", "".join(json.dumps(record) + "\n" for record in records)
+        )
+
+    def record(self, i, **fields):
+        return {
+            "title": "Imported {}".format(i),
+            "severity": "Minor",
+            "status": "Open",
+            "description": "From the old tracker",
+            "creator": "normal@test.com",
+            **fields,
+        }
+
+    def test_command_imports_csv(self):
+        path = self.write(
+            "bugs.csv",
+            "title,severity,status,description,creator,assignee\n"
+            'Crash,Major,Open,"Crashes, often",normal@test.com,\n'
+            "Typo,Trivial,Closed,Typo,normal@test.com,normal@test.com\n",
+        )
+
+        out = StringIO()
+        call_command("import_bugs", path, stdout=out)
+
+        bugs = list(Bug.objects.order_by("id"))
+
+        self.assertIn("Imported 2 bugs", out.getvalue())
+        self.assertEqual([bug.title for bug in bugs], ["Crash", "Typo"])
+        self.assertEqual(bugs[0].description, "Crashes, often")
+        self.assertEqual(bugs[0].bug_creator, self.user)
+        self.assertIsNone(bugs[0].assignee)
+        self.assertEqual(bugs[1].assignee, self.user)
+
+    def test_command_batches_inserts(self):
+        path = self.write_ndjson([self.record(i) for i in range(5)])
+
+        # Per batch: savepoint, INSERT, bug stats UPDATE, search index refresh
+        # (two statements) and release, plus one user lookup for the whole
+        # file and creating the stats bucket with the first batch.
+        with self.assertNumQueries(1 + 6 * 3 + 4):
+            call_command("import_bugs", path, "--batch-size", "2", stdout=StringIO())
+
+        self.assertEqual(Bug.objects.count(), 5)
+        self.assertTrue(get_backend().search(Bug.objects.all(), "imported").exists())
+
+    def test_command_resume_from_offset(self):
+        records = [self.record(i) for i in range(4)]
+        records[3]["severity"] = "Unknown"
+        path = self.write_ndjson(records)
+
+        with self.assertRaisesMessage(CommandError, "--offset 2"):
+            call_command("import_bugs", path, "--batch-size", "2", stdout=StringIO())
+
+        self.assertEqual(Bug.objects.count(), 2)
+
+        records[3]["severity"] = "Minor"
+        path = self.write_ndjson(records)
+        call_command("import_bugs", path, "--offset", "2", stdout=StringIO())
+
+        self.assertEqual(
+            list(Bug.objects.values_list("title", flat=True).order_by("id")),
+            ["Imported 0", "Imported 1", "Imported 2", "Imported 3"],
+        )
+
+    def test_command_wrong_types(self):
+        for field, value, message in (
+            ("title", 123, "Record 1: title is not a string"),
+            ("severity", ["Minor"], "Record 1: severity is not a string"),
+            ("assignee", 5, "Record 1: assignee is not an email"),
+        ):
+            records = [self.record(0), self.record(1, **{field: value})]
+            path = self.write_ndjson(records)
+
+            with self.assertRaisesMessage(CommandError, message + ". Resume with"):
+                call_command("import_bugs", path, stdout=StringIO())
+
+        self.assertEqual(Bug.objects.count(), 0)
+
+    def test_command_resume_after_database_error(self):
+        path = self.write_ndjson([self.record(i) for i in range(4)])
+        backend = mock.Mock()
+        backend.index.side_effect = [None, DatabaseError("disk I/O error")]
+
+        with mock.patch(
+            "bugs.management.commands.import_bugs.get_backend", return_value=backend
+        ), self.assertRaisesMessage(
+            CommandError, "disk I/O error. Resume with --offset 2"
+        ):
+            call_command("import_bugs", path, "--batch-size", "2", stdout=StringIO())
+
+        self.assertEqual(Bug.objects.count(), 2)
+
+    def test_command_unknown_user(self):
+        path = self.write_ndjson([self.record(0, assignee="new@test.com")])
+
+        with self.assertRaisesMessage(CommandError, "new@test.com"):
+            call_command("import_bugs", path, stdout=StringIO())
+
+        self.assertFalse(Bug.objects.exists())
+
+    def test_command_create_users(self):
+        path = self.write_ndjson([self.record(0, assignee="jane.smith@test.com")])
+
+        call_command("import_bugs", path, "--create-users", stdout=StringIO())
+
+        user = CustomUser.objects.get(email="jane.smith@test.com")
+
+        self.assertEqual(str(user), "Jane Smith")
+        self.assertEqual(user.search_name, "jane smith")
+        self.assertFalse(user.has_usable_password())
+        self.assertEqual(Bug.objects.get().assignee, user)
+
+
+class BenchCommandTest(TestCase):
+    def test_seed_bench(self):
+        call_command("seed_bench", "--bugs", "50", "--users", "10", stdout=StringIO())
+
+        self.assertEqual(Bug.objects.count(), 50)
+        self.assertEqual(
+            CustomUser.objects.filter(user_type=CustomUser.MANAGER).count(), 1
+        )
+        self.assertTrue(
+            CustomUser.objects.get(email="user0@bench.test").check_password("bench")
+        )
+
+    def test_seed_bench_is_repeatable(self):
+        call_command("seed_bench", "--bugs", "20", "--users", "5", stdout=StringIO())
+        first = list(
+            Bug.objects.order_by("id").values_list("title", "severity", "status")
+        )
+
+        call_command(
+            "seed_bench", "--bugs", "20", "--users", "5", "--clear", stdout=StringIO()
+        )
+        second = list(
+            Bug.objects.order_by("id").values_list("title", "severity", "status")
+        )
+
+        self.assertEqual(first, second)
+
+    def test_seed_bench_spreads_created_dates(self):
+        call_command(
+            "seed_bench",
+            "--bugs",
+            "20",
+            "--users",
+            "5",
+            "--batch-size",
+            "8",
+            stdout=StringIO(),
+        )
+        created = list(Bug.objects.order_by("id").values_list("bug_created", flat=True))
+
+        self.assertEqual(len(set(created)), 20)
+        self.assertEqual(created, sorted(created))
+        self.assertGreater(created[-1] - created[0], timedelta(days=300))
+
+    def test_bench_report(self):
+        call_command("seed_bench", "--bugs", "50", "--users", "10", stdout=StringIO())
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "report.json")
+
+        call_command(
+            "bench",
+            "--requests",
+            "3",
+            "--warmup",
+            "0",
+            "--output",
+            path,
+            stdout=StringIO(),
+        )
+
+        with open(path) as file:
+            report = json.load(file)
+
+        self.assertEqual(report["dataset"]["bugs"], 50)
+        self.assertIn("list_manager", report["scenarios"])
+        self.assertGreater(report["scenarios"]["detail"]["queries_per_request"], 0)
+        self.assertLessEqual(
+            report["scenarios"]["detail"]["p50_ms"],
+            report["scenarios"]["detail"]["p99_ms"],
+        )
+
+    def test_bench_without_data(self):
+        with self.assertRaisesMessage(CommandError, "seed_bench"):
+            call_command("bench", stdout=StringIO())
+
+    def test_bench_server_without_data(self):
+        with self.assertRaisesMessage(CommandError, "seed_bench"):
+            call_command("bench_server", stdout=StringIO())
@@ -0,0 +1,57 @@
+from django.test import SimpleTestCase
+
+from bug_tracker.database import parse_database_url
+
+
+class ParseDatabaseUrlTest(SimpleTestCase):
+    def test_sqlite(self):
+        config = parse_database_url("sqlite:////app/db.sqlite3")
+
+        self.assertEqual(config["ENGINE"], "django.db.backends.sqlite3")
+        self.assertEqual(config["NAME"], "/app/db.sqlite3")
+        self.assertEqual(config["CONN_MAX_AGE"], 0)
+
+    def test_sqlite_memory(self):
+        self.assertEqual(parse_database_url("sqlite://:memory:")["NAME"], ":memory:")
+
+    def test_postgres(self):
+        config = parse_database_url(
+            "postgres://bugs:p%40ss@db:5433/bug_tracker?sslmode=require",
+            conn_max_age=60,
+            conn_health_checks=True,
+        )
+
+        self.assertEqual(config["ENGINE"], "django.db.backends.postgresql")
+        self.assertEqual(config["NAME"], "bug_tracker")
+        self.assertEqual(config["USER"], "bugs")
+        self.assertEqual(config["PASSWORD"], "p@ss")
+        self.assertEqual(config["HOST"], "db")
+        self.assertEqual(config["PORT"], "5433")
+        self.assertEqual(config["OPTIONS"], {"sslmode": "require"})
+        self.assertEqual(config["CONN_MAX_AGE"], 60)
+        self.assertTrue(config["CONN_HEALTH_CHECKS"])
+
+    def test_postgres_socket_directory(self):
+        config = parse_database_url(
+            "postgresql://postgres@/bugs?host=/var/run/postgresql"
+        )
+
+        self.assertEqual(config["HOST"], "/var/run/postgresql")
+        self.assertNotIn("OPTIONS", config)
+
+    def test_query_overrides_connection_settings(self):
+        config = parse_database_url(
+            "postgres://bugs@pgbouncer/bugs"
+            "?conn_max_age=0&conn_health_checks=false&disable_server_side_cursors=true",
+            conn_max_age=60,
+            conn_health_checks=True,
+        )
+
+        self.assertEqual(config["CONN_MAX_AGE"], 0)
+        self.assertFalse(config["CONN_HEALTH_CHECKS"])
+        self.assertTrue(config["DISABLE_SERVER_SIDE_CURSORS"])
+        self.assertNotIn("OPTIONS", config)
+
+    def test_unsupported_scheme(self):
+        with self.assertRaises(ValueError):
+            parse_database_url("mysql://bugs@db/bugs")
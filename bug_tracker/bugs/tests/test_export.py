@@ -0,0 +1,115 @@
+import csv
+import gzip
+import io
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from users.models import CustomUser
+
+from ..models import Bug
+
+
+class BugExportViewTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+
+        user = User.objects.create_user(
+            email="normal@test.com", first_name="John", last_name="Doe", password="test"
+        )
+
+        manager: CustomUser = User.objects.create_user(
+            email="manager@test.com",
+            first_name="Jane",
+            last_name="Doe",
+            password="test",
+        )
+
+        manager.user_type = CustomUser.MANAGER
+        manager.save()
+
+        for i in range(5):
+            Bug.objects.create(
+                title="Title {}".format(i),
+                severity="Minor",
+                status="Open" if i % 2 else "Closed",
+                description="Description, with a comma",
+                bug_creator=manager,
+                assignee=user if i < 2 else None,
+            )
+
+    def export(self, **params):
+        response = self.client.get(reverse("bugs:bug_export"), params)
+
+        return response, b"".join(response.streaming_content).decode()
+
+    def test_view_not_logged_in(self):
+        response = self.client.get(reverse("bugs:bug_export"))
+
+        self.assertRedirects(response, "/login/?next=/export/")
+
+    def test_view_csv(self):
+        self.client.login(username="manager@test.com", password="test")
+        response, content = self.export()
+
+        rows = list(csv.reader(io.StringIO(content)))
+
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertIn("bugs.csv", response["Content-Disposition"])
+        self.assertEqual(rows[0][:2], ["id", "title"])
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(rows[1][4], "Description, with a comma")
+        self.assertEqual(rows[1][7:], ["Jane Doe", "John Doe"])
+        self.assertEqual(rows[5][8], "")
+
+    def test_view_ndjson(self):
+        self.client.login(username="manager@test.com", password="test")
+        response, content = self.export(format="ndjson")
+
+        bugs = [json.loads(line) for line in content.splitlines()]
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual([bug["id"] for bug in bugs], [1, 2, 3, 4, 5])
+        self.assertEqual(bugs[0]["assignee"], "John Doe")
+
+    def test_view_unknown_format(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.get(reverse("bugs:bug_export"), {"format": "xml"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_view_applies_list_filters(self):
+        self.client.login(username="manager@test.com", password="test")
+        _, content = self.export(format="ndjson", status="Open", order_by="-id")
+
+        ids = [json.loads(line)["id"] for line in content.splitlines()]
+
+        self.assertEqual(ids, [4, 2])
+
+    def test_view_developer_only_exports_own_bugs(self):
+        self.client.login(username="normal@test.com", password="test")
+        _, content = self.export(format="ndjson")
+
+        ids = [json.loads(line)["id"] for line in content.splitlines()]
+
+        self.assertEqual(ids, [1, 2])
+
+    def test_view_query_count_does_not_grow_with_rows(self):
+        self.client.login(username="manager@test.com", password="test")
+
+        # Session, user and a single SELECT for the bugs and their people.
+        with self.assertNumQueries(3):
+            self.export()
+
+    def test_view_gzip(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.get(
+            reverse("bugs:bug_export"), HTTP_ACCEPT_ENCODING="gzip"
+        )
+
+        content = gzip.decompress(b"".join(response.streaming_content)).decode()
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(len(content.splitlines()), 6)
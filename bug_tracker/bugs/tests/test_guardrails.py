@@ -0,0 +1,165 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from users.models import CustomUser
+
+from .. import urls
+from ..models import Bug
+from .guardrails import GuardrailMixin, load_baseline, make_bugs
+from .test_api import basic_auth
+
+
+def consume(response):
+    if response.streaming:
+        b"".join(response.streaming_content)
+
+    return response
+
+
+class BugGuardrailTest(GuardrailMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+
+        cls.user = User.objects.create_user(
+            email="normal@test.com", first_name="John", last_name="Doe", password="test"
+        )
+
+        cls.manager: CustomUser = User.objects.create_user(
+            email="manager@test.com",
+            first_name="Jane",
+            last_name="Doe",
+            password="test",
+        )
+
+        cls.manager.user_type = CustomUser.MANAGER
+        cls.manager.is_staff = True
+        cls.manager.save()
+
+        cls.bug = Bug.objects.create(
+            title="A Title",
+            severity="Minor",
+            status="Open",
+            description="This is a description",
+            bug_creator=cls.manager,
+            assignee=cls.user,
+        )
+
+    def setUp(self):
+        self.client.force_login(self.manager)
+
+    def get(self, name, *args, **params):
+        return lambda client: consume(client.get(reverse(name, args=args), params))
+
+    def all_ids(self):
+        return list(Bug.objects.values_list("id", flat=True))
+
+    def test_every_view_has_a_budget(self):
+        names = {"bugs:" + pattern.name for pattern in urls.urlpatterns}
+
+        self.assertLessEqual(names, set(load_baseline()["views"]))
+
+    def test_bug_list(self):
+        self.assertScales("bugs:bug_list", self.get("bugs:bug_list"))
+
+    def test_bug_list_filtered(self):
+        self.assertScales(
+            "bugs:bug_list",
+            self.get(
+                "bugs:bug_list", status="Open", assignee="guard", order_by="title"
+            ),
+        )
+
+    def test_bug_list_search(self):
+        self.assertScales("bugs:bug_list", self.get("bugs:bug_list", q="guardrail"))
+
+    def test_bug_list_cursor(self):
+        self.assertScales("bugs:bug_list", self.get("bugs:bug_list", cursor=""))
+
+    def test_bug_list_developer(self):
+        self.client.force_login(self.user)
+
+        self.assertScales(
+            "bugs:bug_list",
+            self.get("bugs:bug_list"),
+            grow=lambda count: make_bugs(count, assignee=self.user),
+        )
+
+    def test_bug_create(self):
+        self.assertScales("bugs:bug_create", self.get("bugs:bug_create"))
+
+    def test_bug_detail(self):
+        self.assertScales("bugs:bug_detail", self.get("bugs:bug_detail", self.bug.id))
+
+    def test_bug_update(self):
+        self.assertScales("bugs:bug_update", self.get("bugs:bug_update", self.bug.id))
+
+    def test_bug_delete(self):
+        self.assertScales("bugs:bug_delete", self.get("bugs:bug_delete", self.bug.id))
+
+    def test_bug_close(self):
+        url = reverse("bugs:bug_close", args=[self.bug.id])
+
+        self.assertScales("bugs:bug_close", self.get("bugs:bug_close", self.bug.id))
+        self.assertScales("bugs:bug_close", lambda client: client.post(url))
+
+    def test_bug_bulk_action(self):
+        url = reverse("bugs:bug_bulk_action")
+
+        self.assertScales(
+            "bugs:bug_bulk_action",
+            lambda client: client.post(
+                url, {"ids": self.all_ids(), "action": "assign", "assignee": ""}
+            ),
+        )
+
+    def test_bug_dashboard(self):
+        self.assertScales("bugs:bug_dashboard", self.get("bugs:bug_dashboard"))
+
+    def test_bug_list_cache_stats(self):
+        self.assertScales(
+            "bugs:bug_list_cache_stats", self.get("bugs:bug_list_cache_stats")
+        )
+
+    def test_metrics(self):
+        self.assertScales("bugs:metrics", self.get("bugs:metrics"))
+
+    def test_bug_search(self):
+        self.assertScales("bugs:bug_search", self.get("bugs:bug_search", q="guardrail"))
+
+    def test_bug_export(self):
+        self.assertScales("bugs:bug_export", self.get("bugs:bug_export"))
+        self.assertScales(
+            "bugs:bug_export", self.get("bugs:bug_export", format="ndjson")
+        )
+
+    def test_api_bug_list(self):
+        self.assertScales("bugs:api_bug_list", self.get("bugs:api_bug_list"))
+
+    def test_api_bug_detail(self):
+        self.assertScales(
+            "bugs:api_bug_detail", self.get("bugs:api_bug_detail", self.bug.id)
+        )
+
+    def test_api_bug_close(self):
+        url = reverse("bugs:api_bug_close", args=[self.bug.id])
+
+        self.assertScales(
+            "bugs:api_bug_close",
+            lambda client: client.post(url, **basic_auth("manager@test.com")),
+        )
+
+    def test_api_bug_bulk(self):
+        url = reverse("bugs:api_bug_bulk")
+
+        self.assertScales(
+            "bugs:api_bug_bulk",
+            lambda client: client.post(
+                url,
+                json.dumps([{"id": id, "severity": "Major"} for id in self.all_ids()]),
+                content_type="application/json",
+                **basic_auth("manager@test.com"),
+            ),
+        )
@@ -122,3 +122,29 @@ class BugModelTest(TestCase):
         bug = Bug.objects.get(pk=1)
 
         self.assertEqual(str(bug), "A Title")
+
+    def test_bug_list_indexes(self):
+        index_names = {index.name for index in Bug._meta.indexes}
+
+        self.assertIn("bug_assignee_status_idx", index_names)
+        self.assertIn("bug_status_severity_idx", index_names)
+
+    def test_save_updates_modified_at(self):
+        bug = Bug.objects.get(pk=1)
+        modified_at = bug.modified_at
+
+        bug.save(update_fields=["severity", "modified_at"])
+
+        self.assertGreater(Bug.objects.get(pk=1).modified_at, modified_at)
+
+    def test_close(self):
+        bug = Bug.objects.get(pk=1)
+        modified_at = bug.modified_at
+
+        self.assertTrue(bug.close())
+        self.assertEqual(bug.status, "Closed")
+        self.assertFalse(bug.close())
+
+        bug = Bug.objects.get(pk=1)
+        self.assertEqual(bug.status, "Closed")
+        self.assertGreater(bug.modified_at, modified_at)
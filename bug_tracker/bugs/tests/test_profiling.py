@@ -0,0 +1,107 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from users.models import CustomUser
+
+from ..models import Bug
+from ..profiling import request_metrics
+from .test_api import basic_auth
+
+
+@override_settings(REQUEST_PROFILING=True)
+class ProfilingMiddlewareTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+
+        user = User.objects.create_user(
+            email="normal@test.com", first_name="John", last_name="Doe", password="test"
+        )
+
+        manager: CustomUser = User.objects.create_user(
+            email="manager@test.com",
+            first_name="Jane",
+            last_name="Doe",
+            password="test",
+        )
+
+        manager.user_type = CustomUser.MANAGER
+        manager.is_staff = True
+        manager.save()
+
+        Bug.objects.create(
+            title="A Title",
+            severity="Minor",
+            status="Open",
+            description="This is a description",
+            bug_creator=manager,
+            assignee=user,
+        )
+
+    def setUp(self):
+        request_metrics.reset()
+
+    def test_server_timing_header(self):
+        self.client.login(username="manager@test.com", password="test")
+
+        with self.assertNumQueries(5):
+            response = self.client.get(reverse("bugs:bug_list"))
+
+        timings = dict(
+            part.strip().split(";", 1) for part in response["Server-Timing"].split(",")
+        )
+
+        self.assertEqual(set(timings), {"sql", "tpl", "total"})
+        self.assertIn('desc="5 queries"', timings["sql"])
+        self.assertNotEqual(timings["tpl"], "dur=0.0")
+
+    @override_settings(REQUEST_PROFILING=False)
+    def test_disabled(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.get(reverse("bugs:bug_list"))
+
+        self.assertNotIn("Server-Timing", response)
+
+    def test_metrics(self):
+        self.client.login(username="manager@test.com", password="test")
+        self.client.get(reverse("bugs:bug_list"))
+        self.client.get(reverse("bugs:bug_list"))
+        self.client.get("/does-not-exist/")
+
+        response = self.client.get(reverse("bugs:metrics"))
+        content = response.content.decode()
+
+        self.assertEqual(response["Content-Type"], "text/plain; version=0.0.4")
+        self.assertIn(
+            'bug_tracker_request_duration_seconds_count{view="bugs:bug_list"} 2',
+            content,
+        )
+        self.assertIn(
+            'bug_tracker_request_sql_queries_bucket{view="bugs:bug_list",le="10"} 2',
+            content,
+        )
+        self.assertIn(
+            'bug_tracker_request_sql_queries_count{view="unresolved"} 1', content
+        )
+        self.assertIn(
+            "# TYPE bug_tracker_request_template_duration_seconds histogram", content
+        )
+
+    def test_metrics_basic_auth(self):
+        response = self.client.get(
+            reverse("bugs:metrics"), **basic_auth("manager@test.com")
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_metrics_not_authenticated(self):
+        response = self.client.get(reverse("bugs:metrics"))
+
+        self.assertEqual(response.status_code, 401)
+        self.assertIn("Basic", response["WWW-Authenticate"])
+
+    def test_metrics_staff_only(self):
+        self.client.login(username="normal@test.com", password="test")
+        response = self.client.get(reverse("bugs:metrics"))
+
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,100 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import router
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import resolve, reverse
+
+from .. import export
+from ..models import Bug
+from ..routers import PIN_COOKIE, ReplicaMiddleware, ReplicaRouter, current_request
+from ..views import export_view
+
+
+@override_settings(DATABASE_REPLICAS=["replica1"])
+class ReplicaRoutingTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+
+        cls.user = User.objects.create_user(
+            email="normal@test.com", first_name="John", last_name="Doe", password="test"
+        )
+
+    def route(self, method, path, **cookies):
+        request = getattr(RequestFactory(), method)(path)
+        request.COOKIES.update(cookies)
+        request.resolver_match = resolve(path)
+        databases = {}
+
+        def view(request):
+            databases["read"] = Bug.objects.all().db
+            databases["write"] = router.db_for_write(Bug)
+            return HttpResponse()
+
+        return databases, ReplicaMiddleware(view)(request)
+
+    def test_list_reads_from_replica(self):
+        databases, response = self.route("get", reverse("bugs:bug_list"))
+
+        self.assertEqual(databases, {"read": "replica1", "write": "default"})
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+
+    def test_replica_only_for_the_request(self):
+        self.route("get", reverse("bugs:bug_detail", args=[1]))
+
+        self.assertIsNone(current_request.get())
+        self.assertEqual(Bug.objects.all().db, "default")
+
+    def test_export_streams_from_replica(self):
+        request = RequestFactory().get(reverse("bugs:bug_export"))
+        request.user = self.user
+        request.resolver_match = resolve(request.path)
+        bug_rows = export.bug_rows
+        databases = []
+
+        def read_rows(queryset):
+            databases.append(queryset.db)
+            # The tests have no replica1 database, read the rows from default.
+            return bug_rows(queryset.using("default"))
+
+        response = ReplicaMiddleware(export_view)(request)
+
+        # The rows are only read once the response is consumed.
+        with mock.patch.object(export, "bug_rows", read_rows):
+            content = b"".join(response.streaming_content)
+
+        self.assertEqual(databases, ["replica1"])
+        self.assertTrue(content.startswith(b"id,title"))
+
+    def test_other_views_read_from_primary(self):
+        databases, _ = self.route("get", reverse("bugs:bug_update", args=[1]))
+
+        self.assertEqual(databases["read"], "default")
+
+    def test_post_pins_reads_to_primary(self):
+        databases, response = self.route("post", reverse("bugs:bug_close", args=[1]))
+
+        self.assertEqual(databases["read"], "default")
+        self.assertEqual(response.cookies[PIN_COOKIE]["max-age"], 10)
+
+        databases, _ = self.route("get", reverse("bugs:bug_list"), **{PIN_COOKIE: "1"})
+
+        self.assertEqual(databases["read"], "default")
+
+    def test_saving_replica_object_writes_to_primary(self):
+        bug = Bug(id=1)
+        bug._state.db = "replica1"
+
+        self.assertEqual(router.db_for_write(Bug, instance=bug), "default")
+
+    def test_replicas_not_migrated(self):
+        self.assertFalse(ReplicaRouter().allow_migrate("replica1", "bugs"))
+        self.assertTrue(ReplicaRouter().allow_migrate("default", "bugs"))
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_middleware_unused_without_replicas(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            ReplicaMiddleware(lambda request: HttpResponse())
@@ -0,0 +1,148 @@
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from ..models import Bug
+from ..slow_queries import SlowQueryLogger, install, normalize_sql
+
+
+class SlowQueryLoggerTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+
+        user = User.objects.create_user(
+            email="normal@test.com", first_name="John", last_name="Doe", password="test"
+        )
+
+        Bug.objects.create(
+            title="A Title",
+            severity="Minor",
+            status="Open",
+            description="This is a description",
+            bug_creator=user,
+            assignee=user,
+        )
+
+    @contextmanager
+    def slow_query_log(self, threshold_ms=0.000001):
+        # Swap in a fresh logger so the one installed on the test connection
+        # doesn't log every query twice.
+        with override_settings(SLOW_QUERY_THRESHOLD_MS=threshold_ms), mock.patch.object(
+            connection, "execute_wrappers", [SlowQueryLogger(connection)]
+        ), self.assertLogs("bugs.slow_queries", "WARNING") as logs:
+            yield logs
+
+    def logged(self, logs):
+        return [json.loads(record.getMessage()) for record in logs.records]
+
+    def test_normalize_sql(self):
+        self.assertEqual(
+            normalize_sql(
+                "SELECT  *\n FROM t WHERE id IN (%s, %s, %s) AND n = 'x' LIMIT 21"
+            ),
+            "SELECT * FROM t WHERE id IN (...) AND n = ? LIMIT ?",
+        )
+
+    def test_logs_query_with_plan(self):
+        with self.slow_query_log() as logs:
+            list(Bug.objects.filter(status="Open"))
+
+        entry = self.logged(logs)[0]
+
+        self.assertIn('FROM "bugs_bug"', entry["sql"])
+        self.assertIn("bugs_bug", entry["explain"])
+        self.assertEqual(entry["database"], "default")
+        self.assertIsNone(entry["view"])
+
+    def test_same_shape_same_fingerprint(self):
+        with self.slow_query_log() as logs:
+            list(Bug.objects.filter(id__in=[1]))
+            list(Bug.objects.filter(id__in=[1, 2, 3]))
+
+        first, second = self.logged(logs)
+
+        self.assertEqual(first["fingerprint"], second["fingerprint"])
+        self.assertNotEqual(first["params_fingerprint"], second["params_fingerprint"])
+
+    def test_records_view(self):
+        self.client.login(username="normal@test.com", password="test")
+
+        with self.slow_query_log() as logs:
+            self.client.get(reverse("bugs:bug_list"))
+
+        views = {
+            entry["view"] for entry in self.logged(logs) if "bugs_bug" in entry["sql"]
+        }
+
+        self.assertEqual(views, {"bugs:bug_list"})
+
+    def test_fast_queries_not_logged(self):
+        with self.assertRaises(AssertionError):
+            with self.slow_query_log(threshold_ms=10000):
+                list(Bug.objects.all())
+
+    def test_install_once_per_connection(self):
+        with mock.patch.object(connection, "execute_wrappers", []):
+            install(connection)
+            install(connection)
+
+            self.assertEqual(len(connection.execute_wrappers), 1)
+
+
+class SlowQueriesCommandTest(TestCase):
+    def entry(self, fingerprint, duration_ms, view="bugs:bug_list"):
+        return json.dumps(
+            {
+                "time": "2024-01-01T00:00:00+00:00",
+                "database": "default",
+                "duration_ms": duration_ms,
+                "fingerprint": fingerprint,
+                "params_fingerprint": str(duration_ms),
+                "view": view,
+                "sql": "SELECT {}".format(fingerprint),
+                "explain": "SCAN {}".format(fingerprint),
+            }
+        )
+
+    def test_command_summarizes_log_and_backups(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "slow.log")
+
+        with open(path + ".1", "w") as file:
+            file.write(self.entry("aaa", 300) + "\n")
+
+        with open(path, "w") as file:
+            file.write(self.entry("aaa", 500) + "\n")
+            file.write(self.entry("bbb", 700, view="bugs:bug_detail") + "\n")
+
+        out = StringIO()
+        call_command("slow_queries", "--file", path, "--explain", stdout=out)
+        output = out.getvalue()
+
+        self.assertLess(output.index("aaa  2 queries"), output.index("bbb  1 queries"))
+        self.assertIn("total 800.0ms", output)
+        self.assertIn("SCAN bbb", output)
+
+        out = StringIO()
+        call_command(
+            "slow_queries", "--file", path, "--view", "bugs:bug_detail", stdout=out
+        )
+
+        self.assertNotIn("aaa", out.getvalue())
+
+    def test_command_empty_log(self):
+        out = StringIO()
+        call_command("slow_queries", "--file", "/nonexistent/slow.log", stdout=out)
+
+        self.assertIn("No slow queries", out.getvalue())
@@ -0,0 +1,49 @@
+from unittest import mock, skipUnless
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+
+from ..sqlite import begin_immediate, configure
+
+
+@skipUnless(connection.vendor == "sqlite", "SQLite specific")
+class SQLiteTuningTest(TestCase):
+    def pragma(self, name):
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA {}".format(name))
+            return cursor.fetchone()[0]
+
+    def test_connection_is_tuned(self):
+        self.assertEqual(self.pragma("synchronous"), 1)
+        self.assertEqual(self.pragma("busy_timeout"), 5000)
+        self.assertIn(begin_immediate, connection.execute_wrappers)
+
+    def test_configure_replaces_profile(self):
+        with mock.patch.object(connection, "execute_wrappers", []):
+            configure(connection, {"busy_timeout": 1000}, immediate=True)
+            configure(connection, {"busy_timeout": 1000}, immediate=True)
+
+            self.assertEqual(connection.execute_wrappers, [begin_immediate])
+            self.assertEqual(self.pragma("busy_timeout"), 1000)
+
+            configure(connection, {"busy_timeout": 5000}, immediate=False)
+
+            self.assertEqual(connection.execute_wrappers, [])
+
+    def test_bench_concurrency_needs_database_file(self):
+        with self.assertRaises(CommandError):
+            call_command("bench_concurrency")
+
+
+class BeginImmediateTest(SimpleTestCase):
+    def test_begin_takes_write_lock(self):
+        execute = mock.Mock()
+
+        begin_immediate(execute, "BEGIN", None, False, {})
+        begin_immediate(execute, "SELECT 1", None, False, {})
+
+        self.assertEqual(
+            [call.args[0] for call in execute.call_args_list],
+            ["BEGIN IMMEDIATE", "SELECT 1"],
+        )
@@ -0,0 +1,200 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Count
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from users.models import CustomUser
+
+from ..models import Bug, BugStats
+
+
+class BugStatsTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+
+        cls.user = User.objects.create_user(
+            email="normal@test.com", first_name="John", last_name="Doe", password="test"
+        )
+
+        cls.manager: CustomUser = User.objects.create_user(
+            email="manager@test.com",
+            first_name="Jane",
+            last_name="Doe",
+            password="test",
+        )
+
+        cls.manager.user_type = CustomUser.MANAGER
+        cls.manager.save()
+
+        for i, (severity, assignee) in enumerate(
+            [("Minor", cls.user), ("Minor", cls.user), ("Major", None)]
+        ):
+            Bug.objects.create(
+                title="Title {}".format(i),
+                severity=severity,
+                status="Open",
+                description="This is a description",
+                bug_creator=cls.manager,
+                assignee=assignee,
+            )
+
+    def stats(self):
+        return {
+            (severity, status, assignee): count
+            for severity, status, assignee, count in BugStats.objects.filter(
+                count__gt=0
+            ).values_list("severity", "status", "assignee_id", "count")
+        }
+
+    def assertStatsMatchBugs(self):
+        counted = {
+            (bucket["severity"], bucket["status"], bucket["assignee_id"]): bucket["n"]
+            for bucket in Bug.objects.values("severity", "status", "assignee_id")
+            .annotate(n=Count("id"))
+            .order_by()
+        }
+
+        self.assertEqual(self.stats(), counted)
+
+    def test_create(self):
+        self.assertEqual(
+            self.stats(),
+            {("Minor", "Open", self.user.id): 2, ("Major", "Open", None): 1},
+        )
+
+    def test_save(self):
+        bug = Bug.objects.get(title="Title 0")
+        bug.status = "Closed"
+        bug.save()
+
+        self.assertStatsMatchBugs()
+
+    def test_save_other_fields_skips_stats(self):
+        bug = Bug.objects.get(title="Title 0")
+        bug.title = "Renamed"
+
+        with CaptureQueriesContext(connection) as queries:
+            bug.save(update_fields=["title"])
+
+        self.assertFalse(
+            [query for query in queries if "bugs_bugstats" in query["sql"]]
+        )
+
+        self.assertStatsMatchBugs()
+
+    def test_delete(self):
+        Bug.objects.get(title="Title 0").delete()
+
+        self.assertStatsMatchBugs()
+
+    def test_queryset_delete_is_batched(self):
+        Bug.objects.filter(severity="Minor").delete()
+
+        self.assertStatsMatchBugs()
+
+    def test_close(self):
+        Bug.objects.all().close()
+        Bug.objects.all().close()
+
+        self.assertStatsMatchBugs()
+
+    def test_update(self):
+        Bug.objects.filter(severity="Minor").update(assignee=self.manager)
+        Bug.objects.filter(assignee=None).update(
+            severity="Minor", assignee_id=self.user.id
+        )
+
+        self.assertStatsMatchBugs()
+
+    def test_bulk_update(self):
+        bugs = list(Bug.objects.order_by("id"))
+        bugs[0].status = "Closed"
+        bugs[2].assignee = self.manager
+
+        Bug.objects.bulk_update(bugs, ["status", "assignee"])
+
+        self.assertStatsMatchBugs()
+
+    def test_bulk_create(self):
+        Bug.objects.bulk_create(
+            Bug(
+                title="Imported",
+                severity="Trivial",
+                status=status,
+                description="This is a description",
+                assignee=self.manager,
+            )
+            for status in ("Open", "Open", "Closed")
+        )
+
+        self.assertStatsMatchBugs()
+
+    def test_many_buckets(self):
+        # More buckets than SQLite allows terms in one expression.
+        users = CustomUser.objects.bulk_create(
+            CustomUser(
+                email="user{}@test.com".format(i), first_name="User", last_name=str(i)
+            )
+            for i in range(1001)
+        )
+
+        Bug.objects.bulk_create(
+            Bug(
+                title="Imported",
+                severity="Minor",
+                status="Open",
+                description="This is a description",
+                assignee=user,
+            )
+            for user in users
+        )
+
+        self.assertStatsMatchBugs()
+
+        Bug.objects.all().delete()
+
+        self.assertStatsMatchBugs()
+
+    def test_delete_assignee(self):
+        self.user.delete()
+
+        self.assertStatsMatchBugs()
+
+    def test_rebuild(self):
+        BugStats.objects.update(count=0)
+
+        call_command("rebuild_bug_stats", stdout=StringIO())
+
+        self.assertStatsMatchBugs()
+
+    def test_dashboard(self):
+        Bug.objects.filter(title="Title 0").close()
+        self.client.login(username="manager@test.com", password="test")
+
+        response = self.client.get(reverse("bugs:bug_dashboard"))
+
+        self.assertEqual(response.context["totals"], {"Open": 2, "Closed": 1})
+        self.assertIn(
+            ("Minor", {"Open": 1, "Closed": 1}), response.context["severities"]
+        )
+        self.assertEqual(
+            response.context["assignees"],
+            [("John Doe", {"Open": 1, "Closed": 1}), ("Unassigned", {"Open": 1})],
+        )
+
+    def test_dashboard_developer(self):
+        self.client.login(username="normal@test.com", password="test")
+
+        response = self.client.get(reverse("bugs:bug_dashboard"))
+
+        self.assertRedirects(response, reverse("bugs:bug_list"))
+
+    def test_dashboard_not_logged_in(self):
+        response = self.client.get(reverse("bugs:bug_dashboard"))
+
+        self.assertRedirects(response, "/login/?next=/dashboard/")
@@ -1,9 +1,14 @@
+from datetime import timedelta
+
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from users.models import CustomUser
 
-from ..models import Bug
+from ..models import Bug, BugStats
 
 
 class BugListViewTest(TestCase):
@@ -64,6 +69,487 @@ class BugListViewTest(TestCase):
             response, '<input type="text" name="assignee" class="form-control">'
         )
 
+    def test_view_query_count_does_not_grow_with_rows(self):
+        manager = CustomUser.objects.get(email="manager@test.com")
+        user = CustomUser.objects.get(email="normal@test.com")
+
+        self.client.login(username="manager@test.com", password="test")
+
+        Bug.objects.create(
+            title="A Title",
+            severity="Minor",
+            status="Open",
+            description="This is a description",
+            bug_creator=manager,
+            assignee=user,
+        )
+
+        with self.assertNumQueries(5):
+            self.client.get(reverse("bugs:bug_list"))
+
+        for i in range(10):
+            Bug.objects.create(
+                title="Title {}".format(i),
+                severity="Major",
+                status="Open",
+                description="This is a description",
+                bug_creator=user,
+                assignee=manager,
+            )
+
+        with self.assertNumQueries(5):
+            self.client.get(reverse("bugs:bug_list"))
+
+
+class BugListViewFilterTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+
+        user = User.objects.create_user(
+            email="normal@test.com", first_name="John", last_name="Doe", password="test"
+        )
+
+        manager: CustomUser = User.objects.create_user(
+            email="manager@test.com",
+            first_name="Jane",
+            last_name="Smith",
+            password="test",
+        )
+
+        manager.user_type = CustomUser.MANAGER
+        manager.save()
+
+        for status, assignee in (
+            ("Open", user),
+            ("Closed", user),
+            ("Open", manager),
+            ("Open", None),
+        ):
+            Bug.objects.create(
+                title="A Title",
+                severity="Minor",
+                status=status,
+                description="This is a description",
+                bug_creator=manager,
+                assignee=assignee,
+            )
+
+    def test_view_filter_status_exact(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.get(reverse("bugs:bug_list"), {"status": "Closed"})
+
+        self.assertEqual([bug.id for bug in response.context["bugs"]], [2])
+
+    def test_view_filter_unknown_status(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.get(reverse("bugs:bug_list"), {"status": "Clo"})
+
+        self.assertEqual(len(response.context["bugs"]), 0)
+
+    def test_view_filter_assignee_prefix(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.get(reverse("bugs:bug_list"), {"assignee": "john D"})
+
+        self.assertEqual([bug.id for bug in response.context["bugs"]], [1, 2])
+
+    def test_view_filter_assignee_and_status(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.get(
+            reverse("bugs:bug_list"), {"assignee": "jane", "status": "Open"}
+        )
+
+        self.assertEqual([bug.id for bug in response.context["bugs"]], [3])
+
+    def test_view_filter_unknown_assignee(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.get(reverse("bugs:bug_list"), {"assignee": "nobody"})
+
+        self.assertEqual(len(response.context["bugs"]), 0)
+
+
+@override_settings(BUG_LIST_PAGINATION="cursor")
+class BugListViewCursorPaginationTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+
+        manager: CustomUser = User.objects.create_user(
+            email="manager@test.com",
+            first_name="Jane",
+            last_name="Doe",
+            password="test",
+        )
+
+        manager.user_type = CustomUser.MANAGER
+        manager.save()
+
+        for i in range(20):
+            Bug.objects.create(
+                title="Title {:02d}".format(i % 10),
+                severity="Minor",
+                status="Open",
+                description="This is a description",
+                bug_creator=manager,
+                assignee=manager,
+            )
+
+    def test_view_first_page(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.get(reverse("bugs:bug_list"))
+
+        page = response.context["page_obj"]
+
+        self.assertEqual([bug.id for bug in page], list(range(1, 16)))
+        self.assertTrue(page.has_next())
+        self.assertFalse(page.has_previous())
+
+    def test_view_next_and_previous_cursor(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.get(reverse("bugs:bug_list"), {"order_by": "title"})
+        first_page = [bug.id for bug in response.context["page_obj"]]
+
+        next_cursor = response.context["page_obj"].next_cursor
+        response = self.client.get(
+            reverse("bugs:bug_list"), {"order_by": "title", "cursor": next_cursor}
+        )
+        page = response.context["page_obj"]
+
+        self.assertEqual(
+            [bug.title for bug in page],
+            ["Title 07", "Title 08", "Title 08", "Title 09", "Title 09"],
+        )
+        self.assertFalse(page.has_next())
+
+        response = self.client.get(
+            reverse("bugs:bug_list"),
+            {"order_by": "title", "cursor": page.previous_cursor},
+        )
+
+        self.assertEqual([bug.id for bug in response.context["page_obj"]], first_page)
+        self.assertFalse(response.context["page_obj"].has_previous())
+
+    def test_view_cursor_links_keep_filters(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.get(reverse("bugs:bug_list"), {"status": "Open"})
+
+        self.assertContains(response, "?status=Open&cursor=")
+
+    def test_view_invalid_cursor(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.get(reverse("bugs:bug_list"), {"cursor": "invalid"})
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_view_cursor_from_other_ordering(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.get(reverse("bugs:bug_list"))
+        next_cursor = response.context["page_obj"].next_cursor
+
+        response = self.client.get(
+            reverse("bugs:bug_list"), {"order_by": "title", "cursor": next_cursor}
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_view_does_not_count_rows(self):
+        self.client.login(username="manager@test.com", password="test")
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse("bugs:bug_list"))
+
+        self.assertFalse([query for query in queries if "COUNT(" in query["sql"]])
+
+    @override_settings(BUG_LIST_APPROXIMATE_COUNT=True)
+    def test_view_approximate_count(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.get(reverse("bugs:bug_list"))
+
+        self.assertEqual(response.context["page_obj"].count_display, "20")
+
+
+class BugBulkActionViewTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+
+        user = User.objects.create_user(
+            email="normal@test.com", first_name="John", last_name="Doe", password="test"
+        )
+
+        manager: CustomUser = User.objects.create_user(
+            email="manager@test.com",
+            first_name="Jane",
+            last_name="Doe",
+            password="test",
+        )
+
+        manager.user_type = CustomUser.MANAGER
+        manager.save()
+
+        for assignee in (user, user, manager):
+            Bug.objects.create(
+                title="A Title",
+                severity="Minor",
+                status="Open",
+                description="This is a description",
+                bug_creator=manager,
+                assignee=assignee,
+            )
+
+    def test_view_not_logged_in(self):
+        response = self.client.post("/bulk/", {"ids": [1], "action": "close"})
+
+        self.assertRedirects(response, "/login/?next=/bulk/")
+
+    def test_view_get_not_allowed(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.get(reverse("bugs:bug_bulk_action"))
+
+        self.assertEqual(response.status_code, 405)
+
+    def test_view_list_contains_checkboxes(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.get(reverse("bugs:bug_list"))
+
+        self.assertContains(response, '<input type="checkbox" name="ids" value="1">')
+
+    def test_queryset_close_is_single_update(self):
+        with CaptureQueriesContext(connection) as context:
+            count = Bug.objects.filter(id__in=[1, 2, 3]).close()
+
+        updates = [
+            query for query in context if query["sql"].startswith('UPDATE "bugs_bug" ')
+        ]
+
+        self.assertEqual(count, 3)
+        self.assertEqual(len(updates), 1)
+
+    def test_view_close_as_manager(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.post(
+            reverse("bugs:bug_bulk_action"), {"ids": [1, 3], "action": "close"}
+        )
+
+        self.assertRedirects(response, "/")
+        self.assertEqual(
+            list(Bug.objects.values_list("status", flat=True).order_by("id")),
+            ["Closed", "Open", "Closed"],
+        )
+
+    def test_view_close_as_developer_skips_unassigned(self):
+        self.client.login(username="normal@test.com", password="test")
+        response = self.client.post(
+            reverse("bugs:bug_bulk_action"),
+            {"ids": [1, 2, 3], "action": "close"},
+            follow=True,
+        )
+
+        self.assertContains(response, "2 bug report(s) updated")
+        self.assertEqual(Bug.objects.get(id=3).status, "Open")
+
+    def test_view_reassign(self):
+        self.client.login(username="manager@test.com", password="test")
+        self.client.post(
+            reverse("bugs:bug_bulk_action"),
+            {"ids": [1, 2], "action": "assign", "assignee": "manager@test.com"},
+        )
+
+        self.assertEqual(Bug.objects.filter(assignee_id=2).count(), 3)
+
+    def test_view_reassign_unknown_email(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.post(
+            reverse("bugs:bug_bulk_action"),
+            {"ids": [1], "action": "assign", "assignee": "nobody@test.com"},
+            follow=True,
+        )
+
+        self.assertContains(response, "No user with this email")
+        self.assertEqual(Bug.objects.get(id=1).assignee_id, 1)
+
+    def test_view_list_does_not_render_users(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.get(reverse("bugs:bug_list"))
+
+        self.assertContains(response, 'type="email" name="assignee"')
+        self.assertNotContains(response, '<option value="2"')
+
+    def test_view_unassign(self):
+        self.client.login(username="manager@test.com", password="test")
+        self.client.post(
+            reverse("bugs:bug_bulk_action"),
+            {"ids": [1], "action": "assign", "assignee": ""},
+        )
+
+        self.assertIsNone(Bug.objects.get(id=1).assignee)
+
+    def test_view_severity(self):
+        self.client.login(username="manager@test.com", password="test")
+        self.client.post(
+            reverse("bugs:bug_bulk_action"),
+            {"ids": [2, 3], "action": "severity", "severity": "Blocker"},
+        )
+
+        self.assertEqual(Bug.objects.filter(severity="Blocker").count(), 2)
+
+    def test_view_severity_as_developer_not_allowed(self):
+        self.client.login(username="normal@test.com", password="test")
+        response = self.client.post(
+            reverse("bugs:bug_bulk_action"),
+            {"ids": [1], "action": "severity", "severity": "Blocker"},
+            follow=True,
+        )
+
+        self.assertEqual(Bug.objects.get(id=1).severity, "Minor")
+        self.assertContains(response, "alert-danger")
+
+    def test_view_redirects_to_next(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.post(
+            reverse("bugs:bug_bulk_action"),
+            {"ids": [1], "action": "close", "next": "/?status=Open"},
+        )
+
+        self.assertRedirects(response, "/?status=Open")
+
+    def test_view_ignores_external_next(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.post(
+            reverse("bugs:bug_bulk_action"),
+            {"ids": [1], "action": "close", "next": "https://example.com/"},
+        )
+
+        self.assertRedirects(response, "/")
+
+
+class BugConditionalGetTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+
+        user = User.objects.create_user(
+            email="normal@test.com", first_name="John", last_name="Doe", password="test"
+        )
+
+        manager: CustomUser = User.objects.create_user(
+            email="manager@test.com",
+            first_name="Jane",
+            last_name="Doe",
+            password="test",
+        )
+
+        manager.user_type = CustomUser.MANAGER
+        manager.save()
+
+        Bug.objects.create(
+            title="A Title",
+            severity="Minor",
+            status="Open",
+            description="This is a description",
+            bug_creator=manager,
+            assignee=user,
+        )
+
+    def revalidate(self, url, response):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+    def test_list_not_modified(self):
+        self.client.login(username="manager@test.com", password="test")
+        url = reverse("bugs:bug_list")
+        response = self.client.get(url)
+
+        self.assertIn("Last-Modified", response)
+        self.assertIn("private", response["Cache-Control"])
+
+        # Only the session, user and version lookups are left.
+        with self.assertNumQueries(3):
+            response = self.revalidate(url, response)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_list_modified_after_update(self):
+        self.client.login(username="manager@test.com", password="test")
+        url = reverse("bugs:bug_list")
+        response = self.client.get(url)
+
+        Bug.objects.filter(id=1).close()
+
+        self.assertEqual(self.revalidate(url, response).status_code, 200)
+
+    def test_list_modified_after_create(self):
+        self.client.login(username="manager@test.com", password="test")
+        url = reverse("bugs:bug_list")
+        response = self.client.get(url)
+
+        bug = Bug.objects.get(id=1)
+        bug.pk = None
+        bug.save()
+
+        self.assertEqual(self.revalidate(url, response).status_code, 200)
+
+    def test_list_modified_after_delete(self):
+        self.client.login(username="manager@test.com", password="test")
+        url = reverse("bugs:bug_list")
+        bug = Bug.objects.get(id=1)
+        bug.pk = None
+        bug.save()
+        response = self.client.get(url)
+
+        # The latest modified_at stays the same.
+        Bug.objects.filter(id=1).delete()
+
+        self.assertEqual(self.revalidate(url, response).status_code, 200)
+
+    def test_list_modified_since_after_delete(self):
+        self.client.login(username="manager@test.com", password="test")
+        url = reverse("bugs:bug_list")
+        bug = Bug.objects.get(id=1)
+        bug.pk = None
+        bug.save()
+
+        # Last-Modified has second precision, move the writes so far into the
+        # past.
+        an_hour_ago = timezone.now() - timedelta(hours=1)
+        Bug.objects.update(modified_at=an_hour_ago)
+        BugStats.objects.update(modified_at=an_hour_ago)
+
+        response = self.client.get(url)
+        Bug.objects.filter(id=1).delete()
+
+        response = self.client.get(
+            url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_list_not_shared_between_users(self):
+        self.client.login(username="manager@test.com", password="test")
+        url = reverse("bugs:bug_list")
+        response = self.client.get(url)
+
+        self.client.login(username="normal@test.com", password="test")
+
+        self.assertEqual(self.revalidate(url, response).status_code, 200)
+
+    def test_detail_not_modified(self):
+        self.client.login(username="normal@test.com", password="test")
+        url = reverse("bugs:bug_detail", args=[1])
+        response = self.client.get(url)
+
+        self.assertEqual(self.revalidate(url, response).status_code, 304)
+
+    def test_detail_modified_after_save(self):
+        self.client.login(username="normal@test.com", password="test")
+        url = reverse("bugs:bug_detail", args=[1])
+        response = self.client.get(url)
+
+        bug = Bug.objects.get(id=1)
+        bug.severity = "Major"
+        bug.save()
+
+        self.assertEqual(self.revalidate(url, response).status_code, 200)
+
 
 class BugCreateViewTest(TestCase):
     @classmethod
@@ -289,6 +775,46 @@ class BugUpdateViewTest(TestCase):
 
         self.assertContains(response, '<h1 class="card-header">Update A Title</h1>')
 
+    def test_view_post_only_writes_changed_fields(self):
+        self.client.login(username="normal@test.com", password="test")
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(
+                reverse("bugs:bug_update", args=[1]),
+                {
+                    "title": "A Title",
+                    "severity": "Major",
+                    "status": "Open",
+                    "description": "This is a description",
+                },
+            )
+
+        updates = [
+            q["sql"] for q in queries if q["sql"].startswith('UPDATE "bugs_bug"')
+        ]
+
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"severity"', updates[0])
+        self.assertNotIn('"description"', updates[0])
+        self.assertEqual(Bug.objects.get(id=1).severity, "Major")
+
+    def test_view_post_unchanged_does_not_write(self):
+        self.client.login(username="normal@test.com", password="test")
+        modified_at = Bug.objects.get(id=1).modified_at
+
+        response = self.client.post(
+            reverse("bugs:bug_update", args=[1]),
+            {
+                "title": "A Title",
+                "severity": "Minor",
+                "status": "Open",
+                "description": "This is a description",
+            },
+        )
+
+        self.assertRedirects(response, reverse("bugs:bug_list"))
+        self.assertEqual(Bug.objects.get(id=1).modified_at, modified_at)
+
 
 class BugDeleteViewTest(TestCase):
     @classmethod
@@ -442,8 +968,135 @@ class BugCloseViewTest(TestCase):
         bug = Bug.objects.get(id=1)
         self.assertEqual(bug.status, "Closed")
 
+    def test_view_post_request_is_conditional_update(self):
+        self.client.login(username="normal@test.com", password="test")
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(reverse("bugs:bug_close", args=[1]))
+
+        updates = [
+            q["sql"] for q in queries if q["sql"].startswith('UPDATE "bugs_bug"')
+        ]
+
+        self.assertEqual(len(updates), 1)
+        self.assertIn("\"status\" = 'Open'", updates[0])
+        self.assertNotIn('"title"', updates[0])
+
     def test_view_unassigned_user_redirected(self):
         self.client.login(username="unassigned@test.com", password="test")
         response = self.client.get(reverse("bugs:bug_close", args=[1]))
 
         self.assertRedirects(response, "/")
+
+
+class BugSearchViewTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+
+        user = User.objects.create_user(
+            email="normal@test.com", first_name="John", last_name="Doe", password="test"
+        )
+
+        manager: CustomUser = User.objects.create_user(
+            email="manager@test.com",
+            first_name="Jane",
+            last_name="Doe",
+            password="test",
+        )
+
+        manager.user_type = CustomUser.MANAGER
+        manager.save()
+
+        Bug.objects.create(
+            title="Login page crashes",
+            severity="Critical",
+            status="Open",
+            description="The login form throws a server error",
+            bug_creator=manager,
+            assignee=user,
+        )
+
+        Bug.objects.create(
+            title="Typo in footer",
+            severity="Trivial",
+            status="Open",
+            description="Mentions the login page by the wrong name",
+            bug_creator=manager,
+            assignee=manager,
+        )
+
+    def test_view_not_logged_in(self):
+        response = self.client.get("/search/", {"q": "login"})
+
+        self.assertRedirects(response, "/login/?next=/search/%3Fq%3Dlogin")
+
+    def test_view_missing_query(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.get(reverse("bugs:bug_search"))
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_view_results_ranked(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.get(reverse("bugs:bug_search"), {"q": "login page"})
+
+        results = response.json()["results"]
+
+        self.assertEqual([result["id"] for result in results], [1, 2])
+        self.assertGreater(results[0]["rank"], results[1]["rank"])
+
+    def test_view_results_visible_to_developer(self):
+        self.client.login(username="normal@test.com", password="test")
+        response = self.client.get(reverse("bugs:bug_search"), {"q": "login"})
+
+        self.assertEqual([result["id"] for result in response.json()["results"]], [1])
+
+    def test_view_prefix_match(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.get(reverse("bugs:bug_search"), {"q": "foot"})
+
+        self.assertEqual([result["id"] for result in response.json()["results"]], [2])
+
+    def test_index_follows_update_and_delete(self):
+        bug = Bug.objects.get(id=2)
+        bug.title = "Misspelled copyright"
+        bug.description = "Wrong year"
+        bug.save()
+
+        Bug.objects.get(id=1).delete()
+
+        self.client.login(username="manager@test.com", password="test")
+
+        response = self.client.get(reverse("bugs:bug_search"), {"q": "login"})
+        self.assertEqual(response.json()["count"], 0)
+
+        response = self.client.get(reverse("bugs:bug_search"), {"q": "copyright"})
+        self.assertEqual(response.json()["count"], 1)
+
+    def test_list_view_search(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.get(reverse("bugs:bug_list"), {"q": "crashes"})
+
+        self.assertEqual([bug.id for bug in response.context["bugs"]], [1])
+
+    def test_query_without_words(self):
+        self.client.login(username="manager@test.com", password="test")
+
+        for query in ("***", "+", "#"):
+            response = self.client.get(reverse("bugs:bug_search"), {"q": query})
+            self.assertEqual(response.json()["count"], 0)
+
+            response = self.client.get(reverse("bugs:bug_list"), {"q": query})
+            self.assertEqual(list(response.context["bugs"]), [])
+
+            response = self.client.get(reverse("bugs:bug_export"), {"q": query})
+            self.assertEqual(b"".join(response.streaming_content).count(b"\n"), 1)
+
+    def test_search_with_unknown_status(self):
+        self.client.login(username="manager@test.com", password="test")
+        response = self.client.get(
+            reverse("bugs:bug_list"), {"q": "login", "status": "Unknown"}
+        )
+
+        self.assertEqual(list(response.context["bugs"]), [])
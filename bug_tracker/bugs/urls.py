@@ -1,15 +1,35 @@
+from django.conf import settings
 from django.urls import path
 
 # Bugs app imports.
-from . import views
+from . import api, async_views, views
 
 app_name = "bugs"
 
+if settings.ASYNC_VIEWS:
+    bug_list_view = async_views.AsyncBugListView.as_view()
+    bug_detail_view = async_views.AsyncBugDetailView.as_view()
+    close_bug_view = async_views.async_close_bug_view
+else:
+    bug_list_view = views.BugListView.as_view()
+    bug_detail_view = views.BugDetailView.as_view()
+    close_bug_view = views.close_bug_view
+
 urlpatterns = [
-    path("", views.BugListView.as_view(), name="bug_list"),
+    path("", bug_list_view, name="bug_list"),
     path("create/", views.BugCreateView.as_view(), name="bug_create"),
-    path("detail/<int:id>/", views.BugDetailView.as_view(), name="bug_detail"),
+    path("detail/<int:id>/", bug_detail_view, name="bug_detail"),
     path("update/<int:id>/", views.BugUpdateView.as_view(), name="bug_update"),
     path("delete/<int:id>/", views.BugDeleteView.as_view(), name="bug_delete"),
-    path("close/<int:id>/", views.close_bug_view, name="bug_close"),
+    path("close/<int:id>/", close_bug_view, name="bug_close"),
+    path("bulk/", views.bulk_action_view, name="bug_bulk_action"),
+    path("dashboard/", views.dashboard_view, name="bug_dashboard"),
+    path("cache/stats/", views.cache_stats_view, name="bug_list_cache_stats"),
+    path("metrics/", views.metrics_view, name="metrics"),
+    path("search/", views.search_view, name="bug_search"),
+    path("export/", views.export_view, name="bug_export"),
+    path("api/bugs/", api.bug_collection, name="api_bug_list"),
+    path("api/bugs/bulk/", api.bug_bulk, name="api_bug_bulk"),
+    path("api/bugs/<int:id>/", api.bug_item, name="api_bug_detail"),
+    path("api/bugs/<int:id>/close/", api.bug_close, name="api_bug_close"),
 ]
@@ -1,10 +1,26 @@
 from django.conf import settings
+from django.contrib import messages
+from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Q
-from django.http import HttpRequest
+from django.core.paginator import Paginator
+from django.db import router
+from django.http import (
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.shortcuts import get_object_or_404, redirect, render
+from django.template.loader import render_to_string
 from django.urls import reverse
+from django.utils.decorators import method_decorator
+from django.utils.http import url_has_allowed_host_and_scheme
+from django.views.decorators.cache import cache_control
+from django.views.decorators.gzip import gzip_page
+from django.views.decorators.http import condition, require_POST
+from django.views.decorators.vary import vary_on_cookie
 from django.views.generic import (
     CreateView,
     DeleteView,
@@ -12,11 +28,29 @@ from django.views.generic import (
     ListView,
     UpdateView,
 )
-from lookup_property import L
-from users.models import CustomUser
 
-from .forms import BugFormDeveloper, BugFormManager
+from . import export, stats
+from .api import basic_auth_user
+from .cache import bug_list_cache
+from .conditional import (
+    bug_detail_etag,
+    bug_detail_last_modified,
+    bug_list_etag,
+    bug_list_last_modified,
+)
+from .filters import BugFilter
+from .forms import BugBulkActionForm, BugFormDeveloper, BugFormManager
 from .models import Bug
+from .pagination import CursorPaginator, InvalidCursor
+from .profiling import request_metrics
+
+
+def private_conditional_page(view):
+    """
+    Let browsers keep per-user copies of a page but always revalidate them
+    with the ETag and Last-Modified headers set by ``condition``.
+    """
+    return vary_on_cookie(cache_control(private=True, no_cache=True)(view))
 
 
 class BugCreateView(LoginRequiredMixin, CreateView):
@@ -47,9 +81,18 @@ class BugDetailView(LoginRequiredMixin, DetailView):
 
     login_url = settings.LOGIN_URL
 
+    @method_decorator(private_conditional_page)
+    @method_decorator(
+        condition(
+            etag_func=bug_detail_etag, last_modified_func=bug_detail_last_modified
+        )
+    )
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
     def get_object(self):
         id = self.kwargs.get("id")
-        return get_object_or_404(Bug, id=id)
+        return get_object_or_404(Bug.objects.with_people(), id=id)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -66,26 +109,118 @@ class BugListView(LoginRequiredMixin, ListView):
     context_object_name = "bugs"
 
     paginate_by = 15
+    orderings = ("id", "title", "severity", "bug_created")
 
     login_url = settings.LOGIN_URL
 
-    def get_queryset(self):
+    @method_decorator(private_conditional_page)
+    @method_decorator(
+        condition(etag_func=bug_list_etag, last_modified_func=bug_list_last_modified)
+    )
+    def get(self, request, *args, **kwargs):
+        self.cache_key = None
+        entry = None
+
+        if bug_list_cache.enabled:
+            self.cache_key = bug_list_cache.key_for(request)
+            entry = bug_list_cache.get(self.cache_key)
+
+        if entry is None:
+            return super().get(request, *args, **kwargs)
+
+        self.object_list = entry["bugs"]
+
+        return self.render_to_response(self.get_cached_context_data(entry))
+
+    def get_ordering(self):
         order_by = self.request.GET.get("order_by", "id")
-        status = self.request.GET.get("status", "")
-        assignee = self.request.GET.get("assignee", "")
 
-        query = Q(status__contains=status) & L(assignee__full_name__contains=assignee)
+        if order_by.lstrip("-") not in self.orderings:
+            return "id"
+
+        return order_by
+
+    def uses_cursor_pagination(self):
+        # Search results are ordered by rank, which has no cursor column.
+        if self.request.GET.get("q"):
+            return False
 
-        if self.request.user.user_type == CustomUser.MANAGER:
-            return self.model.objects.all().filter(query).order_by(order_by)
-        elif self.request.user.user_type == CustomUser.DEVELOPER:
-            return self.model.objects.filter(
-                Q(assignee__id=self.request.user.id) & query
-            ).order_by(order_by)
+        return settings.BUG_LIST_PAGINATION == "cursor" or "cursor" in self.request.GET
+
+    def paginate_queryset(self, queryset, page_size):
+        if not self.uses_cursor_pagination():
+            return super().paginate_queryset(queryset, page_size)
+
+        paginator = CursorPaginator(
+            queryset,
+            page_size,
+            ordering=self.get_ordering(),
+            with_count=settings.BUG_LIST_APPROXIMATE_COUNT,
+        )
+
+        try:
+            page = paginator.page(self.request.GET.get("cursor"))
+        except InvalidCursor as e:
+            raise Http404(str(e))
+
+        return (paginator, page, page.object_list, page.has_other_pages())
+
+    def get_filter(self):
+        return BugFilter(self.request.GET)
+
+    def get_queryset(self):
+        bug_filter = self.get_filter()
+        queryset = self.model.objects.for_list().visible_to(self.request.user)
+        queryset = bug_filter.apply(queryset)
+
+        if bug_filter.query and "order_by" not in self.request.GET:
+            return queryset.order_by("-rank", "id")
+
+        return queryset.order_by(self.get_ordering(), "id")
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
+        if self.request.user.is_manager:
+            context["is_manager"] = True
+
+        context["bulk_form"] = self.get_bulk_form()
+
+        query = self.request.GET.copy()
+        query.pop("page", None)
+        query.pop("cursor", None)
+        context["pagination_query"] = query.urlencode()
+
+        context["bug_table"] = render_to_string(
+            "bugs/components/table.html", context, self.request
+        )
+        context["pagination_html"] = render_to_string(
+            "components/pagination.html", context, self.request
+        )
+
+        if self.cache_key is not None:
+            bug_list_cache.set(
+                self.cache_key,
+                {
+                    "bugs": list(context["bugs"]),
+                    "bug_table": context["bug_table"],
+                    "pagination_html": context["pagination_html"],
+                },
+            )
+
+        return context
+
+    def get_bulk_form(self):
+        return BugBulkActionForm(user=self.request.user)
+
+    def get_cached_context_data(self, entry):
+        context = {
+            "view": self,
+            "bugs": entry["bugs"],
+            "bug_table": entry["bug_table"],
+            "pagination_html": entry["pagination_html"],
+        }
+
         if self.request.user.is_manager:
             context["is_manager"] = True
 
@@ -107,7 +242,7 @@ class BugUpdateView(LoginRequiredMixin, UpdateView):
 
     def get_object(self):
         id = self.kwargs.get("id")
-        return get_object_or_404(Bug, id=id)
+        return get_object_or_404(Bug.objects.with_people(), id=id)
 
     def get_success_url(self):
         return reverse("bugs:bug_list")
@@ -128,7 +263,7 @@ class BugDeleteView(LoginRequiredMixin, DeleteView):
 
     def get_object(self):
         id = self.kwargs.get("id")
-        return get_object_or_404(Bug, id=id)
+        return get_object_or_404(Bug.objects.with_people(), id=id)
 
     def get_success_url(self):
         return reverse("bugs:bug_list")
@@ -136,17 +271,125 @@ class BugDeleteView(LoginRequiredMixin, DeleteView):
 
 @login_required(login_url=settings.LOGIN_URL)
 def close_bug_view(request: HttpRequest, id):
-    bug = get_object_or_404(Bug, id=id)
+    bug = get_object_or_404(Bug.objects.with_people(), id=id)
 
-    if request.user != bug.assignee and not request.user.is_manager:
+    if request.user.id != bug.assignee_id and not request.user.is_manager:
         return redirect("bugs:bug_list")
 
     if request.method == "GET":
         return render(request, "bugs/close.html", {"bug": bug})
 
     if request.method == "POST":
-        if bug.status == "Open":
-            bug.status = "Closed"
-            bug.save()
+        bug.close()
+
+        return redirect("bugs:bug_list")
+
 
+@login_required(login_url=settings.LOGIN_URL)
+def dashboard_view(request: HttpRequest):
+    if not request.user.is_manager:
         return redirect("bugs:bug_list")
+
+    return render(request, "bugs/dashboard.html", stats.dashboard())
+
+
+@login_required(login_url=settings.LOGIN_URL)
+@require_POST
+def bulk_action_view(request: HttpRequest):
+    form = BugBulkActionForm(request.POST, user=request.user)
+
+    if form.is_valid():
+        count = form.save()
+        messages.success(request, "{} bug report(s) updated".format(count))
+    else:
+        for errors in form.errors.values():
+            messages.error(request, " ".join(errors))
+
+    next_url = request.POST.get("next", "")
+
+    if url_has_allowed_host_and_scheme(next_url, allowed_hosts={request.get_host()}):
+        return redirect(next_url)
+
+    return redirect("bugs:bug_list")
+
+
+@login_required(login_url=settings.LOGIN_URL)
+@gzip_page
+def export_view(request: HttpRequest):
+    format = request.GET.get("format", "csv")
+
+    if format not in export.FORMATS:
+        return JsonResponse({"error": "Unsupported format"}, status=400)
+
+    # Same filters, search and ordering as the list the export was started from.
+    list_view = BugListView()
+    list_view.setup(request)
+
+    # The rows are read while the response streams, after ReplicaMiddleware
+    # has returned, so choose the database while the request is still routed.
+    queryset = list_view.get_queryset().using(router.db_for_read(Bug))
+
+    stream, content_type = export.FORMATS[format]
+    response = StreamingHttpResponse(stream(queryset), content_type=content_type)
+    response["Content-Disposition"] = 'attachment; filename="bugs.{}"'.format(format)
+
+    return response
+
+
+@staff_member_required
+def cache_stats_view(request: HttpRequest):
+    return JsonResponse(bug_list_cache.stats())
+
+
+def metrics_view(request: HttpRequest):
+    # Prometheus scrapes with basic auth, people browse with their session.
+    user = request.user if request.user.is_authenticated else basic_auth_user(request)
+
+    if user is None:
+        response = HttpResponse("Authentication required", status=401)
+        response["WWW-Authenticate"] = 'Basic realm="metrics"'
+
+        return response
+
+    if not user.is_staff:
+        return HttpResponse("Staff only", status=403)
+
+    return HttpResponse(
+        request_metrics.render(), content_type="text/plain; version=0.0.4"
+    )
+
+
+@login_required(login_url=settings.LOGIN_URL)
+def search_view(request: HttpRequest):
+    bug_filter = BugFilter(request.GET)
+
+    if not bug_filter.query:
+        return JsonResponse({"error": "Missing search query"}, status=400)
+
+    queryset = Bug.objects.only("id", "title", "status", "severity").visible_to(
+        request.user
+    )
+    queryset = bug_filter.apply(queryset).order_by("-rank", "id")
+
+    paginator = Paginator(queryset, BugListView.paginate_by)
+    page = paginator.get_page(request.GET.get("page"))
+
+    return JsonResponse(
+        {
+            "query": bug_filter.query,
+            "page": page.number,
+            "num_pages": paginator.num_pages,
+            "count": paginator.count,
+            "results": [
+                {
+                    "id": bug.id,
+                    "title": bug.title,
+                    "status": bug.status,
+                    "severity": bug.severity,
+                    "rank": bug.rank,
+                    "url": reverse("bugs:bug_detail", args=[bug.id]),
+                }
+                for bug in page
+            ],
+        }
+    )
@@ -0,0 +1,50 @@
+"""
+Gunicorn settings for serving bug_tracker.wsgi in production, read from the
+working directory by ``gunicorn bug_tracker.wsgi``.
+
+Send HUP to the master for a graceful restart of the workers. Because the app
+is preloaded, new code needs a new master: send USR2, then QUIT to the old
+master once the new one serves requests.
+"""
+
+import multiprocessing
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+
+# The usual (2 x cores) + 1 sync workers, waiting on the database overlaps with
+# another worker's Python code. bug_tracker.asgi can be served by setting
+# GUNICORN_WORKER_CLASS to uvicorn.workers.UvicornWorker.
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "sync")
+
+# Import Django once in the master, workers share its memory copy-on-write.
+preload_app = True
+
+# Workers stuck on a request for longer are killed and replaced, on restarts
+# workers get graceful_timeout seconds to finish their requests.
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = 30
+keepalive = 5
+
+# Replace workers now and then so a slow leak can't grow forever, the jitter
+# keeps them from all restarting at once.
+max_requests = 1000
+max_requests_jitter = 100
+
+accesslog = "-"
+forwarded_allow_ips = os.getenv("GUNICORN_FORWARDED_ALLOW_IPS", "127.0.0.1")
+
+
+def post_fork(server, worker):
+    # A connection opened while preloading must not be shared by workers.
+    from django.db import connections
+
+    connections.close_all()
+
+
+def worker_exit(server, worker):
+    # Logins are written in batches, don't lose the last ones.
+    from users.last_login import last_login_recorder
+
+    last_login_recorder.flush()
@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "users"
+
+    def ready(self):
+        from django.contrib.auth.signals import user_logged_in
+
+        from . import signals  # noqa: F401
+
+        # django.contrib.auth connects it in its ready(), which runs first. It
+        # saves the user on every login, signals.record_last_login batches it.
+        user_logged_in.disconnect(dispatch_uid="update_last_login")
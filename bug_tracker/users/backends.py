@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import caches
+
+
+def user_cache_key(user_id):
+    return "users:user:{}".format(user_id)
+
+
+class CachedModelBackend(ModelBackend):
+    """
+    ``ModelBackend`` keeping the users it loads for sessions in the
+    ``AUTH_CACHE_ALIAS`` cache, so authenticated requests don't query them.
+
+    Saving or deleting a user drops its copy. With a per-process cache other
+    processes may keep theirs until ``AUTH_USER_CACHE_TIMEOUT`` runs out,
+    0 disables the cache.
+    """
+
+    def get_user(self, user_id):
+        timeout = settings.AUTH_USER_CACHE_TIMEOUT
+
+        if timeout <= 0:
+            return super().get_user(user_id)
+
+        cache = caches[settings.AUTH_CACHE_ALIAS]
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+
+        if user is None:
+            user = super().get_user(user_id)
+
+            if user is not None:
+                cache.set(key, user, timeout=timeout)
+
+        return user
+
+
+def forget_user(user_id):
+    caches[settings.AUTH_CACHE_ALIAS].delete(user_cache_key(user_id))
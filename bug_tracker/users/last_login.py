@@ -0,0 +1,77 @@
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+
+BATCH_SIZE = 500
+
+
+class LastLoginRecorder:
+    """
+    Record login times in memory and write them with one bulk UPDATE every
+    ``LAST_LOGIN_FLUSH_SECONDS``, or once ``BATCH_SIZE`` users logged in.
+
+    The check runs on every login and at the end of every request, see
+    users.signals. Pending logins are also written when a gunicorn worker
+    exits and on ASGI lifespan shutdown, a worker that gets no requests at all
+    keeps them until then. A user logging in again within
+    ``LAST_LOGIN_THROTTLE_SECONDS`` isn't recorded, so last_login can lag
+    behind by that much.
+    """
+
+    def __init__(self):
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.flushed_at = time.monotonic()
+
+    def record(self, user, when=None):
+        throttle = settings.LAST_LOGIN_THROTTLE_SECONDS
+
+        if throttle > 0 and not caches[settings.AUTH_CACHE_ALIAS].add(
+            "users:last_login:{}".format(user.pk), True, timeout=throttle
+        ):
+            return
+
+        when = when or timezone.now()
+        user.last_login = when
+
+        with self.lock:
+            self.pending[user.pk] = max(when, self.pending.get(user.pk, when))
+
+        self.flush_if_due()
+
+    def flush_if_due(self):
+        with self.lock:
+            due = bool(self.pending) and (
+                len(self.pending) >= BATCH_SIZE
+                or time.monotonic() - self.flushed_at
+                >= settings.LAST_LOGIN_FLUSH_SECONDS
+            )
+
+        if due:
+            self.flush()
+
+    def flush(self):
+        from .models import CustomUser
+
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            self.flushed_at = time.monotonic()
+
+        if not pending:
+            return 0
+
+        # bulk_update() makes it a single UPDATE ... CASE query, which sends
+        # no post_save, so cached users and bug list pages stay valid.
+        CustomUser.objects.bulk_update(
+            [CustomUser(pk=pk, last_login=when) for pk, when in pending.items()],
+            ["last_login"],
+            batch_size=BATCH_SIZE,
+        )
+
+        return len(pending)
+
+
+last_login_recorder = LastLoginRecorder()
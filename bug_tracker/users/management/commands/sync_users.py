@@ -0,0 +1,367 @@
+import base64
+import copy
+import csv
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.contrib.auth.hashers import get_hasher, make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from ...models import CustomUser
+from ...signals import users_changed
+
+SYNCED_FIELDS = ("first_name", "last_name", "user_type", "is_active")
+# "M", "Manager", "manager" and so on.
+USER_TYPES = {
+    key.casefold(): value
+    for value, label in CustomUser.USER_TYPES
+    for key in (value, label)
+}
+LDIF_ATTRIBUTES = {
+    "mail": "email",
+    "givenname": "first_name",
+    "sn": "last_name",
+    "employeetype": "user_type",
+    "userpassword": "password",
+}
+FALSE_VALUES = {"0", "false", "no", "n"}
+
+
+class InvalidRecord(Exception):
+    pass
+
+
+def read_csv(file):
+    yield from csv.DictReader(file)
+
+
+def read_ldif(file):
+    """
+    Yield the entries of an LDIF file as dicts of the attributes in
+    ``LDIF_ATTRIBUTES``, renamed to user fields.
+    """
+    lines = []
+
+    for line in file:
+        line = line.rstrip("\r\n")
+
+        if line.startswith(" ") and lines:
+            lines[-1] += line[1:]
+        elif line and not line.startswith("#"):
+            lines.append(line)
+        elif not line and lines:
+            yield parse_ldif_entry(lines)
+            lines = []
+
+    if lines:
+        yield parse_ldif_entry(lines)
+
+
+def parse_ldif_entry(lines):
+    record = {}
+
+    for line in lines:
+        name, _, value = line.partition(":")
+
+        if value.startswith(":"):
+            value = base64.b64decode(value[1:].strip()).decode()
+        else:
+            value = value.strip()
+
+        field = LDIF_ATTRIBUTES.get(name.strip().casefold())
+
+        if field is not None:
+            record.setdefault(field, value)
+
+    # Hashed LDAP passwords such as {SSHA}... can't be converted.
+    if record.get("password", "").startswith("{"):
+        del record["password"]
+
+    return record
+
+
+READERS = {"csv": read_csv, "ldif": read_ldif}
+
+
+def hash_passwords(passwords, hasher, jobs):
+    """
+    Hash ``passwords`` with ``hasher``, in ``jobs`` forked processes when
+    there are enough of them to be worth it.
+    """
+    if jobs <= 1 or len(passwords) < jobs:
+        return [make_password(password, hasher=hasher) for password in passwords]
+
+    # The workers only hash, they never use the inherited connections.
+    context = multiprocessing.get_context("fork")
+
+    with ProcessPoolExecutor(jobs, mp_context=context) as executor:
+        return list(
+            executor.map(
+                make_password,
+                passwords,
+                [None] * len(passwords),
+                [hasher] * len(passwords),
+                chunksize=max(len(passwords) // (jobs * 4), 1),
+            )
+        )
+
+
+class Command(BaseCommand):
+    help = (
+        "Create and update users from a CSV or LDIF directory export. Records "
+        "have an email, first and last name and optionally a user type, active "
+        "flag and password. Only new and changed users are written, passwords "
+        "are only set for new users."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to read, - reads standard input.")
+        parser.add_argument(
+            "--format",
+            choices=sorted(READERS),
+            help="Input format, guessed from the file extension by default.",
+        )
+        parser.add_argument(
+            "--sso",
+            action="store_true",
+            help="Give new users an unusable password, they sign in with SSO.",
+        )
+        parser.add_argument(
+            "--deactivate-missing",
+            action="store_true",
+            help="Deactivate users not in the file, staff users are kept.",
+        )
+        parser.add_argument(
+            "--jobs",
+            type=int,
+            default=os.cpu_count(),
+            help="Processes hashing passwords, the CPU count by default.",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            help=(
+                "Hash passwords with this many iterations instead of the "
+                "hasher's default. Django rehashes them with the default at "
+                "the user's first login."
+            ),
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Users written per INSERT or UPDATE.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what would change without writing it.",
+        )
+        parser.add_argument(
+            "--database",
+            default="default",
+            help="Database to sync.",
+        )
+
+    def handle(self, *args, **options):
+        format = options["format"] or options["path"].rpartition(".")[2]
+
+        if format not in READERS:
+            raise CommandError("Unknown format {}, use --format".format(format))
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1")
+
+        self.hasher = self.get_hasher(options["iterations"])
+
+        if options["path"] == "-":
+            records = list(READERS[format](sys.stdin))
+        else:
+            with open(options["path"], newline="", encoding="utf-8") as file:
+                records = list(READERS[format](file))
+
+        started = time.perf_counter()
+        records = self.clean(records)
+
+        existing = {
+            user.email: user
+            for user in CustomUser.objects.using(options["database"]).only(
+                "id", "email", "is_staff", "search_name", *SYNCED_FIELDS
+            )
+        }
+
+        new = [record for email, record in records.items() if email not in existing]
+        changed = self.changed_users(records, existing, options["deactivate_missing"])
+        fields = sorted({field for _, changes in changed for field in changes})
+
+        if not options["dry_run"] and (new or changed):
+            users = self.build_users(new, options["sso"], options["jobs"])
+
+            with transaction.atomic(using=options["database"]):
+                CustomUser.objects.using(options["database"]).bulk_create(
+                    users, batch_size=options["batch_size"]
+                )
+
+                if changed:
+                    updated = [user for user, _ in changed]
+                    CustomUser.objects.using(options["database"]).bulk_update(
+                        updated, fields, batch_size=options["batch_size"]
+                    )
+                    # bulk_update() skips post_save.
+                    users_changed.send(
+                        sender=CustomUser,
+                        users=updated,
+                        update_fields=fields,
+                        using=options["database"],
+                    )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                "{} {} new and {} changed users of {} in {:.1f}s".format(
+                    "Would write" if options["dry_run"] else "Wrote",
+                    len(new),
+                    len(changed),
+                    len(records),
+                    time.perf_counter() - started,
+                )
+            )
+        )
+
+    def get_hasher(self, iterations):
+        hasher = get_hasher()
+
+        if iterations is None:
+            return hasher
+        if not hasattr(hasher, "iterations"):
+            raise CommandError(
+                "The {} hasher has no iterations to set".format(hasher.algorithm)
+            )
+        if iterations < 1:
+            raise CommandError("--iterations must be at least 1")
+
+        # get_hasher() returns a shared instance, change a copy.
+        hasher = copy.copy(hasher)
+        hasher.iterations = iterations
+
+        return hasher
+
+    def clean(self, records):
+        """
+        Validate ``records`` and return them by normalized email.
+        """
+        cleaned = {}
+
+        for number, record in enumerate(records):
+            try:
+                record = self.clean_record(record)
+            except InvalidRecord as e:
+                raise CommandError("Record {}: {}".format(number, e))
+
+            if record["email"] in cleaned:
+                raise CommandError(
+                    "Record {}: duplicate email {}".format(number, record["email"])
+                )
+
+            cleaned[record["email"]] = record
+
+        return cleaned
+
+    def clean_record(self, record):
+        for field in ("email", "first_name", "last_name"):
+            if not (record.get(field) or "").strip():
+                raise InvalidRecord("missing {}".format(field))
+
+        cleaned = {
+            "email": CustomUser.objects.normalize_email(record["email"].strip()),
+            "first_name": record["first_name"].strip(),
+            "last_name": record["last_name"].strip(),
+            "password": record.get("password") or None,
+        }
+
+        user_type = (record.get("user_type") or "").strip()
+
+        if user_type:
+            if user_type.casefold() not in USER_TYPES:
+                raise InvalidRecord("unknown user type {}".format(user_type))
+
+            cleaned["user_type"] = USER_TYPES[user_type.casefold()]
+
+        if (record.get("is_active") or "").strip():
+            cleaned["is_active"] = (
+                record["is_active"].strip().casefold() not in FALSE_VALUES
+            )
+
+        return cleaned
+
+    def changed_users(self, records, existing, deactivate_missing):
+        """
+        Return ``(user, changed fields)`` pairs of the existing users whose
+        record differs, with the new values set on ``user``.
+        """
+        changed = []
+
+        for email, user in existing.items():
+            record = records.get(email)
+
+            if record is None:
+                if deactivate_missing and user.is_active and not user.is_staff:
+                    record = {"is_active": False}
+                else:
+                    continue
+
+            changes = [
+                field
+                for field in SYNCED_FIELDS
+                if field in record and getattr(user, field) != record[field]
+            ]
+
+            if changes:
+                for field in changes:
+                    setattr(user, field, record[field])
+
+                # bulk_update() skips save(), which keeps search_name current.
+                if {"first_name", "last_name"} & set(changes):
+                    user.search_name = CustomUser.normalize_name(
+                        "{} {}".format(user.first_name, user.last_name)
+                    )
+                    changes.append("search_name")
+
+                changed.append((user, changes))
+
+        return changed
+
+    def build_users(self, records, sso, jobs):
+        users = []
+
+        for record in records:
+            user = CustomUser(
+                **{
+                    field: record[field]
+                    for field in ("email", *SYNCED_FIELDS)
+                    if field in record
+                }
+            )
+            user.search_name = CustomUser.normalize_name(
+                "{} {}".format(user.first_name, user.last_name)
+            )
+            users.append(user)
+
+        with_password = [
+            (user, record["password"])
+            for user, record in zip(users, records)
+            if record["password"] and not sso
+        ]
+        hashes = hash_passwords(
+            [password for _, password in with_password], self.hasher, jobs
+        )
+
+        for user in users:
+            user.set_unusable_password()
+
+        for (user, _), hash in zip(with_password, hashes):
+            user.password = hash
+
+        return users
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.11 on 2026-10-18 20:40
+
+from django.db import migrations, models
+
+
+def populate_search_name(apps, schema_editor):
+    CustomUser = apps.get_model("users", "CustomUser")
+
+    users = CustomUser.objects.only("id", "first_name", "last_name")
+    for user in users.iterator():
+        name = "{} {}".format(user.first_name, user.last_name)
+        search_name = " ".join(name.split()).casefold()
+
+        CustomUser.objects.filter(id=user.id).update(search_name=search_name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0003_customuser_is_staff"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customuser",
+            name="search_name",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=451
+            ),
+            preserve_default=False,
+        ),
+        migrations.RunPython(populate_search_name, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.11 on 2026-10-18 21:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0004_customuser_search_name"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="customuser",
+            name="last_login",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="last login"
+            ),
+        ),
+    ]
@@ -16,11 +16,13 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     email = models.EmailField("email address", unique=True)
     first_name = models.CharField(max_length=225, null=False)
     last_name = models.CharField(max_length=225, null=False)
+    search_name = models.CharField(max_length=451, db_index=True, editable=False)
     user_type = models.CharField(max_length=1, choices=USER_TYPES, default=DEVELOPER)
     account_created = models.DateTimeField(
         verbose_name="account created", auto_now_add=True
     )
-    last_login = models.DateTimeField(verbose_name="last login", auto_now=True)
+    # Written in batches by users.last_login, null until the first login.
+    last_login = models.DateTimeField(verbose_name="last login", blank=True, null=True)
     is_staff = models.BooleanField(default=False)
     is_active = models.BooleanField(default=True)
 
@@ -32,6 +34,23 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     def __str__(self):
         return "{} {}".format(self.first_name, self.last_name)
 
+    def save(self, *args, **kwargs):
+        self.search_name = self.normalize_name(
+            "{} {}".format(self.first_name, self.last_name)
+        )
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and (
+            "first_name" in update_fields or "last_name" in update_fields
+        ):
+            kwargs["update_fields"] = {*update_fields, "search_name"}
+
+        super().save(*args, **kwargs)
+
+    @staticmethod
+    def normalize_name(name):
+        return " ".join(name.split()).casefold()
+
     @lookup_property
     def full_name():  # type: ignore
         return Concat("first_name", Value(" "), "last_name")
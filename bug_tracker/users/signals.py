@@ -0,0 +1,36 @@
+from django.conf import settings
+from django.contrib.auth.signals import user_logged_in
+from django.core.signals import request_finished
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from .backends import forget_user
+from .last_login import last_login_recorder
+
+# Sent after bulk updates of users, which don't send post_save, with the
+# updated users and update_fields.
+users_changed = Signal()
+
+
+# Replaces django.contrib.auth.models.update_last_login, see UsersConfig.
+@receiver(user_logged_in, dispatch_uid="record_last_login")
+def record_last_login(sender, user, **kwargs):
+    last_login_recorder.record(user)
+
+
+# Writes logins that are due even when no further login comes in.
+@receiver(request_finished, dispatch_uid="flush_last_logins")
+def flush_last_logins(sender, **kwargs):
+    last_login_recorder.flush_if_due()
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def forget_cached_user(sender, instance, **kwargs):
+    forget_user(instance.pk)
+
+
+@receiver(users_changed)
+def forget_cached_users(sender, users, **kwargs):
+    for user in users:
+        forget_user(user.pk)
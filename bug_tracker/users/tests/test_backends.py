@@ -0,0 +1,70 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from ..backends import CachedModelBackend
+from ..models import CustomUser
+
+
+@override_settings(AUTH_USER_CACHE_TIMEOUT=60)
+class CachedModelBackendTest(TestCase):
+    User = get_user_model()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user: CustomUser = cls.User.objects.create_user(
+            email="normal@test.com", first_name="John", last_name="Doe", password="test"
+        )
+
+    def setUp(self):
+        caches["auth"].clear()
+        self.backend = CachedModelBackend()
+
+    def test_get_user_is_cached(self):
+        self.assertEqual(self.backend.get_user(self.user.id), self.user)
+
+        with self.assertNumQueries(0):
+            user = self.backend.get_user(self.user.id)
+
+        self.assertEqual(user, self.user)
+        self.assertEqual(user.first_name, "John")
+
+    def test_save_forgets_user(self):
+        self.backend.get_user(self.user.id)
+
+        self.user.user_type = CustomUser.MANAGER
+        self.user.save()
+
+        self.assertTrue(self.backend.get_user(self.user.id).is_manager)
+
+    def test_delete_forgets_user(self):
+        self.backend.get_user(self.user.id)
+
+        self.user.delete()
+
+        self.assertIsNone(self.backend.get_user(self.user.id))
+
+    def test_inactive_user(self):
+        self.User.objects.filter(id=self.user.id).update(is_active=False)
+
+        self.assertIsNone(self.backend.get_user(self.user.id))
+
+    @override_settings(AUTH_USER_CACHE_TIMEOUT=0)
+    def test_disabled(self):
+        self.backend.get_user(self.user.id)
+
+        with self.assertNumQueries(1):
+            self.backend.get_user(self.user.id)
+
+    @override_settings(SESSION_ENGINE="django.contrib.sessions.backends.cache")
+    def test_no_auth_queries(self):
+        self.client.login(username="normal@test.com", password="test")
+        self.client.get(reverse("bugs:bug_list"))
+
+        # Only the version and count of the user's bugs, the session and the
+        # user come from the cache.
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("bugs:bug_list"))
+
+        self.assertEqual(response.context["user"], self.user)
@@ -0,0 +1,206 @@
+import os
+import tempfile
+from io import StringIO
+
+from django.contrib.auth.hashers import identify_hasher
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+
+from ..backends import CachedModelBackend
+from ..models import CustomUser
+
+CSV_HEADER = "email,first_name,last_name,user_type,is_active,password\n"
+
+
+class SyncUsersCommandTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(
+            email="normal@test.com", first_name="John", last_name="Doe", password="test"
+        )
+        cls.staff = CustomUser.objects.create_superuser(
+            email="admin@test.com", first_name="Ada", last_name="Admin", password="test"
+        )
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def write(self, name, content):
+        path = os.path.join(self.directory, name)
+
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+
+        return path
+
+    def sync(self, path, *args):
+        out = StringIO()
+        call_command("sync_users", path, "--jobs", "1", *args, stdout=out)
+
+        return out.getvalue()
+
+    def test_command_creates_users(self):
+        path = self.write(
+            "users.csv",
+            CSV_HEADER
+            + "jane.smith@Test.com,Jane,Smith,Manager,,secret\n"
+            + "sso@test.com,Sam,Sso,d,,\n",
+        )
+
+        out = self.sync(path)
+
+        jane = CustomUser.objects.get(email="jane.smith@test.com")
+        sso = CustomUser.objects.get(email="sso@test.com")
+
+        self.assertIn("Wrote 2 new and 0 changed users of 2", out)
+        self.assertTrue(jane.is_manager)
+        self.assertEqual(jane.search_name, "jane smith")
+        self.assertTrue(jane.check_password("secret"))
+        self.assertTrue(sso.is_developer)
+        self.assertFalse(sso.has_usable_password())
+
+    def test_command_only_writes_changed_users(self):
+        path = self.write(
+            "users.csv",
+            CSV_HEADER
+            + "normal@test.com,John,Doe,,,\n"
+            + "admin@test.com,Ada,Lovelace,,,\n",
+        )
+
+        # The user lookup, then a savepoint around the UPDATE.
+        with self.assertNumQueries(4):
+            out = self.sync(path)
+
+        self.assertIn("Wrote 0 new and 1 changed users of 2", out)
+
+        admin = CustomUser.objects.get(id=self.staff.id)
+
+        self.assertEqual(admin.search_name, "ada lovelace")
+        self.assertTrue(admin.check_password("test"))
+
+    @override_settings(AUTH_USER_CACHE_TIMEOUT=60)
+    def test_command_forgets_cached_users(self):
+        backend = CachedModelBackend()
+        backend.get_user(self.user.id)
+        path = self.write("users.csv", CSV_HEADER + "normal@test.com,Johnny,Doe,,,\n")
+
+        self.sync(path)
+
+        self.assertEqual(str(backend.get_user(self.user.id)), "Johnny Doe")
+
+    def test_command_unchanged_file_writes_nothing(self):
+        path = self.write("users.csv", CSV_HEADER + "normal@test.com,John,Doe,D,yes,\n")
+
+        with self.assertNumQueries(1):
+            out = self.sync(path)
+
+        self.assertIn("Wrote 0 new and 0 changed users of 1", out)
+
+    def test_command_deactivate_missing(self):
+        path = self.write("users.csv", CSV_HEADER + "new@test.com,New,User,,,\n")
+
+        self.sync(path, "--deactivate-missing")
+
+        self.assertFalse(CustomUser.objects.get(id=self.user.id).is_active)
+        self.assertTrue(CustomUser.objects.get(id=self.staff.id).is_active)
+
+    def test_command_dry_run(self):
+        path = self.write("users.csv", CSV_HEADER + "new@test.com,New,User,,,\n")
+
+        out = self.sync(path, "--dry-run")
+
+        self.assertIn("Would write 1 new", out)
+        self.assertFalse(CustomUser.objects.filter(email="new@test.com").exists())
+
+    def test_command_sso(self):
+        path = self.write("users.csv", CSV_HEADER + "new@test.com,New,User,,,secret\n")
+
+        self.sync(path, "--sso")
+
+        self.assertFalse(
+            CustomUser.objects.get(email="new@test.com").has_usable_password()
+        )
+
+    def test_command_iterations(self):
+        path = self.write("users.csv", CSV_HEADER + "new@test.com,New,User,,,secret\n")
+
+        self.sync(path, "--iterations", "1000")
+
+        user = CustomUser.objects.get(email="new@test.com")
+        hasher = identify_hasher(user.password)
+
+        self.assertEqual(hasher.decode(user.password)["iterations"], 1000)
+        self.assertTrue(hasher.must_update(user.password))
+        self.assertTrue(user.check_password("secret"))
+
+    def test_command_hashes_in_processes(self):
+        path = self.write(
+            "users.csv",
+            CSV_HEADER
+            + "".join(
+                "user{0}@test.com,User,{0},,,secret{0}\n".format(i) for i in range(4)
+            ),
+        )
+
+        call_command(
+            "sync_users", path, "--jobs", "2", "--iterations", "1000", stdout=StringIO()
+        )
+
+        for i in range(4):
+            user = CustomUser.objects.get(email="user{}@test.com".format(i))
+
+            self.assertTrue(user.check_password("secret{}".format(i)))
+
+    def test_command_reads_ldif(self):
+        path = self.write(
+            "users.ldif",
+            "# Exported from the directory\n"
+            "dn: uid=jsmith,ou=people,dc=test,dc=com\n"
+            "mail: jane.smith@test.com\n"
+            "givenName: Jane\n"
+            "sn: Sm\n"
+            " ith\n"
+            "employeeType: Developer\n"
+            "userPassword: {SSHA}c2VjcmV0\n"
+            "\n"
+            "dn: uid=jdoe,ou=people,dc=test,dc=com\n"
+            "mail: normal@test.com\n"
+            "givenName:: Sm9obm55\n"
+            "sn: Doe\n",
+        )
+
+        self.sync(path)
+
+        jane = CustomUser.objects.get(email="jane.smith@test.com")
+
+        self.assertEqual(str(jane), "Jane Smith")
+        self.assertFalse(jane.has_usable_password())
+        self.assertEqual(str(CustomUser.objects.get(id=self.user.id)), "Johnny Doe")
+
+    def test_command_invalid_record(self):
+        path = self.write(
+            "users.csv",
+            CSV_HEADER + "new@test.com,New,User,,,\n" + "other@test.com,,User,,,\n",
+        )
+
+        with self.assertRaisesMessage(CommandError, "Record 1: missing first_name"):
+            self.sync(path)
+
+        self.assertFalse(CustomUser.objects.filter(email="new@test.com").exists())
+
+    def test_command_unknown_user_type(self):
+        path = self.write("users.csv", CSV_HEADER + "new@test.com,New,User,Boss,,\n")
+
+        with self.assertRaisesMessage(CommandError, "unknown user type Boss"):
+            self.sync(path)
+
+    def test_command_duplicate_email(self):
+        path = self.write(
+            "users.csv",
+            CSV_HEADER + "new@test.com,New,User,,,\n" + "new@test.com,Other,User,,,\n",
+        )
+
+        with self.assertRaisesMessage(CommandError, "duplicate email new@test.com"):
+            self.sync(path)
@@ -0,0 +1,46 @@
+from bugs.tests.guardrails import GuardrailMixin, load_baseline
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from .. import urls
+
+
+class UserGuardrailTest(GuardrailMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+
+        cls.user = User.objects.create_user(
+            email="normal@test.com", first_name="John", last_name="Doe", password="test"
+        )
+
+    def test_every_view_has_a_budget(self):
+        names = {"users:" + pattern.name for pattern in urls.urlpatterns}
+
+        self.assertLessEqual(names, set(load_baseline()["views"]))
+
+    def test_login_page(self):
+        url = reverse("users:login")
+
+        self.assertScales("users:login", lambda client: client.get(url))
+
+    def test_login(self):
+        url = reverse("users:login")
+
+        def login(client):
+            client.logout()
+
+            return client.post(url, {"username": "normal@test.com", "password": "test"})
+
+        self.assertScales("users:login", login)
+
+    def test_logout(self):
+        url = reverse("users:logout")
+
+        def logout(client):
+            client.force_login(self.user)
+
+            return client.get(url)
+
+        self.assertScales("users:logout", logout)
@@ -0,0 +1,141 @@
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from bug_tracker.asgi import application
+
+from ..last_login import LastLoginRecorder, last_login_recorder
+from ..models import CustomUser
+
+
+@override_settings(LAST_LOGIN_FLUSH_SECONDS=60, LAST_LOGIN_THROTTLE_SECONDS=300)
+class LastLoginRecorderTest(TestCase):
+    User = get_user_model()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user: CustomUser = cls.User.objects.create_user(
+            email="normal@test.com", first_name="John", last_name="Doe", password="test"
+        )
+        cls.other: CustomUser = cls.User.objects.create_user(
+            email="other@test.com", first_name="Jane", last_name="Doe", password="test"
+        )
+
+    def setUp(self):
+        caches["auth"].clear()
+        self.recorder = LastLoginRecorder()
+
+    def last_login(self, user):
+        return self.User.objects.values_list("last_login", flat=True).get(id=user.id)
+
+    def test_saving_user_keeps_last_login(self):
+        self.user.first_name = "Johnny"
+        self.user.save()
+
+        self.assertIsNone(self.last_login(self.user))
+
+    def test_record_is_batched(self):
+        with self.assertNumQueries(0):
+            self.recorder.record(self.user)
+            self.recorder.record(self.other)
+
+        self.assertIsNotNone(self.user.last_login)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.recorder.flush(), 2)
+
+        self.assertEqual(self.last_login(self.user), self.user.last_login)
+        self.assertEqual(self.last_login(self.other), self.other.last_login)
+
+    def test_record_is_throttled(self):
+        now = timezone.now()
+        self.recorder.record(self.user, now)
+        self.recorder.record(self.user, now + timedelta(minutes=1))
+        self.recorder.flush()
+
+        self.assertEqual(self.last_login(self.user), now)
+
+    @override_settings(LAST_LOGIN_THROTTLE_SECONDS=0)
+    def test_record_keeps_latest_login(self):
+        now = timezone.now()
+        self.recorder.record(self.user, now + timedelta(minutes=1))
+        self.recorder.record(self.user, now)
+        self.recorder.flush()
+
+        self.assertEqual(self.last_login(self.user), now + timedelta(minutes=1))
+
+    @override_settings(LAST_LOGIN_FLUSH_SECONDS=0)
+    def test_record_flushes_when_due(self):
+        self.recorder.record(self.user)
+
+        self.assertEqual(self.last_login(self.user), self.user.last_login)
+
+    def test_flush_nothing_pending(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(self.recorder.flush(), 0)
+
+    def test_login_is_recorded(self):
+        last_login_recorder.flush()
+        self.client.force_login(self.user)
+
+        self.assertNotEqual(self.last_login(self.user), self.user.last_login)
+
+        last_login_recorder.flush()
+
+        self.assertEqual(self.last_login(self.user), self.user.last_login)
+
+    def test_login_view_does_not_write_user(self):
+        last_login_recorder.flush()
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(
+                reverse("users:login"),
+                {"username": "normal@test.com", "password": "test"},
+            )
+
+        self.assertRedirects(response, "/", fetch_redirect_response=False)
+        self.assertFalse(
+            any('UPDATE "users_customuser"' in query["sql"] for query in context)
+        )
+
+    @override_settings(LAST_LOGIN_FLUSH_SECONDS=0)
+    def test_request_flushes_when_due(self):
+        last_login_recorder.flush()
+
+        with override_settings(LAST_LOGIN_FLUSH_SECONDS=60):
+            last_login_recorder.record(self.user)
+
+        self.client.get(reverse("users:login"))
+
+        self.assertEqual(self.last_login(self.user), self.user.last_login)
+
+    async def test_asgi_shutdown_flushes(self):
+        await sync_to_async(last_login_recorder.flush)()
+        last_login_recorder.record(self.user)
+        messages = iter([{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+        sent = []
+
+        async def receive():
+            return next(messages)
+
+        async def send(message):
+            sent.append(message["type"])
+
+        await application({"type": "lifespan"}, receive, send)
+
+        self.assertEqual(
+            sent, ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+        )
+        self.assertEqual(
+            await self.User.objects.values_list("last_login", flat=True).aget(
+                id=self.user.id
+            ),
+            self.user.last_login,
+        )
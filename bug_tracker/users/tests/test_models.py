@@ -27,3 +27,17 @@ class CustomUserTests(TestCase):
         user: CustomUser = self.User.objects.get(pk=1)
 
         self.assertFalse(user.is_manager)
+
+    def test_custom_user_search_name(self):
+        user: CustomUser = self.User.objects.get(pk=1)
+
+        self.assertEqual(user.search_name, "john doe")
+
+    def test_custom_user_search_name_follows_rename(self):
+        user: CustomUser = self.User.objects.get(pk=1)
+        user.first_name = "  Johnny "
+        user.save(update_fields=["first_name"])
+
+        user.refresh_from_db()
+
+        self.assertEqual(user.search_name, "johnny doe")